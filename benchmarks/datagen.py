@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+
+def category_probabilities(cardinality, skew=1.0):
+    """Zipf-like category frequencies: p_k ∝ 1 / k^skew (skew=0 gives uniform categories)."""
+    weights = 1.0 / np.arange(1, cardinality + 1) ** skew
+    return weights / weights.sum()
+
+
+def make_categorical(rng, rows, cardinality, skew=1.0, prefix='c'):
+    """Categorical column of string labels with Zipf-skewed frequencies."""
+    labels = np.array([f'{prefix}{i}' for i in range(cardinality)], dtype=object)
+    return labels[rng.choice(cardinality, size=rows, p=category_probabilities(cardinality, skew))]
+
+
+def make_numeric(rng, rows, skew=1.0, outlier_rate=0.001):
+    """Numeric column: lognormal with sigma=skew (normal when skew=0), plus a few large outliers."""
+    values = rng.lognormal(sigma=skew, size=rows) if skew > 0 else rng.normal(size=rows)
+    outliers = rng.random(rows) < outlier_rate
+    values[outliers] *= rng.uniform(20, 100, size=int(outliers.sum()))
+    return values
+
+
+def make_dataset(rows, n_numeric=4, n_categorical=3, cardinality=20, skew=1.0, null_rate=0.0, seed=0):
+    """
+    Synthetic DataFrame for benchmarks.
+    Columns are num0..num{n_numeric-1} (float), cat0..cat{n_categorical-1} (object), 'ts' (sorted
+    timestamps) and 'value' (a random walk along ts).
+    Parameters:
+    - rows (int): Number of rows.
+    - n_numeric, n_categorical (int): Number of numeric and categorical columns.
+    - cardinality (int or list): Distinct values per categorical column (one value for all, or one per column).
+    - skew (float): Zipf exponent of the category frequencies and lognormal sigma of the numeric columns.
+    - null_rate (float): Fraction of missing values in every numeric and categorical column.
+    - seed (int): Random seed; the same arguments always give the same data.
+    """
+    rng = np.random.default_rng(seed)
+    cardinalities = cardinality if isinstance(cardinality, (list, tuple)) else [cardinality] * n_categorical
+    columns = {}
+    for i in range(n_numeric):
+        columns[f'num{i}'] = make_numeric(rng, rows, skew)
+    # num1 follows num0 so that scatter, joint and correlation plots have some structure
+    if n_numeric > 1:
+        columns['num1'] = columns['num0'] * 2 + columns['num1']
+    for i in range(n_categorical):
+        columns[f'cat{i}'] = make_categorical(rng, rows, cardinalities[i], skew, prefix=f'c{i}_')
+    data = pd.DataFrame(columns)
+    if null_rate > 0:
+        for column in list(columns):
+            data.loc[rng.random(rows) < null_rate, column] = np.nan
+    data['ts'] = pd.date_range('2024-01-01', periods=rows, freq='s')
+    data['value'] = rng.normal(size=rows).cumsum()
+    return data
+
+
+# Usage
+# data = make_dataset(1_000_000, cardinality=[10, 1000, 100_000], skew=1.2, null_rate=0.05)
@@ -0,0 +1,83 @@
+"""
+Guards the startup cost of eda_toolkit: each check runs in a fresh interpreter, times the toolkit import
+(and a small compute-only call), and fails when a plotting or scipy module got imported or the time
+exceeds the budget.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --max-seconds 0.5 --output import_times.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ('matplotlib', 'seaborn', 'scipy', 'IPython', 'polars')
+
+SETUP = '''
+import numpy as np, pandas as pd
+data = pd.DataFrame({'x': np.arange(1000.0), 'c': list('abcd') * 250, 'd': list('xyz' * 333) + ['x']})
+'''
+
+# name -> statement; none of them may import a HEAVY module
+CHECKS = {
+    'import eda_toolkit': 'import eda_toolkit',
+    'import Plotter': 'from eda_toolkit import Plotter, quick_eda_obj, basic_eda',
+    'profiling': 'from eda_toolkit import profile_dataframe; profile_dataframe(data).to_dict()',
+    'outlier bounds': "from eda_toolkit import OutlierHandler; OutlierHandler(data).fit(['x'])",
+    'crosstab probabilities': "from eda_toolkit import CrossTabAnalysis; CrossTabAnalysis(data, 'c', 'd').get_full_dataframe()",
+    'streaming profile': "from eda_toolkit import StreamingProfiler; StreamingProfiler().update(data).report()",
+}
+
+PROBE = '''
+import json, sys, time
+{setup}
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{'seconds': seconds, 'heavy_modules': heavy}}))
+'''
+
+
+def run_check(statement):
+    code = PROBE.format(setup=SETUP, statement=statement, heavy=HEAVY)
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                            env={**os.environ, 'PYTHONPATH': ROOT})
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-seconds', type=float, default=1.0, help='time budget per check (after numpy/pandas)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per check; the fastest one is kept')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args(argv)
+
+    failures, results = 0, {}
+    for name, statement in CHECKS.items():
+        runs = [run_check(statement) for _ in range(args.repeat)]
+        result = next((run for run in runs if 'error' in run), None) or min(runs, key=lambda run: run['seconds'])
+        results[name] = result
+        problems = []
+        if 'error' in result:
+            problems.append(result['error'])
+        else:
+            if result['heavy_modules']:
+                problems.append(f"imported {', '.join(result['heavy_modules'])}")
+            if result['seconds'] > args.max_seconds:
+                problems.append(f'over the {args.max_seconds}s budget')
+        failures += bool(problems)
+        timing = f"{result['seconds']:.3f}s" if 'seconds' in result else '-'
+        print(f"{name:<25} {timing:>8}  {'FAIL: ' + '; '.join(problems) if problems else 'ok'}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Times the public entry points of the toolkit on synthetic data and compares against a baseline.
+
+    python benchmarks/run_benchmarks.py --rows 10000 100000 --output bench_results.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json   # exit code 1 on regressions or failures
+
+benchmarks/baseline.json is the stored reference (default sizes and data settings); regenerate it on the
+reference machine when a change is meant to move the numbers.
+
+Rendering uses the Agg backend, so the suite runs headless.
+"""
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eda_toolkit import eda
+from eda_toolkit import OutlierHandler, CrossTabAnalysis, batch_crosstab
+from eda_toolkit.instrumentation import instrument
+from datagen import make_dataset
+
+# tables are displayed in notebooks; keep the benchmark output to the timings
+eda.display = lambda *args, **kwargs: None
+
+
+def _plot(name, **kwargs):
+    def case(data):
+        return lambda: getattr(eda.Plotter(data), name)(**kwargs)
+    return case
+
+
+def _outliers(name, **kwargs):
+    def case(data):
+        handler = OutlierHandler(data.copy())
+        return lambda: getattr(handler, name)(**kwargs)
+    return case
+
+
+NUMERIC = ['num0', 'num1', 'num2', 'num3']
+
+# name -> case(data) returning the callable to time; the case itself (setup) is not timed
+BENCHMARKS = {
+    'basic_eda': lambda data: lambda: eda.basic_eda(data),
+    'Plotter.countplot': _plot('countplot', column='cat1', bar_label=True, top_n=10),
+    'Plotter.pieplot': _plot('pieplot', column='cat1', top_n=10),
+    'Plotter.histogram': _plot('histogram', column='num0'),
+    'Plotter.kdeplot': _plot('kdeplot', column='num0'),
+    'Plotter.boxplot': _plot('boxplot', column='num0'),
+    'Plotter.lineplot': _plot('lineplot', x_column='ts', y_column='value'),
+    'Plotter.scatterplot': _plot('scatterplot', x_column='num0', y_column='num1'),
+    'Plotter.jointplot': _plot('jointplot', x_column='num0', y_column='num1'),
+    'Plotter.stackedcountplot': _plot('stackedcountplot', x_column='cat0', hue='cat1', top_n=10),
+    'Plotter.bivariateboxplot': _plot('bivariateboxplot', categorical_column='cat0', numerical_column='num0', top_n=10),
+    'Plotter.bivariatebarplot': _plot('bivariatebarplot', categorical_column='cat0', numerical_column='num0', top_n=10),
+    'Plotter.trivariatescatterplot_CNN': _plot('trivariatescatterplot_CNN', numerical_column1='num0', numerical_column2='num1', categorical_column='cat0', top_n=5),
+    'Plotter.trivariateboxplot': _plot('trivariateboxplot', categorical_column1='cat0', categorical_column2='cat1', numerical_column='num0', top_n=5),
+    'Plotter.heatmap': _plot('heatmap', columns=NUMERIC),
+    'Plotter.pairplot': _plot('pairplot', columns=NUMERIC[:3]),
+    'OutlierHandler.remove_outliers_iqr': _outliers('remove_outliers_iqr', columns=NUMERIC),
+    'OutlierHandler.clip_outliers': _outliers('clip_outliers', columns=NUMERIC),
+    'OutlierHandler.fit_transform': _outliers('fit_transform', columns=NUMERIC, method='zscore', action='flag'),
+    'CrossTabAnalysis.get_full_dataframe': lambda data: lambda: CrossTabAnalysis(data, 'cat0', 'cat1').get_full_dataframe(),
+    'batch_crosstab': lambda data: lambda: batch_crosstab(data, columns=['cat0', 'cat1', 'cat2'], n_jobs=1),
+}
+
+
+def _run_once(case, data, trace_memory=False):
+    func = case(data)
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        # Plotter methods catch and print their errors; the spans still carry them
+        with contextlib.redirect_stdout(io.StringIO()), instrument() as collector:
+            func()
+    finally:
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        if trace_memory:
+            tracemalloc.stop()
+        plt.close('all')
+    errors = [f'{span.name}: {span.error}' for span in collector.spans if span.error]
+    if errors:
+        raise RuntimeError('; '.join(errors))
+    return seconds, peak
+
+
+def run(rows_list, names, repeat=3, data_kwargs=None):
+    """
+    Times every benchmark on every data size: the minimum and mean wall time over `repeat` runs, and the
+    peak traced Python/NumPy allocation of one extra run under tracemalloc.
+    """
+    results = []
+    for rows in rows_list:
+        data = make_dataset(rows, **(data_kwargs or {}))
+        for name in names:
+            record = {'name': name, 'rows': rows}
+            try:
+                times = [_run_once(BENCHMARKS[name], data)[0] for _ in range(repeat)]
+                record.update(seconds=min(times), mean_seconds=float(np.mean(times)),
+                              peak_bytes=_run_once(BENCHMARKS[name], data, trace_memory=True)[1])
+            except Exception as e:
+                record['error'] = f'{type(e).__name__}: {e}'
+            results.append(record)
+            print(f"{name:<40} rows={rows:<10} " + (f"{record['seconds']:.4f}s  peak={record['peak_bytes'] / 2 ** 20:.1f} MiB"
+                                                     if 'error' not in record else record['error']), flush=True)
+    return results
+
+
+def compare(results, baseline, threshold=0.2, min_seconds=0.005):
+    """
+    Returns the regressions against a baseline: benchmarks whose best time grew by more than `threshold`
+    (relative) and `min_seconds` (absolute), whose peak memory grew by more than `threshold`, or that fail
+    while they succeeded in the baseline.
+    """
+    previous = {(record['name'], record['rows']): record for record in baseline['results']}
+    regressions = []
+    for record in results:
+        old = previous.get((record['name'], record['rows']))
+        if old is None or 'error' in old:
+            continue
+        if 'error' in record:
+            regressions.append({'name': record['name'], 'rows': record['rows'], 'metric': 'error',
+                                'baseline': None, 'current': record['error'], 'ratio': None})
+            continue
+        for key, floor in (('seconds', min_seconds), ('peak_bytes', 1024 ** 2)):
+            if record[key] > old[key] * (1 + threshold) and record[key] - old[key] > floor:
+                regressions.append({'name': record['name'], 'rows': record['rows'], 'metric': key,
+                                    'baseline': old[key], 'current': record[key], 'ratio': record[key] / old[key]})
+    return regressions
+
+
+def environment():
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(), 'platform': platform.platform(), 'machine': platform.machine(),
+        'cpu_count': os.cpu_count(), 'numpy': np.__version__, 'pandas': pd.__version__,
+        'matplotlib': matplotlib.__version__, 'seaborn': sns.__version__,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000], help='data sizes')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cardinality', type=int, default=20)
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument('--null-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_results.json', help='results file')
+    parser.add_argument('--save-baseline', metavar='PATH', help='also write the results as the new baseline')
+    parser.add_argument('--baseline', metavar='PATH', help='compare against this baseline and exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative slowdown reported as a regression')
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    data_kwargs = {'cardinality': args.cardinality, 'skew': args.skew, 'null_rate': args.null_rate, 'seed': args.seed}
+    output = {'environment': environment(), 'data': data_kwargs, 'repeat': args.repeat,
+              'results': run(args.rows, names, repeat=args.repeat, data_kwargs=data_kwargs)}
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, 'w') as f:
+            json.dump(output, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('data') != data_kwargs:
+            print('Warning: the baseline was generated with different data settings', baseline.get('data'))
+        regressions = compare(output['results'], baseline, threshold=args.threshold)
+        for regression in regressions:
+            if regression['metric'] == 'error':
+                print(f"REGRESSION {regression['name']} rows={regression['rows']} now fails: {regression['current']}")
+                continue
+            print(f"REGRESSION {regression['name']} rows={regression['rows']} {regression['metric']}: "
+                  f"{regression['baseline']:.4g} -> {regression['current']:.4g} (x{regression['ratio']:.2f})")
+        if regressions:
+            return 1
+        print('No regressions against', args.baseline)
+    failed = [record['name'] for record in output['results'] if 'error' in record]
+    if failed:
+        print(f'{len(failed)} benchmark(s) failed:', ', '.join(dict.fromkeys(failed)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
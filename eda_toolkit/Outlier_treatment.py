@@ -0,0 +1,299 @@
+import json
+import numpy as np
+import pandas as pd
+
+from ._lazy import scipy_stats
+from .backends import as_backend
+from .instrumentation import instrument_class
+
+
+def _inside(values, lower, upper, method):
+    """Values within the bounds: inclusive for 'iqr' and 'percentile', strict for 'zscore' (|zscore| < threshold)."""
+    if method == "zscore":
+        return (values > lower) & (values < upper)
+    return (values >= lower) & (values <= upper)
+
+
+class OutlierBounds:
+    def __init__(self, lower, upper, method, params=None):
+        """
+        Per-column lower/upper outlier bounds computed by OutlierHandler.fit.
+        Parameters:
+        - lower (dict): Lower bound per column.
+        - upper (dict): Upper bound per column.
+        - method (str): Method the bounds were computed with ('iqr', 'percentile' or 'zscore').
+        - params (dict): Parameters of the method (percentiles, threshold).
+        """
+        self.lower = {col: float(value) for col, value in lower.items()}
+        self.upper = {col: float(value) for col, value in upper.items()}
+        self.method = method
+        self.params = params or {}
+
+    @property
+    def columns(self):
+        return list(self.lower)
+
+    def to_dict(self):
+        return {'method': self.method, 'params': self.params, 'lower': self.lower, 'upper': self.upper}
+
+    @classmethod
+    def from_dict(cls, bounds_dict):
+        return cls(bounds_dict['lower'], bounds_dict['upper'], bounds_dict['method'], bounds_dict.get('params'))
+
+    def to_json(self, path=None):
+        """Serializes the bounds to JSON. Writes to `path` when given, otherwise returns the string."""
+        text = json.dumps(self.to_dict())
+        if path is None:
+            return text
+        with open(path, 'w') as f:
+            f.write(text)
+
+    @classmethod
+    def from_json(cls, path_or_text):
+        """Loads bounds from a JSON file path or a JSON string."""
+        if path_or_text.lstrip().startswith('{'):
+            return cls.from_dict(json.loads(path_or_text))
+        with open(path_or_text) as f:
+            return cls.from_dict(json.load(f))
+
+
+@instrument_class
+class OutlierHandler:
+    def __init__(self, dataframe):
+        """
+        Parameters:
+        - dataframe (DataFrame): Data to treat, or a Polars LazyFrame or pyarrow Dataset (see backends.py).
+          With a lazy source, fit computes the bounds in that engine from the fitted columns only; the
+          row-level treatments collect the source into pandas on first use.
+        """
+        self.backend = as_backend(dataframe)
+        self._dataframe = dataframe if self.backend.in_memory else None
+        self.bounds = None
+        self.outlier_counts = None
+
+    @property
+    def dataframe(self):
+        if self._dataframe is None:
+            self._dataframe = self.backend.scan()
+        return self._dataframe
+
+    @dataframe.setter
+    def dataframe(self, dataframe):
+        self._dataframe = dataframe
+
+    def fit(self, columns, method="iqr", lower_percentile=0.05, upper_percentile=0.95, threshold=3):
+        """
+        Compute outlier bounds for all specified columns in one vectorized call and keep them for transform.
+        Methods: 'iqr' (Q1 - 1.5 IQR, Q3 + 1.5 IQR), 'percentile' (lower/upper percentiles) and
+        'zscore' (mean -/+ threshold * population std, i.e. |zscore| < threshold).
+        Returns the OutlierBounds, which can be saved with to_json and reused on later batches.
+        """
+        self.bounds = self._compute_bounds(columns, method, lower_percentile, upper_percentile, threshold)
+        return self.bounds
+
+    def _compute_bounds(self, columns, method, lower_percentile, upper_percentile, threshold):
+        # a lazy source that no row-level method has collected yet is aggregated in its engine
+        frame = self.backend if self._dataframe is None else as_backend(self._dataframe)
+        columns = list(columns)
+        if method == "iqr":
+            quartiles = frame.quantile(columns, [0.25, 0.75])
+            iqr = quartiles.loc[0.75] - quartiles.loc[0.25]
+            lower, upper = quartiles.loc[0.25] - 1.5 * iqr, quartiles.loc[0.75] + 1.5 * iqr
+            params = {}
+        elif method == "percentile":
+            percentiles = frame.quantile(columns, [lower_percentile, upper_percentile])
+            lower, upper = percentiles.loc[lower_percentile], percentiles.loc[upper_percentile]
+            params = {'lower_percentile': lower_percentile, 'upper_percentile': upper_percentile}
+        elif method == "zscore":
+            mean, std = frame.mean(columns), frame.std(columns, ddof=0)
+            lower, upper = mean - threshold * std, mean + threshold * std
+            params = {'threshold': threshold}
+        else:
+            raise ValueError(f"Unknown method '{method}', expected 'iqr', 'percentile' or 'zscore'")
+        return OutlierBounds(lower.to_dict(), upper.to_dict(), method, params)
+
+    def transform(self, dataframe=None, action="clip", bounds=None):
+        """
+        Apply fitted bounds to a DataFrame in one vectorized operation.
+        Parameters:
+        - dataframe (DataFrame): Data to treat. Defaults to the handler's own dataframe, which is then
+          updated like the other methods do; a DataFrame passed in is not modified.
+        - action (str): 'clip' values to the bounds, 'flag' outliers in '<col>_outlier_flag' columns,
+          or 'remove' rows with any value outside the bounds (or missing, as remove_outliers_* do).
+        - bounds (OutlierBounds): Bounds to apply. Defaults to the ones from the last fit.
+        """
+        bounds = bounds or self.bounds
+        if bounds is None:
+            raise ValueError("No bounds available: call fit() first or pass bounds")
+        result = self.dataframe if dataframe is None else dataframe
+        columns = bounds.columns
+        lower = np.array([bounds.lower[col] for col in columns])
+        upper = np.array([bounds.upper[col] for col in columns])
+        if action in ("flag", "remove"):
+            values = result[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        if action == "clip":
+            result = result.copy(deep=False)
+            # per column Series.clip, like clip_outliers: integer columns keep their dtype and NaN stays NaN
+            for col, low, high in zip(columns, lower, upper):
+                result[col] = result[col].clip(lower=low, upper=high)
+        elif action == "flag":
+            inside = _inside(values, lower, upper, bounds.method)
+            result = result.copy(deep=False)
+            result[[f"{col}_outlier_flag" for col in columns]] = ~inside
+        elif action == "remove":
+            inside = _inside(values, lower, upper, bounds.method)
+            result = result[inside.all(axis=1)]
+        else:
+            raise ValueError(f"Unknown action '{action}', expected 'clip', 'flag' or 'remove'")
+        if dataframe is None:
+            self.dataframe = result
+        return result
+
+    def fit_transform(self, columns, method="iqr", action="clip", **fit_kwargs):
+        """Fit bounds on the handler's dataframe and apply them to it."""
+        self.fit(columns, method=method, **fit_kwargs)
+        return self.transform(action=action)
+
+    def outlier_mask(self, columns, method="iqr", lower_percentile=0.05, upper_percentile=0.95, threshold=3, refit=False):
+        """
+        Build one boolean row mask over all specified columns, with every bound taken from the current data.
+        Returns (keep_mask, outlier_counts): keep_mask is a boolean Series (True = row kept) and
+        outlier_counts a Series with the number of rows each column's rule rejects. Missing values are
+        rejected, as in the remove_outliers_* methods; with 'zscore', so are values at exactly
+        |zscore| == threshold. No DataFrame is copied.
+        Parameters:
+        - refit (bool): Also keep the bounds for transform, as fit does; by default the fitted bounds are left unchanged.
+        """
+        bounds = self._compute_bounds(columns, method, lower_percentile, upper_percentile, threshold)
+        if refit:
+            self.bounds = bounds
+        lower = np.array([bounds.lower[col] for col in bounds.columns])
+        upper = np.array([bounds.upper[col] for col in bounds.columns])
+        keep = np.ones(len(self.dataframe), dtype=bool)
+        counts = {}
+        for col, low, high in zip(bounds.columns, lower, upper):
+            values = self.dataframe[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            inside = _inside(values, low, high, bounds.method)
+            counts[col] = int(inside.size - np.count_nonzero(inside))
+            keep &= inside
+        self.outlier_counts = pd.Series(counts, name='outlier_count')
+        return pd.Series(keep, index=self.dataframe.index, name='keep'), self.outlier_counts
+
+    def remove_outliers(self, columns, method="iqr", lower_percentile=0.05, upper_percentile=0.95, threshold=3, return_mask=False):
+        """
+        Remove rows that are outliers in any of the specified columns, in a single filtering step.
+        Unlike the column-by-column remove_outliers_* methods, all bounds come from the original data and
+        the filtered frame is materialized only once. Per-column counts are kept in self.outlier_counts.
+        Parameters:
+        - return_mask (bool): Return (keep_mask, outlier_counts) instead of filtering the dataframe.
+        """
+        keep, counts = self.outlier_mask(columns, method=method, lower_percentile=lower_percentile,
+                                         upper_percentile=upper_percentile, threshold=threshold)
+        if return_mask:
+            return keep, counts
+        self.dataframe = self.dataframe[keep.to_numpy()]
+        return self.dataframe
+
+    def remove_outliers_iqr(self, columns, single_pass=False):
+        """
+        Remove rows with outliers based on IQR method for specified columns.
+        single_pass=True computes all bounds on the original data and filters once (see remove_outliers).
+        """
+        if single_pass:
+            return self.remove_outliers(columns, method="iqr")
+        for col in columns:
+            Q1 = self.dataframe[col].quantile(0.25)
+            Q3 = self.dataframe[col].quantile(0.75)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
+            self.dataframe = self.dataframe[(self.dataframe[col] >= lower_bound) & (self.dataframe[col] <= upper_bound)]
+        return self.dataframe
+
+    def remove_outliers_percentile(self, columns, lower_percentile=0.05, upper_percentile=0.95, single_pass=False):
+        """
+        Remove rows with outliers outside specified percentiles for given columns.
+        single_pass=True computes all bounds on the original data and filters once (see remove_outliers).
+        """
+        if single_pass:
+            return self.remove_outliers(columns, method="percentile", lower_percentile=lower_percentile, upper_percentile=upper_percentile)
+        for col in columns:
+            lower_bound = self.dataframe[col].quantile(lower_percentile)
+            upper_bound = self.dataframe[col].quantile(upper_percentile)
+            self.dataframe = self.dataframe[(self.dataframe[col] >= lower_bound) & (self.dataframe[col] <= upper_bound)]
+        return self.dataframe
+
+    def clip_outliers(self, columns, method="iqr", lower_percentile=0.05, upper_percentile=0.95):
+        """Clip outliers for specified columns based on IQR or percentile method."""
+        for col in columns:
+            if method == "iqr":
+                Q1 = self.dataframe[col].quantile(0.25)
+                Q3 = self.dataframe[col].quantile(0.75)
+                IQR = Q3 - Q1
+                lower_bound = Q1 - 1.5 * IQR
+                upper_bound = Q3 + 1.5 * IQR
+            elif method == "percentile":
+                lower_bound = self.dataframe[col].quantile(lower_percentile)
+                upper_bound = self.dataframe[col].quantile(upper_percentile)
+            self.dataframe[col] = self.dataframe[col].clip(lower=lower_bound, upper=upper_bound)
+        return self.dataframe
+
+    def log_transform(self, columns):
+        """Apply log transformation to specified columns."""
+        for col in columns:
+            self.dataframe[col] = np.log1p(self.dataframe[col])  # log(1 + x) to handle zero values
+        return self.dataframe
+
+    def winsorize_outliers(self, columns, limits=(0.05, 0.05)):
+        """Apply winsorization to specified columns with given limits."""
+        from scipy.stats.mstats import winsorize
+        for col in columns:
+            self.dataframe[col] = winsorize(self.dataframe[col], limits=limits)
+        return self.dataframe
+
+    def flag_outliers(self, columns, method="iqr", lower_percentile=0.05, upper_percentile=0.95):
+        """Flag outliers in specified columns using IQR or percentile method."""
+        for col in columns:
+            if method == "iqr":
+                Q1 = self.dataframe[col].quantile(0.25)
+                Q3 = self.dataframe[col].quantile(0.75)
+                IQR = Q3 - Q1
+                lower_bound = Q1 - 1.5 * IQR
+                upper_bound = Q3 + 1.5 * IQR
+            elif method == "percentile":
+                lower_bound = self.dataframe[col].quantile(lower_percentile)
+                upper_bound = self.dataframe[col].quantile(upper_percentile)
+            self.dataframe[f"{col}_outlier_flag"] = ~self.dataframe[col].between(lower_bound, upper_bound)
+        return self.dataframe
+
+    def remove_outliers_zscore(self, columns, threshold=3, single_pass=False):
+        """
+        Remove rows with outliers based on Z-score method for specified columns.
+        single_pass=True computes all bounds on the original data and filters once (see remove_outliers);
+        it then rejects |zscore| >= threshold on both sides.
+        """
+        if single_pass:
+            return self.remove_outliers(columns, method="zscore", threshold=threshold)
+        for col in columns:
+            self.dataframe = self.dataframe[(scipy_stats.zscore(self.dataframe[col].dropna()) < threshold).reindex(self.dataframe.index, fill_value=False)]
+        return self.dataframe
+
+    def clip_outliers_zscore(self, columns, threshold=3):
+        """Clip outliers based on Z-score method for specified columns."""
+        for col in columns:
+            z_scores = scipy_stats.zscore(self.dataframe[col].dropna())
+            outlier_mask = (z_scores.abs() >= threshold)
+            col_median = self.dataframe[col].median()
+            self.dataframe[col] = np.where(outlier_mask, col_median, self.dataframe[col])
+        return self.dataframe
+
+#Removing the outliers by clipping the data outside of the iqr range
+# OutlierHandler_obj = OutlierHandler(data)
+
+# outlier_treated_data = OutlierHandler_obj.clip_outliers(num_features, method="iqr")
+# outlier_treated_data.head(2)
+
+#Reusing training-time bounds on a new batch
+# bounds = OutlierHandler(train_data).fit(num_features, method="iqr")
+# bounds.to_json('bounds.json')
+# scored_batch = OutlierHandler(batch).transform(action="clip", bounds=OutlierBounds.from_json('bounds.json'))
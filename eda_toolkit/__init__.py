@@ -0,0 +1,45 @@
+"""
+Exploratory data analysis helpers: profiling, plotting, outlier treatment and crosstab probabilities.
+
+Submodules are imported on first access of their names, and matplotlib, seaborn and scipy only when a
+code path needs them, so `import eda_toolkit` and the compute-only paths (profiling, outlier bounds,
+crosstab probabilities) start fast and work headless.
+"""
+import importlib
+
+__version__ = '0.1.0'
+
+_EXPORTS = {
+    'basic_eda': 'eda', 'Plotter': 'eda', 'quick_eda_obj': 'eda',
+    'OutlierHandler': 'Outlier_treatment', 'OutlierBounds': 'Outlier_treatment',
+    'CrossTabAnalysis': 'get_marginal_conditional_joint_probabilities',
+    'CrossTabAssociations': 'get_marginal_conditional_joint_probabilities',
+    'batch_crosstab': 'get_marginal_conditional_joint_probabilities',
+    'ProfileReport': 'profiling', 'profile_dataframe': 'profiling',
+    'StreamingProfiler': 'streaming', 'profile_file': 'streaming', 'iter_chunks': 'streaming',
+    'IncrementalProfiler': 'incremental', 'drift_summary': 'incremental',
+    'HyperLogLog': 'sketches', 'KLLSketch': 'sketches', 'SpaceSaving': 'sketches',
+    'CorrelationEngine': 'correlation', 'correlation_matrix': 'correlation', 'top_correlations': 'correlation',
+    'CategoryIndex': 'category_index', 'UnivariateSummary': 'univariate', 'GroupSummary': 'group_summary',
+    'StatsCache': 'stats_cache', 'PlotCache': 'plot_cache', 'run_all': 'report',
+    'instrument': 'instrumentation', 'InMemoryCollector': 'instrumentation', 'JsonLogHook': 'instrumentation',
+    'add_hook': 'instrumentation', 'remove_hook': 'instrumentation',
+    'compact_dataframe': 'ingest', 'open_compacted': 'ingest', 'CompactionReport': 'ingest',
+    'draw_sample': 'sampling', 'reservoir_sample': 'sampling', 'stratified_sample': 'sampling', 'uniform_sample': 'sampling', 'Sample': 'sampling',
+    'BackgroundRefinement': 'sampling', 'progressive_profiles': 'sampling',
+    'as_backend': 'backends', 'PandasBackend': 'backends', 'PolarsBackend': 'backends', 'ArrowBackend': 'backends',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,49 @@
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    def __init__(self, name):
+        """
+        Stand-in for a heavy module (matplotlib, seaborn, scipy) that imports it on first attribute access,
+        so compute-only code paths never pay for plotting libraries.
+        """
+        super().__init__(name)
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f'<lazy module {self.__name__!r} ({state})>'
+
+
+def lazy_import(name):
+    """Returns the module if it is already imported, else a LazyModule importing it on first use."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+plt = lazy_import('matplotlib.pyplot')
+sns = lazy_import('seaborn')
+mcolors = lazy_import('matplotlib.colors')
+mpatches = lazy_import('matplotlib.patches')
+scipy_stats = lazy_import('scipy.stats')
+
+
+def display(*objects, **kwargs):
+    """IPython's display in notebooks, print elsewhere (IPython is imported on first call)."""
+    try:
+        from IPython.display import display as ipython_display
+    except ImportError:  # plain python / CLI jobs
+        return print(*objects)
+    return ipython_display(*objects, **kwargs)
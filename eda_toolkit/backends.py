@@ -0,0 +1,339 @@
+import functools
+import inspect
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+
+pl = lazy_import('polars')
+pa = lazy_import('pyarrow')
+pc = lazy_import('pyarrow.compute')
+pads = lazy_import('pyarrow.dataset')
+
+
+def _counts_matrix(row_values, column_values, counts):
+    """Turns (row value, column value, count) group-by output into a counts matrix and its labels."""
+    row_codes, row_labels = pd.factorize(pd.Series(row_values, dtype=object))
+    col_codes, column_labels = pd.factorize(pd.Series(column_values, dtype=object))
+    matrix = np.zeros((len(row_labels), len(column_labels)), dtype=np.int64)
+    matrix[row_codes, col_codes] = np.asarray(counts, dtype=np.int64)
+    return matrix, pd.Index(row_labels), pd.Index(column_labels)
+
+
+def _sorted_counts(labels, counts, column):
+    """Series of counts by descending frequency, like Series.value_counts()."""
+    counts = np.asarray(counts, dtype=np.int64)
+    order = np.argsort(-counts, kind='stable')
+    return pd.Series(counts[order], index=pd.Index(np.asarray(labels, dtype=object)[order], name=column), name='count')
+
+
+class Backend(ABC):
+    """
+    Execution engine behind Plotter, OutlierHandler and CrossTabAnalysis. Aggregations (value counts,
+    distinct counts, quantiles, moments, contingency counts) run in the engine on the referenced columns
+    only, and `scan` brings back a pandas frame of the requested columns and rows for drawing.
+    Subclasses implement every abstract method; a missing one fails when the backend is created.
+    """
+    in_memory = False
+
+    @property
+    @abstractmethod
+    def columns(self):
+        """Column names of the source."""
+
+    @abstractmethod
+    def is_numeric(self, column):
+        """Whether a column has a numeric type."""
+
+    @abstractmethod
+    def num_rows(self):
+        """Number of rows of the source."""
+
+    @abstractmethod
+    def scan(self, columns=None, filters=None):
+        """Returns the given columns as a pandas frame, keeping the rows whose values are in filters ({column: values})."""
+
+    @abstractmethod
+    def take(self, positions, columns=None):
+        """Returns the rows at the given sorted positions (e.g. a sample) as a pandas frame, read in the engine."""
+
+    @abstractmethod
+    def value_counts(self, column):
+        """Non-null value counts of a column by descending frequency, like Series.value_counts()."""
+
+    @abstractmethod
+    def nunique(self, column):
+        """Number of distinct non-null values of a column."""
+
+    @abstractmethod
+    def quantile(self, columns, quantiles):
+        """DataFrame of the (linearly interpolated) quantiles of the columns, indexed by quantile."""
+
+    @abstractmethod
+    def mean(self, columns):
+        """Series of the column means."""
+
+    @abstractmethod
+    def std(self, columns, ddof=1):
+        """Series of the column standard deviations."""
+
+    @abstractmethod
+    def crosstab_counts(self, index_column, column_name):
+        """(counts matrix, row labels, column labels) of the non-null value pairs of two columns."""
+
+    def referenced_columns(self, values):
+        """Returns the column names among the given argument values (lists and dicts are searched too)."""
+        columns = []
+        for value in values:
+            if isinstance(value, dict):
+                value = [item for items in value.values() for item in (items if isinstance(items, (list, tuple)) else [items])]
+            for item in (value if isinstance(value, (list, tuple)) else [value]):
+                if isinstance(item, str) and item in self.columns and item not in columns:
+                    columns.append(item)
+        return columns
+
+    def top_values(self, column, top_n):
+        """Returns the top_n most frequent values of a column."""
+        return list(self.value_counts(column).index[:top_n])
+
+    def top_n_filters(self, columns, top_n):
+        """Filters keeping the top_n categories of every non-numeric column, pushed down into the scan."""
+        if not top_n:
+            return {}
+        return {column: self.top_values(column, top_n) for column in columns if not self.is_numeric(column)}
+
+
+class PandasBackend(Backend):
+    in_memory = True
+
+    def __init__(self, data):
+        """In-memory pandas DataFrame; the reference implementation of the other backends."""
+        self.data = data
+
+    @property
+    def columns(self):
+        return list(self.data.columns)
+
+    def is_numeric(self, column):
+        return pd.api.types.is_numeric_dtype(self.data[column])
+
+    def num_rows(self):
+        return len(self.data)
+
+    def scan(self, columns=None, filters=None):
+        data = self.data if columns is None else self.data[list(columns)]
+        if filters:
+            mask = np.ones(len(data), dtype=bool)
+            for column, values in filters.items():
+                mask &= self.data[column].isin(values).to_numpy()
+            data = data[mask]
+        return data
+
+    def take(self, positions, columns=None):
+        data = self.data if columns is None else self.data[list(columns)]
+        return data.iloc[positions]
+
+    def value_counts(self, column):
+        return self.data[column].value_counts()
+
+    def nunique(self, column):
+        return int(self.data[column].nunique())
+
+    def quantile(self, columns, quantiles):
+        return self.data[list(columns)].quantile(list(quantiles))
+
+    def mean(self, columns):
+        return self.data[list(columns)].mean()
+
+    def std(self, columns, ddof=1):
+        return self.data[list(columns)].std(ddof=ddof)
+
+    def crosstab_counts(self, index_column, column_name):
+        grouped = self.data.groupby([index_column, column_name], observed=True, sort=False).size()
+        return _counts_matrix(grouped.index.get_level_values(0), grouped.index.get_level_values(1), grouped.to_numpy())
+
+
+class PolarsBackend(Backend):
+    def __init__(self, frame):
+        """
+        Polars LazyFrame (a DataFrame is made lazy). Every call builds a lazy query that selects only the
+        referenced columns, so scan_parquet/scan_csv sources read just those columns, and filters are pushed
+        down into the scan. Queries run on Polars' multi-threaded engine; bringing a scan back to pandas
+        needs pyarrow, as DataFrame.to_pandas does.
+        """
+        self.frame = frame.lazy()
+        self._schema = self.frame.collect_schema()
+
+    @property
+    def columns(self):
+        return list(self._schema.names())
+
+    def is_numeric(self, column):
+        return self._schema[column].is_numeric()
+
+    def num_rows(self):
+        return int(self.frame.select(pl.len()).collect().item())
+
+    def scan(self, columns=None, filters=None):
+        frame = self.frame
+        for column, values in (filters or {}).items():
+            frame = frame.filter(pl.col(column).is_in(list(values)))
+        if columns is not None:
+            frame = frame.select(list(columns))
+        return frame.collect().to_pandas()
+
+    def take(self, positions, columns=None):
+        frame = self.frame.filter(pl.int_range(pl.len(), dtype=pl.Int64).is_in(np.asarray(positions, dtype=np.int64).tolist()))
+        if columns is not None:
+            frame = frame.select(list(columns))
+        return frame.collect().to_pandas()
+
+    def value_counts(self, column):
+        result = self.frame.group_by(column).agg(pl.len().alias('count')).drop_nulls(column).collect()
+        return _sorted_counts(result[column].to_list(), result['count'].to_numpy(), column)
+
+    def nunique(self, column):
+        return int(self.frame.select(pl.col(column).drop_nulls().n_unique()).collect().item())
+
+    def quantile(self, columns, quantiles):
+        exprs = [pl.col(column).quantile(q, interpolation='linear').alias(f'{i}_{j}')
+                 for i, q in enumerate(quantiles) for j, column in enumerate(columns)]
+        values = np.array(self.frame.select(exprs).collect().row(0), dtype=np.float64)
+        return pd.DataFrame(values.reshape(len(quantiles), len(columns)), index=list(quantiles), columns=list(columns))
+
+    def mean(self, columns):
+        row = self.frame.select([pl.col(column).mean() for column in columns]).collect().row(0)
+        return pd.Series(row, index=list(columns), dtype=np.float64)
+
+    def std(self, columns, ddof=1):
+        row = self.frame.select([pl.col(column).std(ddof=ddof) for column in columns]).collect().row(0)
+        return pd.Series(row, index=list(columns), dtype=np.float64)
+
+    def crosstab_counts(self, index_column, column_name):
+        result = self.frame.group_by([index_column, column_name]).agg(pl.len().alias('count')) \
+            .drop_nulls([index_column, column_name]).collect()
+        return _counts_matrix(result[index_column].to_list(), result[column_name].to_list(), result['count'].to_numpy())
+
+
+class ArrowBackend(Backend):
+    def __init__(self, dataset):
+        """
+        pyarrow Dataset (a Table is wrapped in an in-memory dataset). Scans read only the referenced columns
+        and push filters down to the fragments (row groups are skipped from Parquet statistics); group-bys
+        and reductions run multi-threaded in Arrow's compute engine.
+        """
+        self.dataset = dataset if isinstance(dataset, pads.Dataset) else pads.dataset(dataset)
+
+    @property
+    def columns(self):
+        return list(self.dataset.schema.names)
+
+    def is_numeric(self, column):
+        dtype = self.dataset.schema.field(column).type
+        return pa.types.is_integer(dtype) or pa.types.is_floating(dtype) or pa.types.is_decimal(dtype)
+
+    def num_rows(self):
+        return int(self.dataset.count_rows())
+
+    def _table(self, columns=None, filters=None):
+        expression = None
+        for column, values in (filters or {}).items():
+            condition = pc.field(column).isin(list(values))
+            expression = condition if expression is None else expression & condition
+        return self.dataset.to_table(columns=None if columns is None else list(columns), filter=expression)
+
+    def scan(self, columns=None, filters=None):
+        return self._table(columns, filters).to_pandas()
+
+    def take(self, positions, columns=None):
+        return self.dataset.take(pa.array(np.asarray(positions, dtype=np.int64)),
+                                 columns=None if columns is None else list(columns)).to_pandas()
+
+    def _group_counts(self, columns):
+        table = self._table(columns).group_by(columns).aggregate([(columns[0], 'count', pc.CountOptions(mode='all'))])
+        valid = pc.is_valid(table[columns[0]])
+        for column in columns[1:]:
+            valid = pc.and_(valid, pc.is_valid(table[column]))
+        return table.filter(valid)
+
+    def value_counts(self, column):
+        table = self._group_counts([column])
+        return _sorted_counts(table[column].to_pylist(), table[f'{column}_count'].to_numpy(), column)
+
+    def nunique(self, column):
+        return int(pc.count_distinct(self._table([column])[column], mode='only_valid').as_py())
+
+    def quantile(self, columns, quantiles):
+        table = self._table(columns)
+        return pd.DataFrame({column: pc.quantile(table[column], q=list(quantiles), interpolation='linear').to_numpy()
+                             for column in columns}, index=list(quantiles))
+
+    def mean(self, columns):
+        table = self._table(columns)
+        return pd.Series([pc.mean(table[column]).as_py() for column in columns], index=list(columns), dtype=np.float64)
+
+    def std(self, columns, ddof=1):
+        table = self._table(columns)
+        return pd.Series([pc.stddev(table[column], ddof=ddof).as_py() for column in columns], index=list(columns), dtype=np.float64)
+
+    def crosstab_counts(self, index_column, column_name):
+        table = self._group_counts([index_column, column_name])
+        return _counts_matrix(table[index_column].to_pylist(), table[column_name].to_pylist(), table[f'{index_column}_count'].to_numpy())
+
+
+def as_backend(data):
+    """
+    Returns the Backend for a pandas DataFrame, a Polars LazyFrame/DataFrame or a pyarrow Dataset/Table.
+    Polars and pyarrow are only imported when such an object is passed in.
+    """
+    if isinstance(data, Backend):
+        return data
+    if isinstance(data, pd.DataFrame):
+        return PandasBackend(data)
+    module = type(data).__module__.split('.')[0]
+    if module == 'polars':
+        return PolarsBackend(data)
+    if module == 'pyarrow':
+        return ArrowBackend(data)
+    raise TypeError(f'Unsupported data type {type(data).__name__}: expected a pandas DataFrame, '
+                    'a Polars LazyFrame/DataFrame or a pyarrow Dataset/Table')
+
+
+def _projected(func):
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # in-memory data, or already scanned by an outer call (e.g. Plotter.cached)
+        if self.data is not None:
+            return func(self, *args, **kwargs)
+        arguments = signature.bind_partial(self, *args, **kwargs).arguments
+        values = [value for name, value in arguments.items() if name != 'self']
+        columns = self.backend.referenced_columns(values) or self.backend.columns
+        self.data = self.backend.scan(columns, self.backend.top_n_filters(columns, arguments.get('top_n')))
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.data = None
+    return wrapper
+
+
+def project_columns(cls):
+    """
+    Class decorator for classes holding a lazy `backend` (with `data` set to None): every public method
+    runs on a pandas frame holding only the columns its arguments reference, and only the rows of the top_n
+    categories when a top_n argument is given. The frame is released when the method returns.
+    """
+    for attribute, value in list(vars(cls).items()):
+        if callable(value) and not isinstance(value, (staticmethod, classmethod, type)) and not attribute.startswith('_'):
+            setattr(cls, attribute, _projected(value))
+    return cls
+
+
+# Usage
+# plotter = Plotter(pl.scan_parquet('events/*.parquet'))         # nothing is read yet
+# plotter.countplot(column='city', top_n=10)                      # reads 'city' only, top 10 cities only
+# OutlierHandler(pads.dataset('events/', format='parquet')).fit(['price'], method='iqr')   # quantiles in Arrow
+# CrossTabAnalysis(pl.scan_parquet('events/*.parquet'), 'Gender', 'Product').get_full_dataframe()
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+
+class CategoryIndex:
+    def __init__(self, series):
+        """
+        Factorized view of a categorical column, built once and reused for every top_n filter.
+        Holds the integer codes (-1 for missing), the labels, per-category counts, the frequency ranking
+        and, on first use, the row positions of every category grouped by category.
+        Parameters:
+        - series (Series): Column to index. Categorical columns reuse their existing codes.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            self.codes = np.asarray(series.cat.codes)
+            self.labels = series.cat.categories
+        else:
+            self.codes, self.labels = pd.factorize(series)
+            self.labels = pd.Index(self.labels)
+        self.null_count = int(np.count_nonzero(self.codes < 0))
+        self.counts = np.bincount(self.codes[self.codes >= 0], minlength=len(self.labels))
+        # categories by descending frequency, ties in order of first appearance (like value_counts)
+        self.ranking = np.argsort(-self.counts, kind='stable')
+        self._order = None
+
+    @property
+    def nunique(self):
+        return int(np.count_nonzero(self.counts))
+
+    def value_counts(self, top_n=None):
+        """Returns counts by descending frequency, like Series.value_counts() (optionally the top_n only)."""
+        ranking = self.ranking[:self.nunique]
+        if top_n is not None:
+            ranking = ranking[:top_n]
+        return pd.Series(self.counts[ranking], index=self.labels[ranking], name='count')
+
+    def top_codes(self, top_n):
+        return self.ranking[:min(top_n, self.nunique)]
+
+    def top_labels(self, top_n):
+        """Returns the labels of the top_n most frequent categories."""
+        return self.labels[self.top_codes(top_n)]
+
+    def mask(self, codes):
+        """Boolean row mask of the given category codes, as one lookup-table gather on the row codes."""
+        lookup = np.zeros(len(self.labels) + 1, dtype=bool)
+        lookup[codes] = True
+        # missing values are coded -1 and hit the last, always False, entry
+        return lookup[self.codes]
+
+    def positions(self, codes):
+        """Sorted row positions of the given category codes, gathered from the per-category row lists."""
+        if self._order is None:
+            self._order = np.argsort(self.codes, kind='stable')
+            self._offsets = self.null_count + np.concatenate([[0], np.cumsum(self.counts)])
+        chunks = [self._order[self._offsets[code]:self._offsets[code + 1]] for code in codes]
+        return np.sort(np.concatenate(chunks)) if chunks else np.empty(0, dtype=np.int64)
+
+    def counts_with_other(self, top_n, other_label='Other'):
+        """Counts of the top_n categories plus one bucket with every other row (missing values included)."""
+        counts = self.value_counts(top_n)
+        other = len(self.codes) - int(counts.sum())
+        if other:
+            counts = pd.concat([counts, pd.Series([other], index=[other_label], name='count')])
+        return counts
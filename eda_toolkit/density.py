@@ -0,0 +1,224 @@
+import numpy as np
+import pandas as pd
+
+from ._lazy import plt, mcolors, mpatches
+
+
+def _range(values):
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return lo, hi
+
+
+def _bin_index(values, lo, hi, bins):
+    idx = ((values - lo) * (bins / (hi - lo))).astype(np.int64)
+    np.clip(idx, 0, bins - 1, out=idx)
+    return idx
+
+
+class DensityGrid:
+    def __init__(self, x, y, bins=200):
+        """
+        Bins two numeric arrays into a bins x bins grid with vectorized NumPy.
+        Rows where x or y is missing are dropped. The flat bin index of every remaining row is kept so that
+        per-bin aggregates of other columns (mean, category mode) reuse the same binning.
+        Parameters:
+        - x, y (array-like): Coordinates.
+        - bins (int): Number of bins along each axis.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        self.valid = np.isfinite(x) & np.isfinite(y)
+        x, y = x[self.valid], y[self.valid]
+        self.bins = bins
+        self.x_range = _range(x) if x.size else (0.0, 1.0)
+        self.y_range = _range(y) if y.size else (0.0, 1.0)
+        self.x_index = _bin_index(x, *self.x_range, bins)
+        self.y_index = _bin_index(y, *self.y_range, bins)
+        self.flat_index = self.y_index * bins + self.x_index
+        self.counts = np.bincount(self.flat_index, minlength=bins * bins).reshape(bins, bins)
+
+    @property
+    def extent(self):
+        return [self.x_range[0], self.x_range[1], self.y_range[0], self.y_range[1]]
+
+    def mean(self, values):
+        """Per-bin mean of another column (NaN in empty bins)."""
+        values = np.asarray(values, dtype=np.float64)[self.valid]
+        finite = np.isfinite(values)
+        sums = np.bincount(self.flat_index[finite], weights=values[finite], minlength=self.bins ** 2)
+        counts = np.bincount(self.flat_index[finite], minlength=self.bins ** 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (sums / counts).reshape(self.bins, self.bins)
+
+    def mode(self, codes, n_categories):
+        """Per-bin most frequent category code (-1 in empty bins) and per-category counts along x and y."""
+        codes = np.asarray(codes)[self.valid]
+        known = codes >= 0
+        per_bin = np.bincount(self.flat_index[known] * n_categories + codes[known],
+                              minlength=self.bins ** 2 * n_categories).reshape(self.bins ** 2, n_categories)
+        mode = np.where(per_bin.sum(axis=1) > 0, per_bin.argmax(axis=1), -1).reshape(self.bins, self.bins)
+        per_category = per_bin.reshape(self.bins, self.bins, n_categories)
+        return mode, per_category.sum(axis=0), per_category.sum(axis=1)
+
+
+def _category_colors(n_categories):
+    return plt.get_cmap('tab10' if n_categories <= 10 else 'tab20')(np.arange(n_categories) % 20)
+
+
+def draw_counts(ax, grid, cmap='viridis'):
+    """Shades each bin by its number of points (log scale)."""
+    counts = np.ma.masked_equal(grid.counts, 0)
+    image = ax.imshow(counts, origin='lower', extent=grid.extent, aspect='auto', cmap=cmap,
+                      norm=mcolors.LogNorm(vmin=1, vmax=max(int(grid.counts.max()), 2)), interpolation='nearest')
+    plt.colorbar(image, ax=ax, label='Count')
+    return image
+
+
+def draw_mean(ax, grid, values, label, cmap='viridis'):
+    """Shades each bin by the mean of `values` in it."""
+    means = np.ma.masked_invalid(grid.mean(values))
+    image = ax.imshow(means, origin='lower', extent=grid.extent, aspect='auto', cmap=cmap, interpolation='nearest')
+    plt.colorbar(image, ax=ax, label=f'Mean {label}')
+    return image
+
+
+def draw_mode(ax, grid, codes, labels):
+    """Colours each bin by its most frequent category and adds a legend."""
+    mode, _, _ = grid.mode(codes, len(labels))
+    colors = _category_colors(len(labels))
+    image = ax.imshow(np.ma.masked_less(mode, 0), origin='lower', extent=grid.extent, aspect='auto',
+                      cmap=mcolors.ListedColormap(colors), vmin=-0.5, vmax=len(labels) - 0.5, interpolation='nearest')
+    ax.legend(handles=[mpatches.Patch(color=colors[i], label=str(label)) for i, label in enumerate(labels)],
+              title='Most frequent', loc='best')
+    return image
+
+
+def density_jointplot(x, y, x_label, y_label, bins=200, codes=None, labels=None):
+    """
+    Draws a binned joint plot: density (or per-bin category mode) image with marginal histograms taken
+    from the same grid.
+    """
+    grid = DensityGrid(x, y, bins=bins)
+    fig = plt.figure(figsize=(8, 8))
+    layout = fig.add_gridspec(2, 2, width_ratios=(5, 1), height_ratios=(1, 5), wspace=0.05, hspace=0.05)
+    ax = fig.add_subplot(layout[1, 0])
+    ax_x = fig.add_subplot(layout[0, 0], sharex=ax)
+    ax_y = fig.add_subplot(layout[1, 1], sharey=ax)
+    x_edges = np.linspace(*grid.x_range, bins + 1)
+    y_edges = np.linspace(*grid.y_range, bins + 1)
+    if codes is None:
+        counts = np.ma.masked_equal(grid.counts, 0)
+        ax.imshow(counts, origin='lower', extent=grid.extent, aspect='auto', cmap='viridis',
+                  norm=mcolors.LogNorm(vmin=1, vmax=max(int(grid.counts.max()), 2)), interpolation='nearest')
+        ax_x.stairs(grid.counts.sum(axis=0), x_edges, fill=True)
+        ax_y.stairs(grid.counts.sum(axis=1), y_edges, fill=True, orientation='horizontal')
+    else:
+        draw_mode(ax, grid, codes, labels)
+        _, x_counts, y_counts = grid.mode(codes, len(labels))
+        for i, color in enumerate(_category_colors(len(labels))):
+            ax_x.stairs(x_counts[:, i], x_edges, color=color)
+            ax_y.stairs(y_counts[:, i], y_edges, color=color, orientation='horizontal')
+    ax_x.tick_params(labelbottom=False)
+    ax_y.tick_params(labelleft=False)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    return fig, ax
+
+
+class PairHistograms:
+    def __init__(self, data, x_vars, y_vars, hue_codes=None, n_hues=1, bins=64, chunksize=1_000_000):
+        """
+        Per-column 1D histograms and per-pair 2D histograms of numeric columns, optionally split by hue,
+        computed in one pass over row chunks.
+        In each chunk every column is binned once and each pair is one bincount over the combined
+        (hue, y bin, x bin) index, so the cost is O(rows x pairs) and memory is bounded by the chunk size
+        and the histograms (pairs x n_hues x bins^2 counters). A pair shared by x_vars and y_vars in both
+        orientations is counted once.
+        Parameters:
+        - data (DataFrame): Data.
+        - x_vars, y_vars (list): Numeric columns along the grid's x and y axes.
+        - hue_codes (array): Hue category code of every row (0 .. n_hues - 1, -1 to exclude the row).
+        - n_hues (int): Number of hue categories.
+        - bins (int): Bins along each axis.
+        - chunksize (int): Rows per chunk.
+        """
+        self.x_vars, self.y_vars = list(x_vars), list(y_vars)
+        self.columns = list(dict.fromkeys(self.x_vars + self.y_vars))
+        self.bins, self.n_hues = bins, n_hues
+        self.ranges = {}
+        for column in self.columns:
+            lo, hi = data[column].min(), data[column].max()
+            lo, hi = (0.0, 1.0) if pd.isna(lo) else (float(lo), float(hi))
+            self.ranges[column] = (lo - 0.5, hi + 0.5) if lo == hi else (lo, hi)
+        position = {column: i for i, column in enumerate(self.columns)}
+        self.pairs = sorted({tuple(sorted((x, y), key=position.get)) for x in self.x_vars for y in self.y_vars if x != y},
+                            key=lambda pair: (position[pair[0]], position[pair[1]]))
+        self.counts_1d = {column: np.zeros((n_hues, bins), dtype=np.int64) for column in self.columns}
+        self.counts_2d = {pair: np.zeros((n_hues, bins, bins), dtype=np.int64) for pair in self.pairs}
+        for start in range(0, len(data), chunksize):
+            stop = min(start + chunksize, len(data))
+            hue = np.zeros(stop - start, dtype=np.int64) if hue_codes is None else np.asarray(hue_codes[start:stop], dtype=np.int64)
+            index = {}
+            for column in self.columns:
+                values = data[column].iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+                column_index = _bin_index(np.nan_to_num(values), *self.ranges[column], bins)
+                # rows with a missing value or an excluded hue get -1 and are skipped below
+                column_index[~np.isfinite(values) | (hue < 0)] = -1
+                index[column] = column_index
+                valid = column_index >= 0
+                self.counts_1d[column] += np.bincount(hue[valid] * bins + column_index[valid], minlength=n_hues * bins).reshape(n_hues, bins)
+            for x, y in self.pairs:
+                valid = (index[x] >= 0) & (index[y] >= 0)
+                flat = (hue[valid] * bins + index[y][valid]) * bins + index[x][valid]
+                self.counts_2d[(x, y)] += np.bincount(flat, minlength=n_hues * bins * bins).reshape(n_hues, bins, bins)
+
+    def edges(self, column):
+        return np.linspace(*self.ranges[column], self.bins + 1)
+
+    def pair_counts(self, x, y):
+        """Returns the (n_hues, y bins, x bins) counts of the pair with x along the columns."""
+        if (x, y) in self.counts_2d:
+            return self.counts_2d[(x, y)]
+        return self.counts_2d[(y, x)].transpose(0, 2, 1)
+
+
+def density_pairplot(histograms, labels=None, hue=None):
+    """
+    Draws a pair grid from PairHistograms: histograms on the diagonal and density images elsewhere
+    (coloured by the most frequent hue per bin when split by hue). Returns the figure.
+    """
+    n_rows, n_cols = len(histograms.y_vars), len(histograms.x_vars)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(2.5 * n_cols, 2.5 * n_rows), squeeze=False)
+    colors = _category_colors(histograms.n_hues)
+    for row, y in enumerate(histograms.y_vars):
+        for col, x in enumerate(histograms.x_vars):
+            ax = axes[row, col]
+            if x == y:
+                for i in range(histograms.n_hues):
+                    ax.stairs(histograms.counts_1d[x][i], histograms.edges(x), color=colors[i], fill=labels is None)
+            else:
+                counts = histograms.pair_counts(x, y)
+                extent = [*histograms.ranges[x], *histograms.ranges[y]]
+                total = counts.sum(axis=0)
+                if labels is None:
+                    ax.imshow(np.ma.masked_equal(total, 0), origin='lower', extent=extent, aspect='auto', cmap='viridis',
+                              norm=mcolors.LogNorm(vmin=1, vmax=max(int(total.max()), 2)), interpolation='nearest')
+                else:
+                    mode = np.where(total > 0, counts.argmax(axis=0), -1)
+                    ax.imshow(np.ma.masked_less(mode, 0), origin='lower', extent=extent, aspect='auto',
+                              cmap=mcolors.ListedColormap(colors), vmin=-0.5, vmax=histograms.n_hues - 0.5, interpolation='nearest')
+            if row == n_rows - 1:
+                ax.set_xlabel(x)
+            else:
+                ax.tick_params(labelbottom=False)
+            if col == 0:
+                ax.set_ylabel(y)
+            else:
+                ax.tick_params(labelleft=False)
+    if labels is not None:
+        fig.legend(handles=[mpatches.Patch(color=colors[i], label=str(label)) for i, label in enumerate(labels)],
+                   title=hue, loc='center right')
+    fig.tight_layout(rect=(0, 0, 0.9 if labels is not None else 1, 1))
+    return fig
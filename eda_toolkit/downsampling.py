@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+
+def _numeric_axis(values):
+    """Returns x as float64 and a function converting float64 positions back to the original x type."""
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        timezone = getattr(values.dtype, 'tz', None)
+        numeric = values.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+        # NaT becomes the minimum int64, not NaN
+        numeric[values.isna().to_numpy()] = np.nan
+
+        def to_original(positions):
+            converted = pd.to_datetime(np.asarray(positions, dtype=np.int64), unit='ns')
+            return converted.tz_localize('UTC').tz_convert(timezone) if timezone is not None else converted
+        return numeric, to_original
+    return values.to_numpy(dtype=np.float64, na_value=np.nan), lambda positions: positions
+
+
+def _limit_value(value, like_datetime):
+    if value is None:
+        return None
+    return float(pd.Timestamp(value).value) if like_datetime else float(value)
+
+
+def sorted_visible_range(x, y, xlimit=None):
+    """
+    Sorts the points by x (skipped when x is already sorted), drops missing values and keeps only the
+    points inside xlimit, found with a binary search on the sorted x.
+    Returns (x, y, to_original) with x as float64 and to_original converting x positions back.
+    Parameters:
+    - x, y (array-like): Coordinates.
+    - xlimit (dict): Dictionary with 'left' and 'right' keys (either may be None).
+    """
+    like_datetime = pd.api.types.is_datetime64_any_dtype(pd.Series(x).dtype)
+    x, to_original = _numeric_axis(x)
+    y = np.asarray(y, dtype=np.float64)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    if not valid.all():
+        x, y = x[valid], y[valid]
+    if x.size > 1 and not (np.diff(x) >= 0).all():
+        order = np.argsort(x, kind='stable')
+        x, y = x[order], y[order]
+    if xlimit:
+        left = _limit_value(xlimit.get('left'), like_datetime)
+        right = _limit_value(xlimit.get('right'), like_datetime)
+        start = np.searchsorted(x, left, side='left') if left is not None else 0
+        stop = np.searchsorted(x, right, side='right') if right is not None else x.size
+        x, y = x[start:stop], y[start:stop]
+    return x, y, to_original
+
+
+def bucket_envelope(x, y, n_buckets=1000):
+    """
+    Aggregates sorted points into equal-width x buckets.
+    Returns a DataFrame with one row per non-empty bucket: 'x' (bucket mean x), 'mean', 'min', 'max', 'count'.
+    """
+    if x.size == 0:
+        return pd.DataFrame(columns=['x', 'mean', 'min', 'max', 'count'])
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)
+    starts = np.unique(np.searchsorted(x, edges[:-1], side='left'))
+    starts = starts[starts < x.size]
+    counts = np.diff(np.append(starts, x.size))
+    return pd.DataFrame({
+        'x': np.add.reduceat(x, starts) / counts,
+        'mean': np.add.reduceat(y, starts) / counts,
+        'min': np.minimum.reduceat(y, starts),
+        'max': np.maximum.reduceat(y, starts),
+        'count': counts,
+    })
+
+
+def lttb(x, y, n_out=2000):
+    """
+    Largest-Triangle-Three-Buckets downsampling of sorted points to n_out points.
+    Keeps the first and last point and, in each bucket, the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket. Returns (x, y).
+    """
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[stop:next_stop].mean() if next_stop > stop else x[-1]
+        next_y = y[stop:next_stop].mean() if next_stop > stop else y[-1]
+        px, py = x[previous], y[previous]
+        areas = np.abs((px - next_x) * (y[start:stop] - py) - (px - x[start:stop]) * (next_y - py))
+        previous = start + int(areas.argmax())
+        selected[i + 1] = previous
+    return x[selected], y[selected]
@@ -0,0 +1,918 @@
+import numpy as np
+import pandas as pd
+
+from ._lazy import plt, sns, display
+from .profiling import profile_dataframe
+from .incremental import IncrementalProfiler
+from .sketches import HyperLogLog, SpaceSaving
+from .density import DensityGrid, PairHistograms, draw_counts, draw_mean, draw_mode, density_jointplot, density_pairplot
+from .downsampling import sorted_visible_range, bucket_envelope, lttb
+from .univariate import UnivariateSummary, is_numeric_column
+from .category_index import CategoryIndex
+from .group_summary import GroupSummary, draw_grouped_boxes, draw_mean_bars
+from .correlation import numeric_columns, correlation_matrix, top_correlations
+from .instrumentation import instrument_class, mark_phase, record_error, record_rows
+from .stats_cache import StatsCache, column_fingerprint
+from .plot_cache import plot_columns, plot_key, capture_figure, show_image
+from .backends import as_backend, project_columns
+from .ingest import compact_dataframe
+from .sampling import draw_sample, BackgroundRefinement, preview_countplot, preview_pieplot, preview_histogram, preview_kdeplot, preview_boxplot
+from . import report
+
+
+def basic_eda(data, head_rows=5, approximate=False, incremental_state=None, preview=None, strata=None, refine=False):
+  """
+  Prints head, shape, unique values, non-null counts/datatypes and numerical description of the data.
+  The statistics come from a single profiling pass (see profiling.profile_dataframe) and the caller's
+  DataFrame is not modified; duplicate rows are counted instead of dropped.
+  Parameters:
+  - data (DataFrame): pandas DataFrame to analyse.
+  - head_rows (int): Number of leading rows to show.
+  - approximate (bool): Use sketches for distinct counts and quartiles (see profiling.profile_dataframe).
+  - incremental_state (str): Path of an IncrementalProfiler state for append-only tables. Only the rows
+    appended since the previous call are profiled, quartiles are histogram approximations, duplicate rows
+    are not counted, and a drift summary of the new rows against the history is shown.
+  - preview (int): Profile a sample of this many rows instead of the whole data (see sampling.Sample):
+    counts, means and quartiles are population estimates shown with their confidence intervals.
+  - strata (list): Categorical columns to stratify the preview sample on, so rare categories are kept
+    (a uniform reservoir sample otherwise).
+  - refine (bool): With preview, keep refining on a background thread toward the exact profile; the
+    BackgroundRefinement is returned instead (its `latest` report, or `wait()` for the exact one).
+  Returns:
+  - ProfileReport that can be rendered again or serialized with to_dict()/to_json().
+  """
+  if preview and refine:
+    refinement = BackgroundRefinement(data, start_rows = preview, strata = strata)
+    refinement.first()[1].render()
+    return refinement
+  if preview:
+    profile = draw_sample(data, preview, strata = strata).profile(head = data.head(head_rows) if head_rows else None)
+    profile.render()
+    return profile
+  if incremental_state is not None:
+    profiler = IncrementalProfiler.open(incremental_state, approximate=approximate)
+    drift = profiler.refresh(data)
+    profile = profiler.report()
+    profile.head = data.head(head_rows)
+    profile.render()
+    if drift is not None:
+      print('Drift of new rows against history')
+      display(drift)
+    return profile
+  profile = profile_dataframe(data, head_rows=head_rows, approximate=approximate)
+  profile.render()
+  return profile
+
+
+
+# Improvements: Add subplots functionality,
+#               Option to select top/bottom n or given list of categories for categorical features analysis,
+#               Exception handling
+@instrument_class
+@project_columns
+class Plotter:
+    def __init__(self, data, approximate = False, aggregate_threshold = 1_000_000, density_bins = 200, stats_cache = None, plot_cache = None):
+        """
+        Initializes the Plotter object.
+        Parameters:
+        - data (DataFrame): pandas DataFrame containing the data for plotting, or a Polars LazyFrame or pyarrow
+          Dataset (see backends.py): each plot then scans only the columns it uses (and the top_n categories'
+          rows), while unique counts and category counts are aggregated in that engine.
+        - approximate (bool): Use sketches (HyperLogLog, Space-Saving) instead of exact nunique/value_counts
+          for the top_n filters. Recommended for high-cardinality columns on large data.
+        - aggregate_threshold (int): Above this many rows, scatter and joint plots are drawn from binned
+          aggregates instead of individual points (see the `density` argument of those methods).
+        - density_bins (int): Grid size along each axis for binned scatter and joint plots.
+        - stats_cache (StatsCache): Cache of per-column statistics, shareable between objects working on the
+          same data (a private one is created if not given).
+        - plot_cache (PlotCache): Optional on-disk cache of rendered plots (see `cached`); it also backs the
+          private statistics cache.
+        """
+        self.backend = as_backend(data)
+        # lazy sources are scanned per call by project_columns
+        self.data = data if self.backend.in_memory else None
+        self.approximate = approximate
+        self.aggregate_threshold = aggregate_threshold
+        self.density_bins = density_bins
+        self.plot_cache = plot_cache
+        self.stats_cache = stats_cache if stats_cache is not None else StatsCache(store = plot_cache)
+
+    @property
+    def settings(self):
+        """Plotter options that change the rendered output (part of the plot cache key)."""
+        return (self.approximate, self.aggregate_threshold, self.density_bins)
+
+    def cached(self, method, dpi = 100, **kwargs):
+        """
+        Draws a plot through the plot cache: when the input columns and arguments are unchanged the stored
+        image is displayed without recomputing anything, otherwise the plot is drawn and its image stored.
+        Parameters:
+        - method (str): Plotter method name, e.g. 'countplot'.
+        - dpi (int): Resolution of the stored image.
+        - **kwargs: Arguments of the method.
+        """
+        if self.plot_cache is None:
+          return getattr(self, method)(**kwargs)
+        try:
+          fingerprints = [column_fingerprint(self.data[column]) for column in plot_columns(self.data, kwargs)]
+          key = plot_key(fingerprints, method, kwargs, self.settings + (dpi,))
+          path = self.plot_cache.get_image(key)
+          if path is not None:
+            show_image(path)
+            return
+          with capture_figure(dpi = dpi) as images:
+            getattr(self, method)(**kwargs)
+          if images:
+            self.plot_cache.put_image(key, images[-1])
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def _use_density(self, density, data):
+        """Whether to draw binned aggregates: the explicit `density` choice, else the row-count threshold."""
+        return density if density is not None else len(data) > self.aggregate_threshold
+
+    def _use_binned(self, binned, column):
+        """Whether to draw a univariate plot from the shared UnivariateSummary instead of raw rows."""
+        if binned is None:
+          binned = len(self.data) > self.aggregate_threshold
+        return binned and is_numeric_column(self.data[column])
+
+    def univariate_summary(self, column):
+        """
+        Returns the UnivariateSummary of a numeric column, computed once and shared by the binned
+        histogram, kdeplot and boxplot.
+        """
+        return self.stats_cache.get_or_compute(self.data, column, 'univariate_summary', lambda: UnivariateSummary(self.data[column]))
+
+    def category_index(self, column):
+        """
+        Returns the CategoryIndex of a column (codes, frequency ranking, row positions per category),
+        built on first use and reused by every top_n filter on that column.
+        """
+        return self.stats_cache.get_or_compute(self.data, column, 'category_index', lambda: CategoryIndex(self.data[column]), persist = False)
+
+    def _nunique(self, column):
+        """Returns the number of unique values of a column (an estimate with its error in approximate mode)."""
+        if not self.backend.in_memory:
+          return self.backend.nunique(column)
+        if self.approximate:
+          sketch = self.stats_cache.get_or_compute(self.data, column, 'hyperloglog', lambda: HyperLogLog().update(self.data[column]))
+          return f'~{round(sketch.estimate())} (±{sketch.relative_error:.1%})'
+        return self.category_index(column).nunique
+
+    def _top_n_values(self, column, top_n):
+        """Returns the top_n most frequent values of a column."""
+        if self.approximate:
+          top = self._approximate_top(column, top_n)
+          print(f'Approximate top {top_n} counts of {column} (true count is within [count - error, count]):')
+          print(top.to_string())
+          return top.index
+        return self.category_index(column).top_labels(top_n)
+
+    def _approximate_top(self, column, top_n):
+        capacity = max(1000, 10 * top_n)
+        sketch = self.stats_cache.get_or_compute(self.data, column, 'space_saving', lambda: SpaceSaving(capacity = capacity).update(self.data[column]), params = (capacity,))
+        return sketch.top(top_n)
+
+    def _top_n_frame(self, top_n, *columns):
+        """
+        Returns the rows whose value in each given column is among that column's top_n categories.
+        With category indexes this is an integer gather of row positions, without rehashing the values.
+        """
+        if self.approximate:
+          mask = np.ones(len(self.data), dtype=bool)
+          for column in columns:
+            mask &= self.data[column].isin(self._top_n_values(column, top_n)).to_numpy()
+          record_rows(mask.sum())
+          return self.data[mask]
+        indexes = [self.category_index(column) for column in columns]
+        if len(indexes) == 1:
+          subset = self.data.iloc[indexes[0].positions(indexes[0].top_codes(top_n))]
+        else:
+          mask = indexes[0].mask(indexes[0].top_codes(top_n))
+          for index in indexes[1:]:
+            mask &= index.mask(index.top_codes(top_n))
+          subset = self.data.iloc[np.flatnonzero(mask)]
+        # categorical columns would otherwise keep the filtered-out categories on the plot axes
+        for column in columns:
+          if isinstance(subset[column].dtype, pd.CategoricalDtype):
+            subset = subset.assign(**{column: subset[column].cat.remove_unused_categories()})
+        record_rows(len(subset))
+        return subset
+
+    def _category_counts(self, column, top_n = None):
+        """Returns value counts of a column; with top_n, the top_n categories plus an 'Other' bucket."""
+        if not self.backend.in_memory:
+          counts = self.backend.value_counts(column)
+          if not top_n:
+            return counts
+          counts = counts[:top_n]
+          other = self.backend.num_rows() - int(counts.sum())
+          return pd.concat([counts, pd.Series([other], index=['Other'], name='count')]) if other > 0 else counts
+        if self.approximate and top_n:
+          counts = self._approximate_top(column, top_n)['count']
+          other = len(self.data) - int(counts.sum())
+          return pd.concat([counts, pd.Series([other], index=['Other'])]) if other > 0 else counts
+        index = self.category_index(column)
+        return index.counts_with_other(top_n) if top_n else index.value_counts()
+
+    def _use_summary(self, summarized):
+        """Whether to draw box and bar plots from a GroupSummary instead of handing raw rows to seaborn."""
+        return summarized if summarized is not None else len(self.data) > self.aggregate_threshold
+
+    def _group_codes(self, column, top_n = None):
+        """
+        Returns (codes, labels) of a categorical column for GroupSummary: the kept categories (top_n or all),
+        in seaborn's order (order of appearance, or category order), coded 0..k-1 and every other row -1.
+        """
+        index = self.category_index(column)
+        kept = np.sort(index.top_codes(top_n) if top_n else index.ranking[:index.nunique])
+        lookup = np.full(len(index.labels) + 1, -1)
+        lookup[kept] = np.arange(len(kept))
+        return lookup[index.codes], list(index.labels[kept])
+#data[data.source_name.isin(data['source_name'].value_counts(ascending = False).reset_index()['source_name'][:10])]
+    def countplot(self, column, title=None, color= None, fontsize = None, bar_label = False, top_n = None):
+        """
+        Creates a count plot for a specified column.
+        Usage - Univariate categorical analysis
+        If so many categories, recommended to filter for top few categories data only
+        Parameters:
+        - column (str): Name of the column to plot.
+        - title (str): Title for the plot.
+        """
+        try:
+          plt.figure(figsize=(10, 6))
+          if top_n:
+            print('Total unique values: ', self._nunique(column))
+            top_n_category_df = self._top_n_frame(top_n, column)
+          else:
+            top_n_category_df = self.data
+          order = top_n_category_df[column].value_counts().index if self.approximate else self.category_index(column).value_counts(top_n).index
+          mark_phase('render')
+          ax=sns.countplot(data=top_n_category_df, x=column, order=order, color=color if color else 'cornflowerblue')
+          if bar_label:
+            ax.bar_label(ax.containers[0])
+          plt.title(title if title else f'Count Plot of {column}')
+          plt.xlabel(column)
+          plt.ylabel('Count')
+          plt.xticks(rotation = 90, fontsize = fontsize)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def pieplot(self, column, title=None, startangle = 90, top_n = None):
+        """
+        Creates a pie plot for a specified column.
+        Usage - Univariate categorical analysis
+        If so many categories, recommended to filter for top few categories data only
+        Parameters:
+        - column (str): Name of the column to plot.
+        - title (str): Title for the plot.
+        """
+        try:
+          if top_n:
+            print('Total unique values: ', self._nunique(column))
+          counts = self._category_counts(column, top_n)
+          mark_phase('render')
+          plt.figure(figsize=(10, 6))
+          counts.plot(kind='pie', autopct='%1.1f%%', startangle = startangle, shadow = False, wedgeprops={'edgecolor': 'black', 'linewidth':0.5})
+          plt.title(title if title else f'Pie Plot of {column}')
+          plt.ylabel('')
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def histogram(self, column, bins=30, use_bins = False, title=None, kde = False, binned = None):
+        """
+        Creates a histogram for a specified column.
+        Usage - Univariate numerical analysis
+        Parameters:
+        - column (str): Name of the column to plot.
+        - bins (int): Number of bins for the histogram.
+        - use_bins (Bool): if bins are to be used(use for numerical data, recommended not to use for number categorical data like year)
+        - color (str): Color of the histogram bars.
+        - title (str): Title for the plot.
+        - kde (Bool) : Whether to include a kernel density estimate (KDE) plot.
+        - binned (Bool): Re-bin the column's shared fine histogram instead of passing raw rows to seaborn
+          (default: above aggregate_threshold rows).
+        """
+        try:
+          plt.figure(figsize=(10, 6))
+          if self._use_binned(binned, column):
+            summary = self.univariate_summary(column)
+            counts, edges = summary.histogram(bins if use_bins else None)
+            mark_phase('render')
+            plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='cornflowerblue', edgecolor='white', alpha=0.75)
+            if kde:
+              grid, density = summary.kde()
+              plt.plot(grid, density * summary.n * np.diff(edges).mean())
+          elif use_bins:
+            mark_phase('render')
+            sns.histplot(self.data[column], bins=bins, kde=kde)
+          else:
+            mark_phase('render')
+            sns.histplot(self.data[column],  kde=kde)
+          plt.title(title if title else f'Histogram of {column}')
+          plt.xlabel(column)
+          plt.ylabel('Frequency')
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def kdeplot(self, column, title=None, binned = None):
+        """
+        Creates a kernel density plot for a specified column.
+        Usage - Univariate numerical analysis
+        Parameters:
+        - column (str): Name of the column to plot.
+        - title (str): Title for the plot.
+        - binned (Bool): Compute the KDE as an FFT convolution of the column's shared fine histogram
+          (default: above aggregate_threshold rows).
+        """
+        try:
+          plt.figure(figsize=(10, 6))
+          if self._use_binned(binned, column):
+            grid, density = self.univariate_summary(column).kde()
+            mark_phase('render')
+            line = plt.plot(grid, density)[0]
+            plt.fill_between(grid, density, color=line.get_color(), alpha=0.25)
+          else:
+            mark_phase('render')
+            sns.kdeplot(self.data[column], fill=True)
+          plt.title(title if title else f'Kernel Density Plot of {column}')
+          plt.xlabel(column)
+          plt.ylabel('Density')
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def boxplot(self, column, title=None, binned = None):
+        """
+        Creates a box plot for a specified column.
+        Usage - Univariate numerical analysis
+        Parameters:
+        - column (str): Name of the column to plot.
+        - title (str): Title for the plot.
+        - binned (Bool): Draw from the column's shared summary (quartiles, whiskers, sampled outliers)
+          instead of raw rows (default: above aggregate_threshold rows).
+        """
+        try:
+          plt.figure(figsize=(8, 6))
+          if self._use_binned(binned, column):
+            stats = self.univariate_summary(column).box_stats(label='')
+            mark_phase('render')
+            plt.gca().bxp([stats], patch_artist=True,
+                          boxprops={'facecolor': 'cornflowerblue'}, medianprops={'color': 'black'})
+          else:
+            mark_phase('render')
+            sns.boxplot(y = self.data[column])
+          plt.title(title if title else f'Boxplot of {column}')
+          plt.ylabel(column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def lineplot(self, x_column, y_column, title=None, color = None, xlimit=None,ylimit=None, downsample = None, n_points = 2000):
+        """
+        Creates a line plot between two specified columns.
+        Usage - Bivariate numerical-numerical analysis(One numerical column like 'year')
+        Parameters:
+        - x_column (str): Name of the column for the x-axis.
+        - y_column (str): Name of the column for the y-axis.
+        - title (str): Title for the plot.
+        - xlimit (dict): Dictionary with 'left' and 'right' keys for x-axis limits.
+        - ylimit (dict): Dictionary with 'left' and 'right' keys for y-axis limits.
+        - color (str): Color of the line plot.
+        - downsample (str): 'envelope' draws the per-bucket mean with a min/max band, 'lttb' keeps n_points
+          points with Largest-Triangle-Three-Buckets, False draws every point with seaborn.
+          Default: 'envelope' above aggregate_threshold rows. Only the points inside xlimit are processed.
+        - n_points (int): Number of buckets (envelope) or points kept (lttb), roughly the plot width in pixels.
+        """
+        try:
+          plt.figure(figsize=(10, 6))
+          if downsample is None:
+            downsample = 'envelope' if len(self.data) > self.aggregate_threshold else False
+          if downsample:
+            x, y, to_original = sorted_visible_range(self.data[x_column], self.data[y_column], xlimit = xlimit)
+            record_rows(x.size)
+            if downsample == 'lttb':
+              x, y = lttb(x, y, n_out = n_points)
+              mark_phase('render')
+              plt.plot(to_original(x), y, color = color)
+            elif downsample == 'envelope':
+              envelope = bucket_envelope(x, y, n_buckets = n_points)
+              mark_phase('render')
+              x = to_original(envelope['x'].to_numpy())
+              line = plt.plot(x, envelope['mean'], color = color)[0]
+              plt.fill_between(x, envelope['min'], envelope['max'], color = line.get_color(), alpha = 0.2, linewidth = 0)
+            else:
+              raise ValueError(f"Unknown downsample '{downsample}', expected 'envelope' or 'lttb'")
+          else:
+            mark_phase('render')
+            sns.lineplot(data=self.data, x=x_column, y=y_column, color = color)
+          if xlimit:
+            plt.xlim(left = xlimit['left'], right = xlimit['right'])
+          if ylimit:
+            plt.ylim(left = ylimit['left'], right = ylimit['right'])
+          plt.title(title if title else f'Line Plot of {x_column} vs {y_column}')
+          plt.xlabel(x_column)
+          plt.ylabel(y_column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def scatterplot(self, x_column, y_column,  title=None, density = None):
+        """
+        Creates a scatter plot between two specified columns.
+        Usage - Bivariate numerical-numerical analysis
+        Parameters:
+        - x_column (str): Name of the column for the x-axis.
+        - y_column (str): Name of the column for the y-axis.
+        - title (str): Title for the plot.
+        - density (bool): Draw a binned density image instead of points (default: above aggregate_threshold rows).
+        """
+        try:
+          plt.figure(figsize=(10, 6))
+          if self._use_density(density, self.data):
+            grid = DensityGrid(self.data[x_column], self.data[y_column], bins = self.density_bins)
+            mark_phase('render')
+            draw_counts(plt.gca(), grid)
+          else:
+            mark_phase('render')
+            sns.scatterplot(data=self.data, x=x_column, y=y_column)
+          plt.title(title if title else f'Scatterplot of {x_column} vs {y_column}')
+          plt.xlabel(x_column)
+          plt.ylabel(y_column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def dodgedcountplot(self, x_column, hue,  title=None, top_n = None):
+        """
+        Creates a dodged countplotplot between two specified columns.
+        Usage - Bivariate categorical-categorical analysis
+        If so many categories, recommended to filter for top few categories data only
+        Parameters:
+        - x_column (str): Name of the column for the x-axis.
+        - hue (str): Column name to be used for color coding.
+        - title (str): Title for the plot.
+        """
+        try:
+          if top_n:
+            print(f'Total unique values for {x_column} is {self._nunique(x_column)} and {hue} is {self._nunique(hue)}')
+            top_n_category_df = self._top_n_frame(top_n, x_column, hue)
+          else:
+            top_n_category_df = self.data
+          plt.figure(figsize=(10, 6))
+          mark_phase('render')
+          sns.countplot(data=top_n_category_df, x=x_column, hue=hue)
+          plt.title(title if title else f'barplot distribution of {hue} for {x_column}')
+          plt.ylabel('Count')
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def stackedcountplot(self, x_column, hue,  title=None, top_n = None):
+        """
+        Creates a stacked countplot between two specified columns.
+        Usage - Bivariate categorical-categorical analysis
+        If so many categories, recommended to filter for top few categories data only
+        Parameters:
+        - x_column (str): Name of the column for the x-axis.
+        - hue (str): Column name to be used for color coding.
+        - title (str): Title for the plot.
+        """
+        try:
+          if top_n:
+            print(f'Total unique values for {x_column} is {self._nunique(x_column)} and {hue} is {self._nunique(hue)}')
+            top_n_category_df = self._top_n_frame(top_n, x_column, hue)
+          else:
+            top_n_category_df = self.data
+          plt.figure(figsize=(10, 6))
+          data = pd.crosstab(index=top_n_category_df[x_column], columns=top_n_category_df[hue])
+          mark_phase('render')
+          data.plot(kind='bar', stacked=True, figsize=(10, 6))
+          plt.title(title if title else f'barplot distribution of {hue} for {x_column}')
+          plt.xticks(rotation=90)
+          plt.legend()
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def bivariateboxplot(self, categorical_column, numerical_column, title=None, rotate_xaxis_ticks = False, top_n = None, summarized = None):
+        """
+        Creates a boxplot between two specified columns.
+        Usage - Bivariate categorical-numerical
+        If so many categories, recommended to filter for top few categories data only
+        Parameters:
+        - categorical_column (str): Name of the column for the x-axis.
+        - numerical_column (str): Name of the column for the y-axis.
+        - title (str): Title for the plot.
+        - rotate_xaxis_ticks (bool): Whether to rotate x-axis ticks for better readability.
+        - summarized (bool): Draw from per-group quartiles computed in one pass over the category codes
+          (see group_summary.GroupSummary) instead of raw rows (default: above aggregate_threshold rows).
+        """
+        try:
+          if top_n:
+            print(f'Total unique values for {categorical_column} is {self._nunique(categorical_column)}')
+          if self._use_summary(summarized):
+            codes, labels = self._group_codes(categorical_column, top_n)
+            summary = GroupSummary(self.data[numerical_column], codes, labels)
+            mark_phase('render')
+            draw_grouped_boxes(plt.gca(), summary, labels)
+          else:
+            top_n_category_df = self._top_n_frame(top_n, categorical_column) if top_n else self.data
+            mark_phase('render')
+            sns.boxplot(data=top_n_category_df, x=categorical_column, y=numerical_column)
+          plt.title(title if title else f'Boxplot of {numerical_column} for {categorical_column}')
+          if rotate_xaxis_ticks:
+            plt.xticks(rotation=90)
+          plt.xlabel(categorical_column)
+          plt.ylabel(numerical_column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def bivariatebarplot(self, categorical_column, numerical_column, title=None, rotate_xaxis_ticks = False, top_n = None, summarized = None, ci = 'analytic'):
+        """
+        Creates a boxplot between two specified columns.
+        Usage - Bivariate categorical-numerical
+        If so many categories, recommended to filter for top few categories data only
+        Parameters:
+        - categorical_column (str): Name of the column for the x-axis.
+        - numerical_column (str): Name of the column for the y-axis.
+        - title (str): Title for the plot.
+        - summarized (bool): Draw group means and 95% confidence intervals from a GroupSummary instead of
+          seaborn's per-row bootstrap (default: above aggregate_threshold rows).
+        - ci (str): Interval of the summarized plot, 'analytic' or 'bootstrap' (vectorized).
+        """
+        try:
+          if top_n:
+            print(f'Total unique values for {categorical_column} is {self._nunique(categorical_column)}')
+          if self._use_summary(summarized):
+            codes, labels = self._group_codes(categorical_column, top_n)
+            summary = GroupSummary(self.data[numerical_column], codes, labels, ci = ci)
+            mark_phase('render')
+            draw_mean_bars(plt.gca(), summary, labels)
+          else:
+            top_n_category_df = self._top_n_frame(top_n, categorical_column) if top_n else self.data
+            mark_phase('render')
+            sns.barplot(data=top_n_category_df, x=categorical_column, y=numerical_column, estimator=np.mean)
+          plt.title(title if title else f'Barplot of {numerical_column} for {categorical_column}')
+          if rotate_xaxis_ticks:
+            plt.xticks(rotation=90)
+          plt.xlabel(categorical_column)
+          plt.ylabel(numerical_column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def jointplot(self, x_column, y_column, title=None, density = None):
+        """
+        Creates a joint plot between two specified columns.
+        Usage - Bivariate numerical-numerical analysis
+        Parameters:
+        - x_column (str): Name of the column for the x-axis.
+        - y_column (str): Name of the column for the y-axis.
+        - title (str): Title for the plot.
+        - density (bool): Draw a binned density image with marginal histograms instead of a regression
+          scatter (default: above aggregate_threshold rows).
+        """
+        try:
+          if self._use_density(density, self.data):
+            mark_phase('render')
+            density_jointplot(self.data[x_column], self.data[y_column], x_column, y_column, bins = self.density_bins)
+          else:
+            mark_phase('render')
+            sns.jointplot(data=self.data, x=x_column, y=y_column, kind='reg')
+          plt.title(title if title else f'Joint Plot of {x_column} vs {y_column}')
+          plt.xlabel(x_column)
+          plt.ylabel(y_column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def trivariatescatterplot_CNN(self, numerical_column1, numerical_column2, categorical_column, title=None, top_n = None, density = None):
+        """
+        Creates a scatter plot between two specified columns.
+        Usage - Trivariate CNN analysis
+        Parameters:
+        - numerical_column1 (str): Name of the column for the x-axis.
+        - numerical_column2 (str): Name of the column for the y-axis.
+        - categorical_column (str): Column name to be used for color coding.
+        - title (str): Title for the plot.
+        - density (bool): Colour a binned grid by the most frequent category per bin instead of drawing
+          points (default: above aggregate_threshold rows).
+        """
+        try:
+          if top_n:
+            print(f'Total unique values for {categorical_column} is {self._nunique(categorical_column)}')
+            top_n_category_df = self._top_n_frame(top_n, categorical_column)
+          else:
+            top_n_category_df = self.data
+          plt.figure(figsize=(10, 6))
+          if self._use_density(density, top_n_category_df):
+            codes, labels = pd.factorize(top_n_category_df[categorical_column])
+            grid = DensityGrid(top_n_category_df[numerical_column1], top_n_category_df[numerical_column2], bins = self.density_bins)
+            mark_phase('render')
+            draw_mode(plt.gca(), grid, codes, list(labels))
+          else:
+            mark_phase('render')
+            sns.scatterplot(data=top_n_category_df, x=numerical_column1, y=numerical_column2, hue=categorical_column)
+          plt.title(title if title else f'Scatter plot of {numerical_column1} vs {numerical_column2} for {categorical_column}')
+          plt.xlabel(numerical_column1)
+          plt.ylabel(numerical_column2)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def trivariateboxplot(self, categorical_column1, categorical_column2, numerical_column, title=None, rotate_xaxis_ticks = False, top_n = None, summarized = None):
+        """
+        Creates a boxplot between two specified columns.
+        Usage - Trivariate CCN analysis
+        If so many categories, recommended to filter for top few categories data only
+        Parameters:
+        - categorical_column1 (str): Name of the column for the x-axis.
+        - categorical_column2 (str): Name of the column for the x-axis.
+        - numerical_column (str): Name of the column for the y-axis.
+        - title (str): Title for the plot.
+        - rotate_xaxis_ticks (bool): Whether to rotate x-axis ticks for better readability.
+        - summarized (bool): Draw from per-(category1, category2) quartiles computed in one pass over the
+          category codes instead of raw rows (default: above aggregate_threshold rows).
+        """
+        try:
+          if top_n:
+            print(f'Total unique values for {categorical_column1} is {self._nunique(categorical_column1)} and {categorical_column2} is {self._nunique(categorical_column2)}')
+          plt.figure(figsize=(12,8))
+          if self._use_summary(summarized):
+            codes1, labels1 = self._group_codes(categorical_column1, top_n)
+            codes2, labels2 = self._group_codes(categorical_column2, top_n)
+            codes = np.where((codes1 >= 0) & (codes2 >= 0), codes1 * len(labels2) + codes2, -1)
+            labels = [(label1, label2) for label1 in labels1 for label2 in labels2]
+            summary = GroupSummary(self.data[numerical_column], codes, labels)
+            mark_phase('render')
+            draw_grouped_boxes(plt.gca(), summary, labels1, hue_labels = labels2)
+            plt.gca().get_legend().set_title(categorical_column2)
+          else:
+            top_n_category_df = self._top_n_frame(top_n, categorical_column1, categorical_column2) if top_n else self.data
+            mark_phase('render')
+            sns.boxplot(x=categorical_column1,y=numerical_column,hue=categorical_column2,data=top_n_category_df)
+          plt.title(title if title else f'Boxplot of {numerical_column} for {categorical_column1} and {categorical_column2}')
+          if rotate_xaxis_ticks:
+            plt.xticks(rotation=90)
+          plt.xlabel(categorical_column1)
+          plt.ylabel(numerical_column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    #improvements : add sizes range functionality
+    def trivariatescatterplot_NNN(self, x_column, y_column, size, title=None, density = None):
+        """
+        Creates a scatter plot between two specified columns.
+        Usage - Trivariate NNN analysis
+        Parameters:
+        - x_column (str): Name of the column for the x-axis.
+        - y_column (str): Name of the column for the y-axis.
+        - size (str): Column name to be used for size coding.(rank like column)
+        - title (str): Title for the plot.
+        - density (bool): Shade a binned grid by the mean of `size` per bin instead of drawing points
+          (default: above aggregate_threshold rows).
+        """
+        try:
+          plt.figure(figsize=(10, 6))
+          if self._use_density(density, self.data):
+            grid = DensityGrid(self.data[x_column], self.data[y_column], bins = self.density_bins)
+            mark_phase('render')
+            draw_mean(plt.gca(), grid, self.data[size], size)
+          else:
+            mark_phase('render')
+            sns.scatterplot(x=x_column, y=y_column, size=size, data=self.data)
+          plt.title(title if title else f'Scatterplot of {x_column} vs {y_column} for {size}')
+          plt.xlabel(x_column)
+          plt.ylabel(y_column)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def trivariatejointplot(self, numerical_column1, numerical_column2, categorical_column, title=None, top_n = None, density = None):
+        """
+        Creates a joint plot between two specified columns.
+        Usage - trivariate CNN analysis
+        Parameters:
+        - numerical_column1 (str): Name of the column for the x-axis.
+        - numerical_column2 (str): Name of the column for the y-axis.
+        - categorical_column (str): Column name to be used for color coding.
+        - title (str): Title for the plot.
+        - density (bool): Draw a binned grid coloured by the most frequent category per bin, with
+          per-category marginal histograms (default: above aggregate_threshold rows).
+        """
+        try:
+          if top_n:
+            print(f'Total unique values for {categorical_column} is {self._nunique(categorical_column)}')
+            top_n_category_df = self._top_n_frame(top_n, categorical_column)
+          else:
+            top_n_category_df = self.data
+          if self._use_density(density, top_n_category_df):
+            codes, labels = pd.factorize(top_n_category_df[categorical_column])
+            mark_phase('render')
+            density_jointplot(top_n_category_df[numerical_column1], top_n_category_df[numerical_column2], numerical_column1, numerical_column2,
+                              bins = self.density_bins, codes = codes, labels = list(labels))
+          else:
+            mark_phase('render')
+            sns.jointplot(x=numerical_column1, y=numerical_column2, data=top_n_category_df, hue=categorical_column)
+          # plt.title(title if title else f'Joint Plot of {numerical_column1} vs {numerical_column2} for {categorical_column}')
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def pairplot(self, columns=None, vars = None,hue=None, top_n = None, binned = None, bins = 64):
+        """
+        Creates pair plot for multiple columns.
+        Usage : Multivariate numerical analysis(one category column can be added optionally using 'hue' argument)
+        Parameters:
+        - columns (list): List of column names to include in the pair plot(optional).
+        - vars (list): dictionary of lists for x and y column names to include in the pair plot(optional).
+        - hue (str): Column name to be used for color coding.
+        - binned (bool): Draw every panel from 1D/2D histograms computed in one chunked pass (see
+          density.PairHistograms) instead of raw rows (default: above aggregate_threshold rows).
+        - bins (int): Bins along each axis of the binned panels.
+        """
+        try:
+          if binned is None:
+            binned = len(self.data) > self.aggregate_threshold
+          if binned:
+            if vars:
+              x_vars, y_vars = list(vars['x']), list(vars['y'])
+            else:
+              x_vars = y_vars = [col for col in (self.data.columns if columns is None else columns) if col != hue and is_numeric_column(self.data[col])]
+            hue_codes, labels = None, None
+            if hue is not None:
+              index = self.category_index(hue)
+              kept = index.top_codes(top_n) if top_n else index.ranking[:index.nunique]
+              lookup = np.full(len(index.labels) + 1, -1)
+              lookup[kept] = np.arange(len(kept))
+              hue_codes, labels = lookup[index.codes], list(index.labels[kept])
+            histograms = PairHistograms(self.data, x_vars, y_vars, hue_codes = hue_codes, n_hues = len(labels) if labels else 1, bins = bins)
+            mark_phase('render')
+            density_pairplot(histograms, labels = labels, hue = hue)
+            plt.show()
+            return
+          if top_n:
+            top_n_category_df = self._top_n_frame(top_n, hue)
+          else:
+            top_n_category_df = self.data
+          if vars:
+            mark_phase('render')
+            sns.pairplot(top_n_category_df, x_vars=vars['x'], y_vars=vars['y'], hue=hue)
+          else:
+            mark_phase('render')
+            sns.pairplot(top_n_category_df if columns is None else top_n_category_df[columns], hue=hue)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def heatmap(self, columns=None, title="Correlation Heatmap", method = 'pearson', top_k = None, annot = None, dtype = 'float64'):
+        """
+        Creates a heatmap for correlation between specified columns.
+        Usage - Multivariate numerical analysis(correlation analysis)
+        Parameters:
+        - columns (list): List of column names to include in the heatmap(optional. If None, all numerical cols are selected)
+        - title (str): Title for the heatmap.
+        - method (str): 'pearson', 'spearman' or 'kendall' (see correlation.CorrelationEngine).
+        - top_k (int): Only plot the columns of the top_k most correlated pairs, clustered, and print the pairs.
+          Used automatically (top_k = 40) above 50 columns.
+        - annot (bool): Annotate the cells (default: only up to 20 columns).
+        - dtype: np.float32 halves the memory of the correlation computation.
+        """
+        try:
+          columns = numeric_columns(self.data) if columns is None else columns
+          if top_k is None and len(columns) > 50:
+            top_k = 40
+            print(f'{len(columns)} columns: plotting the columns of the {top_k} most correlated pairs')
+          if top_k:
+            pairs, corr = top_correlations(self.data, columns, k = top_k, method = method, dtype = dtype)
+            display(pairs)
+          else:
+            corr = correlation_matrix(self.data, columns, method = method, dtype = dtype)
+          annot = len(corr) <= 20 if annot is None else annot
+          mark_phase('render')
+          plt.figure(figsize=(10, 8))
+          sns.heatmap(corr, annot=annot, cmap='coolwarm', fmt=".2f", vmin=-1, vmax=1)
+          plt.title(title)
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+    def multivariatepieplot(self, columns, title=None, explode = None):
+        """
+        Creates a pie plot for a specified column.
+        Usage - Multivariate numerical analysis(to check proportion for given column sums)
+        Parameters:
+        - columns (list): List of names of the columns to plot.
+        - title (str): Title for the plot.
+        - explode (list): List of explode values for each slice of pie chart.
+        """
+        try:
+          data = self.data[columns].T.sum(axis='columns')
+          mark_phase('render')
+          plt.figure(figsize=(10, 6))
+          plt.pie(x=data, labels=data.index,startangle=90,explode = explode,shadow=True,autopct = '%.2f%%')
+          columns_list = ", ".join(columns)  # Join all column names with a comma and space
+          plt.title(title if title else f'Pie Plot of share of {columns_list}')
+          plt.show()
+        except Exception as e:
+          record_error(e)
+          print(e)
+
+
+
+class quick_eda_obj:
+  def __init__(self, data, approximate = False, stats_cache = None, plot_cache = None, compact = False, preview = None):
+    """
+    Parameters:
+    - data (DataFrame): Data to analyse (or a lazy source, see Plotter).
+    - compact (bool or dict): Run ingest.compact_dataframe on the data first (dict: its arguments) and
+      print the memory saved; the compacted frame is shared by all plots.
+    - preview (int): univariate_analysis draws from a sample of this many rows, stratified on its
+      cat_col_list, and every plot shows population estimates with confidence intervals in its title.
+    """
+    if compact is not False and isinstance(data, pd.DataFrame):
+      data, compaction = compact_dataframe(data, **(compact if isinstance(compact, dict) else {}))
+      print(compaction)
+    self.data = data
+    self.preview = preview
+    self._samples = {}
+    self.plot_cache = plot_cache
+    self.stats_cache = stats_cache if stats_cache is not None else StatsCache(store = plot_cache)
+    self.plotter_obj = Plotter(data, approximate = approximate, stats_cache = self.stats_cache, plot_cache = plot_cache)
+
+  def preview_sample(self, strata = (), columns = None):
+    """Returns the preview sample of the given columns stratified on the strata columns, drawn once per strata and columns."""
+    key = (tuple(strata), tuple(columns or ()))
+    if key not in self._samples:
+      # lazy sources are sampled in their engine: only the strata columns and the sampled rows are read
+      data = self.data if self.plotter_obj.backend.in_memory else self.plotter_obj.backend
+      self._samples[key] = draw_sample(data, self.preview, strata = list(strata), columns = columns)
+    return self._samples[key]
+
+  def univariate_analysis(self, cat_col_list=[], num_col_list=[], top_n = None):
+    """
+    Performs univariate analysis on categorical and numerical columns.
+    In preview mode the plots are drawn from the preview sample (see preview_sample).
+    """
+    if self.preview:
+      sample = self.preview_sample(cat_col_list, columns = list(num_col_list))
+      for col in cat_col_list:
+        preview_countplot(sample, col, top_n = top_n)
+        preview_pieplot(sample, col, top_n = top_n)
+      for col in num_col_list:
+        preview_histogram(sample, col, bins = 30)
+        preview_kdeplot(sample, col)
+        preview_boxplot(sample, col)
+      return
+    if cat_col_list:
+      for col in cat_col_list:
+        self.plotter_obj.countplot(column = col, bar_label = True, top_n = top_n)
+        self.plotter_obj.pieplot(column = col, startangle = 90, top_n = top_n)
+
+    if num_col_list:
+      for col in num_col_list:
+        self.plotter_obj.histogram(column = col, bins=30, use_bins = False, kde = False)
+        self.plotter_obj.kdeplot(column = col)
+        self.plotter_obj.boxplot(column = col)
+
+  def run_all(self, output_dir, cat_col_list=[], num_col_list=[], top_n = None, trivariate = True, n_jobs = None, image_format = 'png', dpi = 100):
+    """
+    Renders all univariate, bivariate and trivariate plots that apply to the given columns headlessly,
+    in parallel, and writes them to output_dir together with index.json and index.html.
+    See report.run_all for the parameters.
+    """
+    plotter_kwargs = {'approximate': self.plotter_obj.approximate, 'aggregate_threshold': self.plotter_obj.aggregate_threshold,
+                      'density_bins': self.plotter_obj.density_bins}
+    data = self.data
+    if not self.plotter_obj.backend.in_memory:
+      # the report workers share a pandas frame: scan just the report's columns
+      data = self.plotter_obj.backend.scan(list(dict.fromkeys(list(cat_col_list) + list(num_col_list))))
+    return report.run_all(data, output_dir, cat_col_list = cat_col_list, num_col_list = num_col_list, top_n = top_n,
+                          trivariate = trivariate, n_jobs = n_jobs, image_format = image_format, dpi = dpi, plotter_kwargs = plotter_kwargs,
+                          plot_cache = self.plot_cache)
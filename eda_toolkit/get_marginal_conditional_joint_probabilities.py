@@ -0,0 +1,301 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import pandas as pd
+import numpy as np
+import warnings
+
+from .instrumentation import instrument_class
+from .backends import as_backend
+warnings.filterwarnings("ignore")
+
+def _contingency_counts(row_codes, col_codes, n_rows, n_cols):
+    """Counts co-occurrences of two factorized columns with one bincount over the combined codes."""
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    combined = row_codes[valid].astype(np.int64) * n_cols + col_codes[valid]
+    return np.bincount(combined, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+
+def _crosstab_counts(data, index_column, column_name):
+    """
+    Returns (counts, row labels, column labels) of two columns. pandas data is factorized (labels in order of
+    first appearance); Polars and Arrow sources count the pairs with a group-by in their engine.
+    """
+    if not isinstance(data, pd.DataFrame):
+        return as_backend(data).crosstab_counts(index_column, column_name)
+    row_codes, row_labels = pd.factorize(data[index_column])
+    col_codes, column_labels = pd.factorize(data[column_name])
+    return _contingency_counts(row_codes, col_codes, len(row_labels), len(column_labels)), row_labels, column_labels
+
+
+# improvements : Handle exceptions
+@instrument_class(include=('__init__',))
+class CrossTabAnalysis:
+    def __init__(self, data, index_column, column_name):
+        """
+        Initialize with dataset, index, and column for analysis.
+        Usage - Both index_column and column_name have to be categorical features
+        
+        Parameters:
+        - data (DataFrame): The input DataFrame, or a Polars LazyFrame or pyarrow Dataset (only the two
+          columns are scanned and the counts come back from the engine, see backends.py).
+        - index_column (str): Name of the index column (e.g., 'Gender').
+        - column_name (str): Name of the column (e.g., 'Product').
+        """
+        self.data = data
+        self.index_column = index_column
+        self.column_name = column_name
+        # labels are kept in order of first appearance (as Series.unique()), the counts matrix follows them
+        self.counts, self.row_labels, self.column_labels = _crosstab_counts(data, index_column, column_name)
+        self.crosstab_df = self._generate_crosstab()
+
+    @classmethod
+    def from_counts(cls, counts, row_labels, column_labels, index_column, column_name):
+        """
+        Builds the analysis from an already computed counts matrix instead of raw data.
+        Parameters:
+        - counts (ndarray): Co-occurrence counts, shape (len(row_labels), len(column_labels)).
+        - row_labels, column_labels (array-like): Categories of the index and column, in the order of counts.
+        - index_column (str), column_name (str): Names of the two features.
+        """
+        analysis = cls.__new__(cls)
+        analysis.data = None
+        analysis.index_column = index_column
+        analysis.column_name = column_name
+        analysis.row_labels = pd.Index(row_labels)
+        analysis.column_labels = pd.Index(column_labels)
+        analysis.counts = np.asarray(counts, dtype=np.int64)
+        analysis.crosstab_df = analysis._generate_crosstab()
+        return analysis
+
+    @staticmethod
+    def _extend_labels(labels, new_labels):
+        """Appends unseen labels and returns (labels, position of each of new_labels in them)."""
+        positions = labels.get_indexer(new_labels)
+        unseen = positions < 0
+        if unseen.any():
+            positions[unseen] = np.arange(len(labels), len(labels) + unseen.sum())
+            labels = labels.append(pd.Index(new_labels[unseen]))
+        return labels, positions
+
+    def _add_counts(self, counts, row_labels, column_labels):
+        """Adds a counts matrix given over its own labels, growing the matrix for new categories."""
+        self.row_labels, row_positions = self._extend_labels(self.row_labels, pd.Index(row_labels))
+        self.column_labels, col_positions = self._extend_labels(self.column_labels, pd.Index(column_labels))
+        grow_rows = len(self.row_labels) - self.counts.shape[0]
+        grow_cols = len(self.column_labels) - self.counts.shape[1]
+        if grow_rows or grow_cols:
+            self.counts = np.pad(self.counts, ((0, grow_rows), (0, grow_cols)))
+        self.counts[np.ix_(row_positions, col_positions)] += counts
+        self.crosstab_df = self._generate_crosstab()
+
+    def update(self, batch):
+        """
+        Adds a new batch of rows to the counts. Only the batch is scanned; categories not seen before are
+        appended to the counts matrix. Probabilities are recomputed from the counts on request.
+        Note: self.data keeps referring to the data the analysis was created with.
+        Parameters:
+        - batch (DataFrame): New rows with the index_column and column_name columns (or a lazy source).
+        """
+        self._add_counts(*_crosstab_counts(batch, self.index_column, self.column_name))
+        return self
+
+    def merge(self, other):
+        """
+        Adds the counts of another CrossTabAnalysis on the same two columns (e.g. computed on another shard).
+        """
+        if (other.index_column, other.column_name) != (self.index_column, self.column_name):
+            raise ValueError('Cannot merge CrossTabAnalysis objects built on different columns')
+        self._add_counts(other.counts, other.row_labels, other.column_labels)
+        return self
+
+    def association_statistics(self):
+        """
+        Returns chi-square test of independence and Cramer's V for the two features as a dict
+        (p_value is None when scipy is not installed).
+        """
+        counts = self._observed()[0].astype(np.float64)
+        n = counts.sum()
+        expected = counts.sum(axis=1, keepdims=True) * counts.sum(axis=0, keepdims=True) / n
+        chi2 = float(((counts - expected) ** 2 / expected).sum())
+        dof = (counts.shape[0] - 1) * (counts.shape[1] - 1)
+        k = min(counts.shape) - 1
+        try:
+            from scipy.stats import chi2 as chi2_distribution
+            p_value = float(chi2_distribution.sf(chi2, dof)) if dof else 1.0
+        except ImportError:
+            p_value = None
+        return {'n': int(n), 'chi2': chi2, 'dof': dof, 'p_value': p_value,
+                'cramers_v': float(np.sqrt(chi2 / (n * k))) if k > 0 and n > 0 else 0.0}
+
+    def _observed(self):
+        """Returns (counts, row labels, column labels) without categories that never co-occur, in appearance order."""
+        rows = self.counts.sum(axis=1) > 0
+        cols = self.counts.sum(axis=0) > 0
+        return self.counts[rows][:, cols], pd.Index(self.row_labels[rows]), pd.Index(self.column_labels[cols])
+
+    def _rows_sorted(self):
+        """Returns (observed counts with rows in sorted label order, appearance-ordered column labels, column sort order)."""
+        counts, row_labels, column_labels = self._observed()
+        return counts[row_labels.argsort()], column_labels, column_labels.argsort()
+
+    def _generate_crosstab(self):
+        """Generates initial crosstab with marginal counts."""
+        counts, row_labels, column_labels = self._observed()
+        row_order, col_order = row_labels.argsort(), column_labels.argsort()
+        counts = counts[np.ix_(row_order, col_order)]
+        row_labels, column_labels = row_labels[row_order], column_labels[col_order]
+        n_rows, n_cols = counts.shape
+        table = np.zeros((n_rows + 1, n_cols + 1), dtype=np.int64)
+        table[:n_rows, :n_cols] = counts
+        table[:n_rows, n_cols] = counts.sum(axis=1)
+        table[n_rows, :n_cols] = counts.sum(axis=0)
+        table[n_rows, n_cols] = counts.sum()
+        return pd.DataFrame(table,
+                            index=pd.Index(list(row_labels) + ['All'], name=self.index_column),
+                            columns=pd.Index(list(column_labels) + ['All'], name=self.column_name))
+
+    def _marginal_block(self):
+        """Marginal probabilities (in %) of the crosstab: an extra row and an extra column."""
+        table = self.crosstab_df.to_numpy(dtype=np.float64)
+        total = table[-1, -1]
+        marginal_row = table[-1] / total * 100
+        marginal_column = np.append(table[:, -1] / total * 100, np.nan)
+        return marginal_row, marginal_column
+
+    def calculate_marginal_probabilities(self):
+        """Calculates marginal probabilities for index and column."""
+        marginal_df = self.crosstab_df.astype(np.float64)
+        marginal_row, marginal_column = self._marginal_block()
+        marginal_df.loc['Marginal_prob_of_' + self.column_name] = marginal_row
+        marginal_df[f'Marginal_prob_of_{self.index_column}'] = marginal_column
+        return marginal_df
+
+    def _with_category_rows(self, blocks):
+        """Builds a DataFrame aligned with the crosstab rows from (column name, values per category row) pairs."""
+        n_categories = len(self.crosstab_df) - 1
+        values = np.full((len(self.crosstab_df), len(blocks)), np.nan)
+        for position, (_, block) in enumerate(blocks):
+            values[:n_categories, position] = block
+        return pd.DataFrame(values, index=self.crosstab_df.index,
+                            columns=pd.Index([name for name, _ in blocks], name=self.column_name))
+
+    def _conditional_probability_columns(self):
+        """P(index | column) and P(column | index) in %, computed from the counts matrix by broadcasting."""
+        counts, column_labels, col_order = self._rows_sorted()
+        index_given_column = counts / counts.sum(axis=0, keepdims=True) * 100
+        column_given_index = counts[:, col_order] / counts.sum(axis=1, keepdims=True) * 100
+        blocks = [(f'prob_{self.index_column}_given_{col}', index_given_column[:, i]) for i, col in enumerate(column_labels)]
+        blocks += [(f'prob_{col}_given_{self.index_column}', column_given_index[:, i]) for i, col in enumerate(column_labels[col_order])]
+        return self._with_category_rows(blocks)
+
+    def _joint_probability_columns(self):
+        """P(index, column) in %, computed from the counts matrix."""
+        counts, column_labels, _ = self._rows_sorted()
+        joint = counts / counts.sum() * 100
+        return self._with_category_rows([(f'joint_prob_{col}_{self.index_column}', joint[:, i]) for i, col in enumerate(column_labels)])
+
+    def calculate_conditional_probabilities(self):
+        """Calculates conditional probabilities and merges them into crosstab."""
+        return pd.concat([self.crosstab_df, self._conditional_probability_columns()], axis=1)
+
+    def calculate_joint_probability(self):
+        """Calculates joint probability and merges it into crosstab."""
+        return pd.concat([self.crosstab_df, self._joint_probability_columns()], axis=1)
+
+    def get_full_dataframe(self):
+        """Returns the complete crosstab DataFrame with all calculations."""
+        marginal_probs = self.calculate_marginal_probabilities()
+        probabilities = pd.concat([self._conditional_probability_columns(), self._joint_probability_columns()], axis=1)
+        return pd.concat([marginal_probs, probabilities.reindex(marginal_probs.index)], axis=1)
+
+
+_worker_codes = None
+
+
+def _init_pair_worker(codes, cardinalities):
+    global _worker_codes
+    _worker_codes = (codes, cardinalities)
+
+
+def _pair_counts(pairs, codes=None, cardinalities=None):
+    """Computes the counts matrix of each (index_column, column_name) pair from factorized codes."""
+    if codes is None:
+        codes, cardinalities = _worker_codes
+    return [_contingency_counts(codes[a], codes[b], cardinalities[a], cardinalities[b]) for a, b in pairs]
+
+
+class CrossTabAssociations:
+    def __init__(self, tables):
+        """
+        Results of batch_crosstab.
+        Parameters:
+        - tables (dict): CrossTabAnalysis per (index_column, column_name) pair.
+        """
+        self.tables = tables
+        self.summary = pd.DataFrame([{'index_column': a, 'column_name': b, **analysis.association_statistics()}
+                                     for (a, b), analysis in tables.items()])
+
+    def cramers_v_matrix(self):
+        """Returns a symmetric DataFrame of Cramer's V between all analysed columns."""
+        columns = list(dict.fromkeys(list(self.summary['index_column']) + list(self.summary['column_name'])))
+        matrix = pd.DataFrame(np.eye(len(columns)), index=columns, columns=columns)
+        for row in self.summary.itertuples():
+            matrix.loc[row.index_column, row.column_name] = row.cramers_v
+            matrix.loc[row.column_name, row.index_column] = row.cramers_v
+        return matrix
+
+
+def batch_crosstab(data, columns=None, pairs=None, n_jobs=None, pairs_per_task=64):
+    """
+    Computes CrossTabAnalysis for many pairs of categorical columns with a single factorization pass.
+    Every column is factorized once; contingency counts for each pair are then computed from the codes,
+    in parallel across a process pool when n_jobs > 1.
+    Parameters:
+    - data (DataFrame): The input DataFrame (or a Polars LazyFrame / pyarrow Dataset).
+    - columns (list): Categorical columns; all pairs of them are analysed when `pairs` is not given.
+    - pairs (list): Explicit list of (index_column, column_name) pairs (optional).
+    - n_jobs (int): Number of worker processes (default: number of CPUs, 1 runs in-process).
+    - pairs_per_task (int): Pairs sent to a worker at a time.
+    Returns:
+    - CrossTabAssociations with .tables (pair -> CrossTabAnalysis), .summary (chi-square, Cramer's V)
+      and .cramers_v_matrix().
+    """
+    if pairs is None:
+        pairs = list(combinations(columns, 2))
+    if not isinstance(data, pd.DataFrame):
+        # Polars/Arrow sources: one multi-threaded group-by per pair in the engine
+        return CrossTabAssociations({(a, b): CrossTabAnalysis(data, a, b) for a, b in pairs})
+    needed = list(dict.fromkeys(col for pair in pairs for col in pair))
+    codes, labels, cardinalities = {}, {}, {}
+    for col in needed:
+        codes[col], labels[col] = pd.factorize(data[col])
+        cardinalities[col] = len(labels[col])
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    tasks = [pairs[i:i + pairs_per_task] for i in range(0, len(pairs), pairs_per_task)]
+    if n_jobs == 1 or len(tasks) == 1:
+        counts = _pair_counts(pairs, codes, cardinalities)
+    else:
+        # the codes are shipped once per worker, not once per task
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks)), initializer=_init_pair_worker,
+                                 initargs=(codes, cardinalities)) as executor:
+            counts = [matrix for result in executor.map(_pair_counts, tasks) for matrix in result]
+
+    tables = {(a, b): CrossTabAnalysis.from_counts(matrix, labels[a], labels[b], a, b)
+              for (a, b), matrix in zip(pairs, counts)}
+    return CrossTabAssociations(tables)
+
+
+# Usage
+#Product_Gender_analysis_obj = CrossTabAnalysis(data, index_column='Gender', column_name='Product')
+#Product_Gender_prob_df = Product_Gender_analysis_obj.get_full_dataframe()
+#display(Product_Gender_prob_df)
+
+#Streaming micro-batches
+#Product_Gender_analysis_obj.update(new_batch)
+#Product_Gender_analysis_obj.merge(CrossTabAnalysis(other_shard, index_column='Gender', column_name='Product'))
+
+#associations = batch_crosstab(data, columns=['Gender', 'Product', 'MaritalStatus'], n_jobs=4)
+#display(associations.summary)
+#display(associations.tables[('Gender', 'Product')].get_full_dataframe())
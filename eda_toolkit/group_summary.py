@@ -0,0 +1,147 @@
+import numpy as np
+
+from ._lazy import plt
+
+
+def _normal_quantile(confidence):
+    try:
+        from scipy.stats import norm
+        return float(norm.ppf(0.5 + confidence / 2))
+    except ImportError:
+        return {0.9: 1.6449, 0.95: 1.9600, 0.99: 2.5758}.get(confidence, 1.9600)
+
+
+class GroupSummary:
+    def __init__(self, values, codes, labels, confidence=0.95, ci='analytic', n_boot=1000, max_boot_rows=10_000,
+                 max_fliers=200, seed=0):
+        """
+        Per-group statistics of a numeric column for box and bar plots, computed from integer group codes
+        in one sort: count, mean, quartiles, whiskers (1.5 IQR), a sample of outliers and a confidence
+        interval of the mean.
+        Parameters:
+        - values (array): Numeric values (missing values are ignored).
+        - codes (array): Group code of every row (0 .. len(labels) - 1, -1 to exclude the row).
+        - labels (list): Group labels.
+        - confidence (float): Confidence level of the interval.
+        - ci (str): 'analytic' (normal approximation, mean ± z * std / sqrt(n)) or 'bootstrap' (percentile
+          bootstrap like seaborn.barplot, vectorized over at most max_boot_rows rows per group and
+          rescaled to the group size).
+        - n_boot (int): Bootstrap resamples.
+        - max_fliers (int): Outliers kept per group for drawing (a random sample beyond it).
+        - seed (int): Seed for the bootstrap and the outlier sample.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        codes = np.asarray(codes, dtype=np.int64)
+        keep = (codes >= 0) & np.isfinite(values)
+        values, codes = values[keep], codes[keep]
+        self.labels = list(labels)
+        n_groups = len(self.labels)
+        order = np.lexsort((values, codes))
+        self.sorted_values = values[order]
+        self.counts = np.bincount(codes, minlength=n_groups)
+        self.starts = np.concatenate([[0], np.cumsum(self.counts)[:-1]])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.means = np.bincount(codes, weights=values, minlength=n_groups) / self.counts
+            squares = np.bincount(codes, weights=(values - self.means[codes]) ** 2, minlength=n_groups)
+            self.stds = np.sqrt(squares / (self.counts - 1))
+        self.q1, self.median, self.q3 = (self._quantile(q) for q in (0.25, 0.5, 0.75))
+        rng = np.random.default_rng(seed)
+        self.whisker_low, self.whisker_high = np.full(n_groups, np.nan), np.full(n_groups, np.nan)
+        self.fliers = []
+        for group in range(n_groups):
+            group_values = self.group_values(group)
+            if group_values.size == 0:
+                self.fliers.append(np.empty(0))
+                continue
+            iqr = self.q3[group] - self.q1[group]
+            low = np.searchsorted(group_values, self.q1[group] - 1.5 * iqr, side='left')
+            high = np.searchsorted(group_values, self.q3[group] + 1.5 * iqr, side='right')
+            self.whisker_low[group], self.whisker_high[group] = group_values[low], group_values[high - 1]
+            fliers = np.concatenate([group_values[:low], group_values[high:]])
+            if fliers.size > max_fliers:
+                fliers = rng.choice(fliers, max_fliers, replace=False)
+            self.fliers.append(fliers)
+        if ci == 'bootstrap':
+            self.ci_low, self.ci_high = self._bootstrap(confidence, n_boot, max_boot_rows, rng)
+        elif ci == 'analytic':
+            half_width = _normal_quantile(confidence) * self.stds / np.sqrt(self.counts)
+            self.ci_low, self.ci_high = self.means - half_width, self.means + half_width
+        else:
+            raise ValueError(f"Unknown ci '{ci}', expected 'analytic' or 'bootstrap'")
+
+    def group_values(self, group):
+        """Sorted values of one group."""
+        return self.sorted_values[self.starts[group]:self.starts[group] + self.counts[group]]
+
+    def _quantile(self, q):
+        """Linear-interpolation quantile of every group (numpy's default method), from the sorted values."""
+        position = self.starts + q * np.clip(self.counts - 1, 0, None)
+        below = np.floor(position).astype(np.int64)
+        above = np.minimum(below + 1, self.starts + np.clip(self.counts - 1, 0, None))
+        if self.sorted_values.size == 0:
+            return np.full(len(self.counts), np.nan)
+        below, above = np.clip(below, 0, self.sorted_values.size - 1), np.clip(above, 0, self.sorted_values.size - 1)
+        result = self.sorted_values[below] + (position - below) * (self.sorted_values[above] - self.sorted_values[below])
+        return np.where(self.counts > 0, result, np.nan)
+
+    def _bootstrap(self, confidence, n_boot, max_boot_rows, rng):
+        low, high = np.full(len(self.counts), np.nan), np.full(len(self.counts), np.nan)
+        tail = (1 - confidence) / 2 * 100
+        for group in np.flatnonzero(self.counts):
+            group_values = self.group_values(group)
+            n = group_values.size
+            m = min(n, max_boot_rows)
+            sample = group_values if m == n else rng.choice(group_values, m, replace=False)
+            means = sample[rng.integers(0, m, size=(n_boot, m))].mean(axis=1)
+            # m-out-of-n bootstrap: the spread of the resampled means shrinks like 1 / sqrt(n)
+            deviations = (means - sample.mean()) * np.sqrt(m / n)
+            low[group], high[group] = self.means[group] + np.percentile(deviations, [tail, 100 - tail])
+        return low, high
+
+    def box_stats(self):
+        """Returns the statistics dictionaries expected by matplotlib's Axes.bxp (one per non-empty group)."""
+        return [{
+            'label': str(label), 'med': self.median[i], 'q1': self.q1[i], 'q3': self.q3[i],
+            'whislo': self.whisker_low[i], 'whishi': self.whisker_high[i], 'fliers': self.fliers[i],
+            'mean': self.means[i],
+        } for i, label in enumerate(self.labels) if self.counts[i]]
+
+
+def _hue_layout(n_x, n_hue, width=0.8):
+    """Positions and width of the boxes/bars of n_hue hue levels dodged around each x position."""
+    step = width / n_hue
+    offsets = -width / 2 + step * (np.arange(n_hue) + 0.5)
+    return (np.arange(n_x)[:, None] + offsets[None, :]).ravel(), step
+
+
+def draw_grouped_boxes(ax, summary, x_labels, hue_labels=None):
+    """
+    Draws box plots from a GroupSummary. With hue_labels, groups are coded x * len(hue_labels) + hue and
+    drawn dodged per hue level with a legend, like seaborn.boxplot(hue=...).
+    """
+    n_hue = len(hue_labels) if hue_labels else 1
+    positions, width = _hue_layout(len(x_labels), n_hue)
+    stats = summary.box_stats()
+    nonempty = np.flatnonzero(summary.counts)
+    colors = plt.get_cmap('tab10')(np.arange(n_hue) % 10)
+    boxes = ax.bxp(stats, positions=positions[nonempty], widths=width * 0.9, patch_artist=True,
+                   flierprops={'marker': 'o', 'markerfacecolor': 'none', 'markersize': 5})
+    for box, group in zip(boxes['boxes'], nonempty):
+        box.set_facecolor(colors[group % n_hue])
+    for median in boxes['medians']:
+        median.set_color('black')
+    ax.set_xticks(np.arange(len(x_labels)))
+    ax.set_xticklabels([str(label) for label in x_labels])
+    if hue_labels:
+        ax.legend(handles=[plt.Rectangle((0, 0), 1, 1, color=colors[i]) for i in range(n_hue)],
+                  labels=[str(label) for label in hue_labels])
+
+
+def draw_mean_bars(ax, summary, x_labels):
+    """Draws the group means as bars with their confidence intervals as error bars."""
+    positions = np.arange(len(x_labels))
+    errors = np.vstack([summary.means - summary.ci_low, summary.ci_high - summary.means])
+    ax.bar(positions, summary.means, yerr=np.nan_to_num(errors), capsize=0, ecolor='black',
+           color=plt.get_cmap('tab10')(positions % 10), alpha=0.8)
+    ax.set_xticks(positions)
+    ax.set_xticklabels([str(label) for label in x_labels])
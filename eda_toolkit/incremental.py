@@ -0,0 +1,199 @@
+import os
+import pickle
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from .streaming import StreamingProfiler, NumericAccumulator
+
+# PSI rule of thumb: < 0.1 stable, 0.1 - 0.25 moderate shift, > 0.25 major shift
+PSI_THRESHOLDS = (0.1, 0.25)
+_EPSILON = 1e-4
+
+
+def _histogram_cdf(histogram, points):
+    """Fraction of the histogram mass below each point (linear inside bins)."""
+    total = histogram.counts.sum()
+    if histogram.lo is None or total == 0:
+        return np.zeros(len(points))
+    cumulative = np.concatenate([[0], np.cumsum(histogram.counts)])
+    return np.interp(points, histogram.edges, cumulative) / total
+
+
+def _psi(reference, current):
+    reference = np.clip(reference, _EPSILON, None)
+    current = np.clip(current, _EPSILON, None)
+    return float(np.sum((current - reference) * np.log(current / reference)))
+
+
+def _numeric_drift(reference, current, n_buckets=10):
+    """PSI over reference-decile buckets, plus mean shift in reference standard deviations."""
+    drift = {'mean_reference': reference.mean if reference.count else np.nan,
+             'mean_new': current.mean if current.count else np.nan}
+    std = np.sqrt(reference.m2 / (reference.count - 1)) if reference.count > 1 else np.nan
+    drift['mean_shift_std'] = (drift['mean_new'] - drift['mean_reference']) / std if std > 0 else np.nan
+    if reference.count and current.count:
+        inner = np.unique(reference.quantile(np.linspace(0, 1, n_buckets + 1)[1:-1]))
+        proportions = [np.diff(np.concatenate([[0], _histogram_cdf(h.histogram, inner), [1]])) for h in (reference, current)]
+        drift['psi'] = _psi(*proportions)
+    else:
+        drift['psi'] = np.nan
+    return drift
+
+
+def _categorical_drift(reference, current):
+    """PSI and total variation distance between value distributions, and categories not seen before."""
+    counts = pd.concat([reference.value_counts.rename('reference'), current.value_counts.rename('new')], axis=1).fillna(0)
+    drift = {'psi': np.nan, 'tvd': np.nan}
+    if counts['reference'].sum() and counts['new'].sum():
+        p = counts['reference'].to_numpy() / counts['reference'].sum()
+        q = counts['new'].to_numpy() / counts['new'].sum()
+        drift['psi'] = _psi(p, q)
+        drift['tvd'] = float(0.5 * np.abs(p - q).sum())
+    unseen = counts.index[(counts['reference'] == 0) & (counts['new'] > 0)]
+    drift['new_categories'] = len(unseen)
+    drift['new_category_examples'] = list(unseen[:5])
+    return drift
+
+
+def drift_summary(reference, current):
+    """
+    Compares the per-column distributions of two StreamingProfilers (e.g. history and newly appended rows).
+    Parameters:
+    - reference (StreamingProfiler): Historical data.
+    - current (StreamingProfiler): New data.
+    Returns:
+    - DataFrame with one row per column: row and null rates, PSI (population stability index), mean
+      shift in reference standard deviations (numeric), total variation distance and unseen categories
+      (categorical), and a 'drift' label from PSI_THRESHOLDS. With max_categories truncation or
+      approximate mode, categorical results are computed on the retained counts.
+    """
+    rows = {}
+    for col, new in current.accumulators.items():
+        old = reference.accumulators.get(col)
+        rows_new = new.count + new.null_count + getattr(new, 'inf_count', 0)
+        row = {'rows_new': rows_new, 'null_rate_new': new.null_count / max(rows_new, 1)}
+        if old is None:
+            row['drift'] = 'new column'
+            rows[col] = row
+            continue
+        row['null_rate_reference'] = old.null_count / max(old.count + old.null_count + getattr(old, 'inf_count', 0), 1)
+        if isinstance(new, NumericAccumulator) and isinstance(old, NumericAccumulator):
+            row.update(_numeric_drift(old, new))
+        else:
+            row.update(_categorical_drift(old, new))
+        psi = row['psi']
+        row['drift'] = 'n/a' if np.isnan(psi) else 'none' if psi < PSI_THRESHOLDS[0] else 'moderate' if psi < PSI_THRESHOLDS[1] else 'major'
+        rows[col] = row
+    columns = ['rows_new', 'null_rate_reference', 'null_rate_new', 'mean_reference', 'mean_new', 'mean_shift_std',
+               'psi', 'tvd', 'new_categories', 'new_category_examples', 'drift']
+    return pd.DataFrame.from_dict(rows, orient='index').reindex(columns=columns)
+
+
+def _row_hashes(data):
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+
+def _rows_digest(data):
+    return _row_hashes(data).sum()
+
+
+class IncrementalProfiler:
+    def __init__(self, state_path=None, n_bins=256, max_categories=100_000, approximate=False, check_rows=1000):
+        """
+        Profiles an append-only table incrementally: the mergeable per-column state (counts, moments,
+        histograms, value counts, distinct sketches; see streaming.StreamingProfiler) is persisted and each
+        refresh folds in only the rows appended since the previous one, so its cost is O(new rows).
+        Parameters:
+        - state_path (str): File the state is saved to after each refresh (optional).
+        - n_bins, max_categories, approximate: StreamingProfiler settings.
+        - check_rows (int): Number of already profiled trailing rows hashed to detect that the table was
+          rewritten instead of appended to.
+        """
+        self.state_path = state_path
+        self.profiler = StreamingProfiler(n_bins=n_bins, max_categories=max_categories, approximate=approximate)
+        self.check_rows = check_rows
+        self.n_seen = 0
+        # hashes of the last check_rows profiled rows; tail_digest is their sum
+        self.tail_hashes = np.empty(0, dtype=np.uint64)
+        self.tail_digest = self.tail_hashes.sum()
+        self.history = []
+        self.last_drift = None
+
+    @classmethod
+    def open(cls, state_path, **kwargs):
+        """Loads the state saved at state_path, or starts a new profiler saving there."""
+        if os.path.exists(state_path):
+            return cls.load(state_path)
+        return cls(state_path=state_path, **kwargs)
+
+    @classmethod
+    def load(cls, state_path):
+        with open(state_path, 'rb') as f:
+            profiler = pickle.load(f)
+        profiler.state_path = state_path
+        return profiler
+
+    def save(self, state_path=None):
+        """Writes the state atomically to state_path (default: the path given at construction)."""
+        state_path = state_path or self.state_path
+        if state_path is None:
+            raise ValueError('No state_path given')
+        directory = os.path.dirname(os.path.abspath(state_path))
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(handle, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, state_path)
+
+    def _tail(self, data, stop):
+        return data.iloc[max(0, stop - self.check_rows):stop]
+
+    def update(self, new_rows):
+        """
+        Folds a DataFrame holding only newly appended rows into the state, and extends the digest of the
+        profiled tail so that refresh can follow (new_rows must then be exactly the rows appended to the
+        table, with the table's dtypes).
+        Returns the drift summary of the new rows against the history (see drift_summary).
+        """
+        batch = StreamingProfiler(n_bins=self.profiler.n_bins, max_categories=self.profiler.max_categories,
+                                  approximate=self.profiler.approximate)
+        batch.update(new_rows)
+        tail_hashes = np.concatenate([self.tail_hashes, _row_hashes(self._tail(new_rows, len(new_rows)))])
+        tail_hashes = tail_hashes[max(0, tail_hashes.size - self.check_rows):]
+        drift = drift_summary(self.profiler, batch) if self.profiler.n_rows else None
+        # the state only changes once everything above succeeded
+        self.last_drift = drift
+        self.profiler.merge(batch)
+        self.tail_hashes, self.tail_digest = tail_hashes, tail_hashes.sum()
+        self.n_seen += len(new_rows)
+        self.history.append({'time': time.time(), 'rows_added': len(new_rows), 'n_rows': self.n_seen})
+        if self.state_path is not None:
+            self.save()
+        return self.last_drift
+
+    def refresh(self, data):
+        """
+        Folds the rows of the full table `data` past the ones already profiled.
+        Raises ValueError when the table shrank or its last profiled rows changed (it was not only appended
+        to); start a new profiler in that case.
+        """
+        if len(data) < self.n_seen or _rows_digest(self._tail(data, self.n_seen)) != self.tail_digest:
+            raise ValueError('The data does not extend the profiled rows (rows were removed or modified); '
+                             'create a new IncrementalProfiler to profile it from scratch')
+        return self.update(data.iloc[self.n_seen:])
+
+    def report(self):
+        """Returns the ProfileReport of all rows folded so far (see StreamingProfiler.report)."""
+        return self.profiler.report()
+
+    def univariate_analysis(self, cat_col_list=[], num_col_list=[], top_n=None):
+        """Draws the univariate_analysis plots from the accumulated state."""
+        self.profiler.univariate_analysis(cat_col_list, num_col_list, top_n=top_n)
+
+
+# Usage
+# profiler = IncrementalProfiler.open('orders_profile.pkl')
+# drift = profiler.refresh(orders)      # only rows appended since the last run are read
+# profiler.report().render()
+# drift[drift['drift'] != 'none']
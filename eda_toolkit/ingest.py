@@ -0,0 +1,143 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = 'manifest.json'
+
+
+class CompactionReport:
+    def __init__(self, columns):
+        """
+        Result of compact_dataframe.
+        Parameters:
+        - columns (dict): Per column: dtype before and after, memory bytes before and after (deep, i.e.
+          including the Python strings of object columns) and whether it is backed by a memory-mapped file.
+        """
+        self.columns = columns
+
+    @property
+    def bytes_before(self):
+        return sum(stats['bytes_before'] for stats in self.columns.values())
+
+    @property
+    def bytes_after(self):
+        return sum(stats['bytes_after'] for stats in self.columns.values())
+
+    @property
+    def bytes_saved(self):
+        return self.bytes_before - self.bytes_after
+
+    def summary(self):
+        """Returns the per-column dtypes and memory as a DataFrame."""
+        return pd.DataFrame.from_dict(self.columns, orient='index')
+
+    def __repr__(self):
+        ratio = self.bytes_before / self.bytes_after if self.bytes_after else float('inf')
+        return (f'CompactionReport({self.bytes_before / 2 ** 20:.1f} MiB -> {self.bytes_after / 2 ** 20:.1f} MiB, '
+                f'saved {self.bytes_saved / 2 ** 20:.1f} MiB, x{ratio:.1f})')
+
+
+def _compact_strings(series, max_categories, category_ratio):
+    """Category version of an object/string column when its cardinality is low enough, else None."""
+    codes, uniques = pd.factorize(series, sort=True)
+    if len(uniques) > max_categories or len(uniques) > category_ratio * len(series):
+        return None
+    # the factorize codes become the category codes directly; categories are sorted, as with astype('category')
+    return pd.Series(pd.Categorical.from_codes(codes, categories=uniques), index=series.index, name=series.name)
+
+
+def _compact_numeric(series, downcast_floats):
+    """Smallest integer dtype holding every value; float32 when it round-trips exactly (or when forced)."""
+    if series.dtype.kind in 'iu':
+        return pd.to_numeric(series, downcast='integer' if series.dtype.kind == 'i' else 'unsigned')
+    if series.dtype == np.float64 and downcast_floats:
+        values = series.to_numpy()
+        narrowed = values.astype(np.float32)
+        if downcast_floats == 'lossless' and not np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+            return series
+        return pd.Series(narrowed, index=series.index, name=series.name)
+    return series
+
+
+def _memory_map(values, path):
+    array = np.lib.format.open_memmap(path, mode='w+', dtype=values.dtype, shape=values.shape)
+    array[:] = values
+    array.flush()
+    return np.load(path, mmap_mode='r')
+
+
+def compact_dataframe(data, columns=None, max_categories=32_767, category_ratio=0.5, downcast_floats='lossless',
+                      memmap_dir=None, min_memmap_bytes=1024 ** 2):
+    """
+    Builds a compact copy of a DataFrame before analysis: low-cardinality object/string columns become
+    `category`, integers are downcast to the smallest dtype holding their values, and float64 columns become
+    float32 when that loses nothing. Numeric columns can also be backed by memory-mapped .npy files, which
+    other processes open with open_compacted without copying. The caller's frame is not modified.
+    Plotter, OutlierHandler and CrossTabAnalysis take the result as is (category codes are reused by
+    CategoryIndex, factorize and report.share_frame; computations upcast to float64 internally).
+    Parameters:
+    - data (DataFrame): Data to compact.
+    - columns (list): Columns to compact (default: all); the others are kept unchanged.
+    - max_categories (int): Most distinct values a string column may have to become a category.
+    - category_ratio (float): Most distinct values per row for the category conversion.
+    - downcast_floats ('lossless', True or False): float64 -> float32 only when every value round-trips
+      exactly, always, or never.
+    - memmap_dir (str): Directory receiving one .npy file per numeric column of at least min_memmap_bytes,
+      plus a manifest; those columns are backed by read-only memory maps.
+    - min_memmap_bytes (int): Smallest column memory-mapped.
+    Returns:
+    - (compacted DataFrame, CompactionReport)
+    """
+    selected = set(data.columns if columns is None else columns)
+    if memmap_dir is not None:
+        os.makedirs(memmap_dir, exist_ok=True)
+    compacted, stats, manifest = {}, {}, {}
+    for position, col in enumerate(data.columns):
+        series = data[col]
+        result = series
+        if col in selected:
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                pass
+            elif series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+                result = _compact_strings(series, max_categories, category_ratio)
+                result = series if result is None else result
+            elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iuf':
+                result = _compact_numeric(series, downcast_floats)
+        mapped = False
+        if memmap_dir is not None and col in selected and isinstance(result.dtype, np.dtype) \
+                and result.dtype.kind in 'biuf' and result.memory_usage(index=False) >= min_memmap_bytes:
+            file_name = f'{position:04d}.npy'
+            result = pd.Series(_memory_map(result.to_numpy(), os.path.join(memmap_dir, file_name)), index=series.index, name=col, copy=False)
+            manifest[str(col)] = file_name
+            mapped = True
+        compacted[col] = result
+        stats[col] = {'dtype_before': str(series.dtype), 'dtype_after': str(result.dtype),
+                      'bytes_before': int(series.memory_usage(index=False, deep=True)),
+                      'bytes_after': int(result.memory_usage(index=False, deep=True)), 'memmap': mapped}
+    if memmap_dir is not None:
+        with open(os.path.join(memmap_dir, MANIFEST), 'w') as f:
+            json.dump({'n_rows': len(data), 'columns': manifest}, f)
+    return pd.DataFrame(compacted, index=data.index, copy=False), CompactionReport(stats)
+
+
+def open_compacted(memmap_dir, mode='r'):
+    """
+    Opens the memory-mapped columns written by compact_dataframe (e.g. in a worker process) as a
+    DataFrame with a default index. The pages are shared with every other process mapping the same files.
+    """
+    with open(os.path.join(memmap_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    columns = {col: np.load(os.path.join(memmap_dir, file_name), mmap_mode=mode) for col, file_name in manifest['columns'].items()}
+    return pd.DataFrame(columns, copy=False)
+
+
+# Usage
+# data, compaction = compact_dataframe(raw_data)
+# print(compaction)                       # CompactionReport(812.4 MiB -> 96.1 MiB, saved 716.3 MiB, x8.5)
+# display(compaction.summary())
+# Plotter(data).countplot(column='city', top_n=10)
+#
+# data, compaction = compact_dataframe(raw_data, memmap_dir='/dev/shm/events')   # numeric columns on shared pages
+# other_process_frame = open_compacted('/dev/shm/events')
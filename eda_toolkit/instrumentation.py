@@ -0,0 +1,252 @@
+import contextlib
+import contextvars
+import functools
+import json
+import sys
+import threading
+import time
+import tracemalloc
+import pandas as pd
+
+# active hooks; instrumented calls only check this list when instrumentation is off
+_hooks = []
+_hooks_lock = threading.Lock()
+_trace_memory = [0]
+_current_span = contextvars.ContextVar('eda_current_span', default=None)
+
+
+class Span:
+    def __init__(self, name, attributes=None, parent=None):
+        """
+        Timing record of one instrumented call.
+        The call starts in the 'prepare' phase; mark_phase('render') inside the call starts the rendering
+        phase, so `phases` holds the seconds spent on data preparation (filtering, top_n, crosstab,
+        quantiles) and on drawing.
+        Attributes: name, attributes (e.g. column arguments), rows (of the data actually plotted when the
+        call recorded it with record_rows, else of the instance's data), phases, seconds, peak_bytes (with
+        memory tracing on), error, parent (name of the enclosing span).
+        """
+        self.name = name
+        self.attributes = attributes or {}
+        self.parent = parent.name if parent is not None else None
+        self.rows = None
+        self.phases = {}
+        self.error = None
+        self.peak_bytes = None
+        self.seconds = None
+        self._phase = 'prepare'
+        self._start = self._phase_start = time.perf_counter()
+        self._memory_start = None
+        self._child_peak = 0
+
+    def mark_phase(self, phase):
+        now = time.perf_counter()
+        if phase != self._phase:
+            self.phases[self._phase] = self.phases.get(self._phase, 0.0) + now - self._phase_start
+            self._phase, self._phase_start = phase, now
+
+    def _finish(self):
+        now = time.perf_counter()
+        self.phases[self._phase] = self.phases.get(self._phase, 0.0) + now - self._phase_start
+        self.seconds = now - self._start
+
+    def to_dict(self):
+        return {'name': self.name, 'parent': self.parent, 'rows': self.rows, 'seconds': self.seconds,
+                'phases': dict(self.phases), 'peak_bytes': self.peak_bytes, 'error': self.error,
+                'attributes': self.attributes}
+
+
+class InMemoryCollector:
+    def __init__(self):
+        """Hook keeping every finished span in `spans`."""
+        self.spans = []
+
+    def __call__(self, span):
+        self.spans.append(span)
+
+    def to_frame(self):
+        """One row per span, phases flattened into '<phase>_seconds' columns."""
+        rows = []
+        for span in self.spans:
+            row = span.to_dict()
+            row.update({f'{phase}_seconds': seconds for phase, seconds in row.pop('phases').items()})
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def summary(self):
+        """Calls, errors, total and mean seconds, time per phase and largest peak memory per span name."""
+        frame = self.to_frame()
+        if frame.empty:
+            return frame
+        aggregations = {'calls': ('seconds', 'size'), 'errors': ('error', 'count'), 'total_seconds': ('seconds', 'sum'),
+                        'mean_seconds': ('seconds', 'mean'), 'rows': ('rows', 'max'), 'max_peak_bytes': ('peak_bytes', 'max')}
+        aggregations.update({column: (column, 'sum') for column in frame.columns if column.endswith('_seconds') and column != 'seconds'})
+        return frame.groupby('name', sort=False).agg(**aggregations).sort_values('total_seconds', ascending=False)
+
+
+class JsonLogHook:
+    def __init__(self, path_or_stream=None):
+        """Hook writing one JSON object per span (JSON lines) to a file path, a stream, or stderr."""
+        self._owned = isinstance(path_or_stream, str)
+        self.stream = open(path_or_stream, 'a') if self._owned else (path_or_stream or sys.stderr)
+        self._lock = threading.Lock()
+
+    def __call__(self, span):
+        with self._lock:
+            self.stream.write(json.dumps(span.to_dict(), default=str) + '\n')
+            self.stream.flush()
+
+    def close(self):
+        if self._owned:
+            self.stream.close()
+
+
+def add_hook(hook):
+    with _hooks_lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    with _hooks_lock:
+        _hooks.remove(hook)
+
+
+def is_enabled():
+    return bool(_hooks)
+
+
+@contextlib.contextmanager
+def instrument(*hooks, trace_memory=False):
+    """
+    Enables instrumentation for the block and yields the hook receiving the spans (an InMemoryCollector
+    when no hook is given).
+    Parameters:
+    - hooks: Callables receiving each finished Span (e.g. InMemoryCollector(), JsonLogHook('spans.jsonl')).
+    - trace_memory (bool): Record peak traced memory per span with tracemalloc (slows the calls down).
+    """
+    hooks = hooks or (InMemoryCollector(),)
+    for hook in hooks:
+        add_hook(hook)
+    if trace_memory:
+        if _trace_memory[0] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _trace_memory[0] += 1
+    try:
+        yield hooks[0] if len(hooks) == 1 else hooks
+    finally:
+        for hook in hooks:
+            remove_hook(hook)
+        if trace_memory:
+            _trace_memory[0] -= 1
+            if _trace_memory[0] == 0:
+                tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def span(name, **attributes):
+    """
+    Records the enclosed block as a Span and passes it to the active hooks (yields None and records
+    nothing when instrumentation is off). Exceptions are recorded and re-raised.
+    """
+    if not _hooks:
+        yield None
+        return
+    parent = _current_span.get()
+    current = Span(name, attributes, parent)
+    tracing = _trace_memory[0] > 0 and tracemalloc.is_tracing()
+    if tracing:
+        current._memory_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f'{type(e).__name__}: {e}'
+        raise
+    finally:
+        _current_span.reset(token)
+        current._finish()
+        if tracing:
+            peak = max(tracemalloc.get_traced_memory()[1], current._child_peak)
+            current.peak_bytes = peak - current._memory_start
+            if parent is not None:
+                # reset_peak() above cleared the parent's peak; hand ours up
+                parent._child_peak = max(parent._child_peak, peak)
+        for hook in list(_hooks):
+            hook(current)
+
+
+def mark_phase(phase):
+    """Switches the current span to another phase, e.g. mark_phase('render') once the data is ready."""
+    if _hooks:
+        current = _current_span.get()
+        if current is not None:
+            current.mark_phase(phase)
+
+
+def record_error(error):
+    """Records a handled exception on the current span (for methods that catch and print errors)."""
+    if _hooks:
+        current = _current_span.get()
+        if current is not None:
+            current.error = f'{type(error).__name__}: {error}'
+
+
+def record_rows(rows):
+    """Records the rows the current call works on, e.g. after a top_n or xlimit filter."""
+    if _hooks:
+        current = _current_span.get()
+        if current is not None:
+            current.rows = int(rows)
+
+
+def _rows(instance, args):
+    # instance attributes only: a lazily collected `dataframe` property must not be triggered here
+    for value in [vars(instance).get(name) for name in ('data', 'dataframe', '_dataframe')] + list(args[:1]):
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return len(value)
+    return None
+
+
+def instrumented(func=None, name=None):
+    """
+    Method decorator recording each call as a span named 'Class.method', with the rows of the instance's
+    data and the string arguments (column names). Costs one list check per call when instrumentation is off.
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _hooks:
+            return func(self, *args, **kwargs)
+        attributes = {key: value for key, value in kwargs.items() if isinstance(value, (str, int, float, bool))}
+        with span(name or f'{type(self).__name__}.{func.__name__}', **attributes) as current:
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                if current is not None and current.rows is None:
+                    current.rows = _rows(self, args)
+    return wrapper
+
+
+def instrument_class(cls=None, include=()):
+    """
+    Class decorator applying `instrumented` to every public method (and to the names in `include`,
+    e.g. '__init__').
+    """
+    if cls is None:
+        return functools.partial(instrument_class, include=include)
+    for attribute, value in list(vars(cls).items()):
+        if callable(value) and not isinstance(value, (staticmethod, classmethod, type)) and \
+                (not attribute.startswith('_') or attribute in include):
+            setattr(cls, attribute, instrumented(value, name=f'{cls.__name__}.{attribute}'))
+    return cls
+
+
+# Usage
+# with instrument(trace_memory=True) as collector:
+#     quick_eda.univariate_analysis(cat_col_list=['city'], num_col_list=['price'], top_n=10)
+# display(collector.summary())
+#
+# add_hook(JsonLogHook('eda_spans.jsonl'))     # structured log for production jobs
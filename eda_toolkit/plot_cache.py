@@ -0,0 +1,215 @@
+import contextlib
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+import threading
+from .stats_cache import column_fingerprint
+
+# bump when the rendering code changes in a way that invalidates stored images or aggregates
+CACHE_VERSION = 2
+_MISSING = object()
+# pyplot's figure list and plt.show are process-wide: one capture at a time
+_capture_lock = threading.RLock()
+
+
+def plot_columns(data, kwargs):
+    """Returns the columns a plot call depends on: the column names among its arguments, else all columns."""
+    columns = []
+    for value in kwargs.values():
+        for item in (value if isinstance(value, (list, tuple)) else [value]):
+            if isinstance(item, str) and item in data.columns and item not in columns:
+                columns.append(item)
+    return columns or list(data.columns)
+
+
+def plot_key(fingerprints, method, kwargs, settings=()):
+    """Content address of a rendered plot: input column fingerprints, method, arguments and renderer settings."""
+    params = tuple(sorted((key, repr(value)) for key, value in kwargs.items()))
+    return PlotCache.make_key(tuple(fingerprints), method, (params, tuple(settings)))
+
+
+class PlotCache:
+    def __init__(self, directory, max_bytes=1024 ** 3):
+        """
+        Persistent, content-addressed cache of rendered plots and computed aggregates.
+        Entries are addressed by a hash of the input column fingerprints (row count, dtype and a hash of
+        every value, see stats_cache.column_fingerprint) and the call parameters, so unchanged inputs are
+        served from disk across sessions. Files are written atomically and can be shared by several
+        processes. The least recently used files are evicted when the directory exceeds max_bytes; writes
+        keep a running total of the directory size, so the directory is only scanned when it goes over.
+        Parameters:
+        - directory (str): Cache directory (created if missing).
+        - max_bytes (int): Size cap of the directory.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # directory size as of the last scan plus this instance's writes (other processes may add files)
+        self._bytes = None
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(fingerprints, name, params=()):
+        return hashlib.blake2b(repr((CACHE_VERSION, fingerprints, name, params)).encode(), digest_size=20).hexdigest()
+
+    def key(self, data, columns, name, params=()):
+        """Key of a statistic `name` with `params` computed on the given columns of data."""
+        return self.make_key(tuple(column_fingerprint(data[column]) for column in columns), name, params)
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def _lookup(self, path):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def _write(self, path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(handle, 'wb') as f:
+            f.write(content)
+        try:
+            replaced = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(temporary, path)
+        if self._bytes is None:
+            self._bytes = self.size
+        else:
+            self._bytes += len(content) - replaced
+        if self._bytes > self.max_bytes:
+            self.evict()
+
+    def get_image(self, key, image_format='png'):
+        """Returns the path of the cached image for key, or None."""
+        return self._lookup(self._path(key, '.' + image_format))
+
+    def put_image(self, key, image, image_format='png'):
+        """Stores image bytes (or the content of an image file) for key and returns the cached path."""
+        if isinstance(image, str):
+            with open(image, 'rb') as f:
+                image = f.read()
+        path = self._path(key, '.' + image_format)
+        self._write(path, image)
+        return path
+
+    def load(self, key, default=None):
+        """Returns the cached aggregate for key, or default."""
+        path = self._lookup(self._path(key, '.pkl'))
+        if path is None:
+            return default
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+
+    def save(self, key, value):
+        self._write(self._path(key, '.pkl'), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def get_or_compute(self, data, columns, name, compute, params=()):
+        """
+        Returns the aggregate `name` (counts, bins, crosstab, ...) of the given columns from disk,
+        computing and storing it with compute() when missing.
+        """
+        key = self.key(data, columns, name, params)
+        value = self.load(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.save(key, value)
+        return value
+
+    def _files(self):
+        for entry in os.scandir(self.directory):
+            if entry.is_dir():
+                yield from (item for item in os.scandir(entry.path) if item.is_file() and not item.name.endswith('.tmp'))
+
+    def evict(self):
+        """Deletes least recently used files until the cache fits in max_bytes."""
+        files = []
+        for item in self._files():
+            try:
+                stat = item.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, item.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+        self._bytes = total
+
+    def clear(self):
+        for item in list(self._files()):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(item.path)
+        self._bytes = 0
+
+    @property
+    def size(self):
+        return sum(item.stat().st_size for item in self._files())
+
+
+@contextlib.contextmanager
+def capture_figure(image_format='png', dpi=100):
+    """
+    Collects the image of the last non-empty figure drawn inside the block, saved just before plt.show()
+    (which closes figures on inline backends) or at the end of the block. Yields a list that receives
+    the image bytes. Captures from several threads are serialized, and plt.show is restored on exit
+    even when the block raises.
+    """
+    import matplotlib.pyplot as plt
+    images = []
+
+    def save_open_figures():
+        for number in plt.get_fignums():
+            figure = plt.figure(number)
+            if any(ax.has_data() for ax in figure.axes):
+                buffer = io.BytesIO()
+                figure.savefig(buffer, format=image_format, dpi=dpi, bbox_inches='tight')
+                images.append(buffer.getvalue())
+
+    with _capture_lock:
+        show = plt.show
+
+        def capturing_show(*args, **kwargs):
+            save_open_figures()
+            return show(*args, **kwargs)
+        plt.show = capturing_show
+        try:
+            yield images
+            if not images:
+                save_open_figures()
+        finally:
+            plt.show = show
+
+
+def show_image(path):
+    """Displays a cached image in the notebook (or with matplotlib outside IPython)."""
+    try:
+        from IPython.display import Image, display
+        display(Image(filename=path))
+    except ImportError:
+        import matplotlib.pyplot as plt
+        plt.figure(figsize=(12, 8))
+        plt.imshow(plt.imread(path))
+        plt.axis('off')
+        plt.show()
+
+
+# Usage
+# cache = PlotCache('.eda_cache', max_bytes=2 * 1024 ** 3)
+# plotter = Plotter(df, plot_cache=cache)
+# plotter.cached('countplot', column='city', top_n=10)     # rendered once, then served from disk
+# counts = cache.get_or_compute(df, ['city', 'segment'], 'crosstab', lambda: CrossTabAnalysis(df, 'city', 'segment'))
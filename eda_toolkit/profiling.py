@@ -0,0 +1,205 @@
+import json
+import numpy as np
+import pandas as pd
+
+from .sketches import approximate_column_stats
+from ._lazy import display
+
+SEPARATOR = '*************************************************************************************'
+NUMERIC_STATS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+# interval half-width of the mean and interval bounds of the quartiles, in reports estimated from a sample
+PREVIEW_STATS = ['mean ±', '25% low', '25% high', '50% low', '50% high', '75% low', '75% high']
+
+
+class ProfileReport:
+    def __init__(self, n_rows, columns, duplicate_rows=None, head=None, sample=None):
+        """
+        Structured result of profiling a DataFrame.
+        Parameters:
+        - n_rows (int): Number of rows in the profiled data.
+        - columns (dict): Per-column statistics, keyed by column name. Every entry has 'dtype', 'count',
+          'null_count', 'memory_bytes' and 'nunique'; numeric columns also carry the keys in NUMERIC_STATS.
+        - duplicate_rows (int): Number of fully duplicated rows (None when it was not computed).
+        - head (DataFrame): First few rows of the data (optional, not serialized).
+        - sample (str): Description of the sample the statistics were estimated from (see sampling.Sample),
+          None for exact statistics. Sampled reports carry the PREVIEW_STATS error columns.
+        """
+        self.n_rows = n_rows
+        self.columns = columns
+        self.duplicate_rows = duplicate_rows
+        self.head = head
+        self.sample = sample
+
+    @property
+    def shape(self):
+        return (self.n_rows, len(self.columns))
+
+    def summary(self):
+        """
+        Returns per-column dtype, non-null count, null count, memory usage and distinct count as a DataFrame,
+        plus the infinite-value counts of streamed reports and the error bounds of approximate statistics when present.
+        """
+        summary = pd.DataFrame.from_dict(self.columns, orient='index')
+        error_columns = [col for col in ('inf_count', 'count ±', 'nunique_relative_error', 'quantile_rank_error') if col in summary.columns]
+        return summary[['dtype', 'count', 'null_count', 'memory_bytes', 'nunique'] + error_columns]
+
+    def nunique(self):
+        """Returns distinct values per column, like DataFrame.nunique()."""
+        return pd.Series({col: stats['nunique'] for col, stats in self.columns.items()}, name='nunique')
+
+    def describe(self):
+        """Returns the numeric summary table, laid out like DataFrame.describe()."""
+        keys = NUMERIC_STATS + (PREVIEW_STATS if self.sample else [])
+        numeric = {col: [stats.get(key, np.nan) for key in keys] for col, stats in self.columns.items() if 'mean' in stats}
+        return pd.DataFrame(numeric, index=keys)
+
+    def to_dict(self):
+        """Returns a JSON-serializable dictionary of the report."""
+        return {
+            'n_rows': int(self.n_rows),
+            'n_columns': len(self.columns),
+            'duplicate_rows': None if self.duplicate_rows is None else int(self.duplicate_rows),
+            'sample': self.sample,
+            'columns': {str(col): {key: _to_builtin(value) for key, value in stats.items()} for col, stats in self.columns.items()},
+        }
+
+    def to_json(self, path=None, **kwargs):
+        """Serializes the report to JSON. Writes to `path` when given, otherwise returns the string."""
+        text = json.dumps(self.to_dict(), **kwargs)
+        if path is None:
+            return text
+        with open(path, 'w') as f:
+            f.write(text)
+
+    def render(self):
+        """Prints the report in the same layout as basic_eda."""
+        if self.sample:
+            print(f'Estimated from a sample ({self.sample}); unique values are those seen in the sample')
+            print(SEPARATOR)
+        if self.head is not None:
+            print('Head of data')
+            display(self.head)
+            print(SEPARATOR)
+        print('Shape of data')
+        print(self.shape)
+        print(SEPARATOR)
+        print('Unique values in data')
+        display(self.nunique())
+        if self.duplicate_rows is not None:
+            print('Duplicate rows: ', self.duplicate_rows)
+        print(SEPARATOR)
+        print('Non-Null count and datatypes of columns in data')
+        display(self.summary())
+        print(SEPARATOR)
+        print('Description of numerical data')
+        display(self.describe())
+        print(SEPARATOR)
+
+
+def _to_builtin(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value if isinstance(value, (int, float, str, bool, type(None))) else str(value)
+
+
+def _numeric_stats(values):
+    """Computes describe()-style statistics from the non-null values of one column."""
+    count = values.size
+    if count == 0:
+        return dict(zip(NUMERIC_STATS, [0] + [np.nan] * 7))
+    values = values.astype(np.float64, copy=False)
+    mean = values.mean()
+    std = np.sqrt(((values - mean) ** 2).sum() / (count - 1)) if count > 1 else np.nan
+    # one partition pass gives min, quartiles and max together
+    q = np.quantile(values, [0, 0.25, 0.5, 0.75, 1])
+    return dict(zip(NUMERIC_STATS, [count, mean, std, q[0], q[1], q[2], q[3], q[4]]))
+
+
+def _column_profile(series, deep_memory=False):
+    """
+    Profiles one column. The column is factorized once; the codes give the null count and the distinct
+    count, and are kept for duplicate-row detection.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    null_mask = codes < 0
+    null_count = int(null_mask.sum())
+    stats = {
+        'dtype': str(series.dtype),
+        'count': int(series.size - null_count),
+        'null_count': null_count,
+        'memory_bytes': int(series.memory_usage(index=False, deep=deep_memory)),
+        'nunique': int(len(uniques)),
+    }
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        stats.update(_numeric_stats(values[~null_mask]))
+    return stats, codes, len(uniques)
+
+
+def _count_duplicate_rows(codes_list, cardinalities, n_rows):
+    """Counts duplicated rows from the per-column factorized codes, without rehashing the values."""
+    if n_rows == 0 or not codes_list:
+        return 0
+    # mixed-radix key over the codes (shifted by one so that nulls, coded -1, become 0)
+    key = np.zeros(n_rows, dtype=np.int64)
+    radix = 1
+    for codes, cardinality in zip(codes_list, cardinalities):
+        if radix * (cardinality + 1) >= np.iinfo(np.int64).max:
+            # key would overflow: compress what we have so far and continue from there
+            key, _ = pd.factorize(key)
+            key = key.astype(np.int64)
+            radix = int(key.max()) + 1
+            if radix * (cardinality + 1) >= np.iinfo(np.int64).max:
+                return int(pd.DataFrame(np.column_stack(codes_list)).duplicated().sum())
+        key = key * (cardinality + 1) + (codes.astype(np.int64) + 1)
+        radix *= cardinality + 1
+    return int(n_rows - len(pd.unique(key)))
+
+
+def _approximate_column_profile(series, deep_memory=False):
+    """Profiles one column with constant-memory sketches instead of factorizing it."""
+    null_count = int(series.isna().sum())
+    stats = {
+        'dtype': str(series.dtype),
+        'count': int(series.size - null_count),
+        'null_count': null_count,
+        'memory_bytes': int(series.memory_usage(index=False, deep=deep_memory)),
+    }
+    stats.update(approximate_column_stats(series))
+    return stats
+
+
+def profile_dataframe(data, head_rows=5, deep_memory=False, approximate=False):
+    """
+    Profiles a DataFrame in one pass per column, without modifying it.
+    Parameters:
+    - data (DataFrame): pandas DataFrame to profile.
+    - head_rows (int): Number of leading rows to keep in the report (0 to skip).
+    - deep_memory (bool): Whether to measure the memory of object columns deeply (slower).
+    - approximate (bool): Use HyperLogLog distinct counts and KLL quartiles. Each column then also reports
+      'nunique_relative_error' and 'quantile_rank_error', and duplicate rows are not counted.
+    Returns:
+    - ProfileReport
+    """
+    head = data.head(head_rows) if head_rows else None
+    if approximate:
+        columns = {col: _approximate_column_profile(data[col], deep_memory=deep_memory) for col in data.columns}
+        return ProfileReport(len(data), columns, head=head)
+    columns = {}
+    codes_list = []
+    cardinalities = []
+    for col in data.columns:
+        stats, codes, cardinality = _column_profile(data[col], deep_memory=deep_memory)
+        columns[col] = stats
+        codes_list.append(codes)
+        cardinalities.append(cardinality)
+    duplicate_rows = _count_duplicate_rows(codes_list, cardinalities, len(data))
+    return ProfileReport(len(data), columns, duplicate_rows=duplicate_rows, head=head)
+
+
+# Usage
+# report = profile_dataframe(data)
+# report.render()
+# report.to_json('profile.json')
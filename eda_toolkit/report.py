@@ -0,0 +1,245 @@
+import contextlib
+import html
+import io
+import json
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from .stats_cache import column_fingerprint
+from .plot_cache import PlotCache, plot_columns, plot_key
+
+
+def plan_plots(cat_col_list=[], num_col_list=[], top_n=None, trivariate=True):
+    """
+    Lists every applicable Plotter call for the given column types as (section, method, kwargs) tuples:
+    univariate plots per column, bivariate plots per pair, trivariate plots per triple (optional) and
+    a correlation heatmap.
+    """
+    plan = []
+    for col in cat_col_list:
+        plan.append(('univariate', 'countplot', {'column': col, 'bar_label': True, 'top_n': top_n}))
+        plan.append(('univariate', 'pieplot', {'column': col, 'top_n': top_n}))
+    for col in num_col_list:
+        plan.append(('univariate', 'histogram', {'column': col}))
+        plan.append(('univariate', 'kdeplot', {'column': col}))
+        plan.append(('univariate', 'boxplot', {'column': col}))
+    for x, y in combinations(num_col_list, 2):
+        plan.append(('bivariate', 'scatterplot', {'x_column': x, 'y_column': y}))
+    for x, hue in combinations(cat_col_list, 2):
+        plan.append(('bivariate', 'stackedcountplot', {'x_column': x, 'hue': hue, 'top_n': top_n}))
+    for cat in cat_col_list:
+        for num in num_col_list:
+            plan.append(('bivariate', 'bivariateboxplot', {'categorical_column': cat, 'numerical_column': num, 'rotate_xaxis_ticks': True, 'top_n': top_n}))
+            plan.append(('bivariate', 'bivariatebarplot', {'categorical_column': cat, 'numerical_column': num, 'rotate_xaxis_ticks': True, 'top_n': top_n}))
+    if trivariate:
+        for cat in cat_col_list:
+            for x, y in combinations(num_col_list, 2):
+                plan.append(('trivariate', 'trivariatescatterplot_CNN', {'numerical_column1': x, 'numerical_column2': y, 'categorical_column': cat, 'top_n': top_n}))
+        for cat1, cat2 in combinations(cat_col_list, 2):
+            for num in num_col_list:
+                plan.append(('trivariate', 'trivariateboxplot', {'categorical_column1': cat1, 'categorical_column2': cat2, 'numerical_column': num, 'rotate_xaxis_ticks': True, 'top_n': top_n}))
+    if len(num_col_list) > 1:
+        plan.append(('multivariate', 'heatmap', {'columns': list(num_col_list)}))
+    return plan
+
+
+def _file_name(position, method, kwargs, image_format):
+    columns = '_'.join(str(value) for key, value in kwargs.items() if 'column' in key or key == 'hue')
+    columns = re.sub(r'[^A-Za-z0-9_.-]+', '-', columns).strip('-')
+    return f'{position:04d}_{method}_{columns}'[:150] + f'.{image_format}'
+
+
+def _mapped_file(array):
+    """(file name, byte offset) of an array that is a contiguous view of a memory-mapped file, else None."""
+    # views of a memmap are memmaps with the offset of their parent: use the one over the mmap itself
+    base, mapped = array, None
+    while isinstance(base, np.ndarray):
+        mapped = base if isinstance(base, np.memmap) else mapped
+        base = base.base
+    if mapped is None or getattr(mapped, 'filename', None) is None or not array.flags.c_contiguous:
+        return None
+    return mapped.filename, mapped.offset + array.ctypes.data - mapped.ctypes.data
+
+
+def _shared_block(array, blocks):
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    blocks.append(block)
+    return block.name
+
+
+def share_frame(data, columns):
+    """
+    Copies the given columns once into shared memory blocks. Numeric, boolean and datetime columns are
+    shared as-is; nullable numeric columns (Int64, Float64, boolean) as their values plus a block with
+    their missing-value mask, and other numeric extension columns as float64 with NaN. Category columns
+    (e.g. from ingest.compact_dataframe) share their existing codes, and the remaining (non-numeric)
+    columns are shared as int32 category codes with a small list of labels. Columns already backed by a
+    memory-mapped file (compact_dataframe with memmap_dir) are not copied: the workers map the same file.
+    Returns (blocks, layout); pass layout to attach_frame in the workers and close/unlink the blocks
+    when done.
+    """
+    blocks, layout = [], {}
+    for col in columns:
+        series = data[col]
+        labels, masked = None, None
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufmM':
+            array = series.to_numpy()
+            mapped = _mapped_file(array)
+            if mapped is not None:
+                layout[col] = (None, array.dtype.str, array.shape, None, mapped, None)
+                continue
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            array, labels = series.cat.codes.to_numpy(), list(series.cat.categories)
+        elif isinstance(series.array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+            mask = series.isna().to_numpy()
+            array = series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=False if series.dtype.kind == 'b' else 0)
+            masked = (series.dtype.name, _shared_block(mask, blocks))
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            array = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            codes, labels = pd.factorize(series)
+            array, labels = codes.astype(np.int32), list(labels)
+        layout[col] = (_shared_block(array, blocks), array.dtype.str, array.shape, labels, None, masked)
+    return blocks, layout
+
+
+def attach_frame(layout):
+    """
+    Rebuilds a DataFrame over the shared memory blocks and memory-mapped files described by layout,
+    without copying numeric data.
+    """
+    blocks, columns = [], {}
+
+    def attach(name, dtype, shape):
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+    for col, (name, dtype, shape, labels, mapped, masked) in layout.items():
+        if mapped is not None:
+            columns[col] = np.memmap(mapped[0], dtype=np.dtype(dtype), mode='r', offset=mapped[1], shape=shape)
+            continue
+        array = attach(name, dtype, shape)
+        if masked is not None:
+            array_type = pd.api.types.pandas_dtype(masked[0]).construct_array_type()
+            columns[col] = array_type(array, attach(masked[1], np.bool_, shape))
+        else:
+            columns[col] = pd.Categorical.from_codes(array, categories=labels) if labels is not None else array
+    return blocks, pd.DataFrame(columns, copy=False)
+
+
+_worker_state = {}
+
+
+def _init_report_worker(layout, plotter_kwargs, cache_args):
+    import matplotlib
+    matplotlib.use('Agg')
+    from .eda import Plotter
+    blocks, data = attach_frame(layout)
+    _worker_state['blocks'] = blocks
+    _worker_state['plotter'] = Plotter(data, **plotter_kwargs)
+    _worker_state['plot_cache'] = PlotCache(*cache_args) if cache_args else None
+
+
+def _render(task):
+    """Runs one Plotter call headlessly and saves every figure it opens (or copies it from the plot cache)."""
+    import matplotlib.pyplot as plt
+    section, method, kwargs, path, dpi, fingerprints = task
+    plot_cache, image_format = _worker_state['plot_cache'], os.path.splitext(path)[1][1:]
+    key = plot_key(fingerprints, method, kwargs, _worker_state['plotter'].settings + (dpi,))
+    cached = plot_cache.get_image(key, image_format) if plot_cache is not None else None
+    if cached is not None:
+        shutil.copyfile(cached, path)
+        return {'section': section, 'method': method, 'kwargs': kwargs, 'files': [os.path.basename(path)],
+                'seconds': 0.0, 'messages': '', 'error': None, 'cached': True}
+    plt.close('all')
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        getattr(_worker_state['plotter'], method)(**kwargs)
+    figures = [plt.figure(number) for number in plt.get_fignums()]
+    files = []
+    for i, figure in enumerate(figures):
+        # a call may open helper figures (e.g. stackedcountplot); keep the ones with content
+        if not figure.axes or not any(ax.has_data() for ax in figure.axes):
+            continue
+        file_path = path if not files else f'{os.path.splitext(path)[0]}_{i}{os.path.splitext(path)[1]}'
+        figure.savefig(file_path, dpi=dpi, bbox_inches='tight')
+        files.append(os.path.basename(file_path))
+    plt.close('all')
+    if plot_cache is not None and len(files) == 1:
+        plot_cache.put_image(key, path, image_format)
+    messages = output.getvalue().strip()
+    return {'section': section, 'method': method, 'kwargs': kwargs, 'files': files,
+            'seconds': round(time.perf_counter() - start, 4), 'messages': messages,
+            'error': messages if not files else None, 'cached': False}
+
+
+def _write_index(output_dir, records):
+    with open(os.path.join(output_dir, 'index.json'), 'w') as f:
+        json.dump(records, f, indent=2, default=str)
+    parts = ['<html><head><meta charset="utf-8"><title>EDA report</title></head><body>']
+    for section in dict.fromkeys(record['section'] for record in records):
+        parts.append(f'<h2>{html.escape(section.title())} analysis</h2>')
+        for record in (record for record in records if record['section'] == section):
+            label = html.escape(f"{record['method']}({', '.join(f'{k}={v!r}' for k, v in record['kwargs'].items())})")
+            parts.append(f'<h4>{label}</h4>')
+            parts.extend(f'<img src="{html.escape(name)}" style="max-width:900px">' for name in record['files'])
+            if record['error']:
+                parts.append(f'<pre>{html.escape(record["error"])}</pre>')
+    parts.append('</body></html>')
+    with open(os.path.join(output_dir, 'index.html'), 'w') as f:
+        f.write('\n'.join(parts))
+
+
+def run_all(data, output_dir, cat_col_list=[], num_col_list=[], top_n=None, trivariate=True, n_jobs=None,
+            image_format='png', dpi=100, plotter_kwargs=None, plot_cache=None):
+    """
+    Renders every planned plot headlessly (Agg backend) across a process pool.
+    The referenced columns are placed in shared memory once (memory-mapped columns are reopened from their
+    files) and every worker builds its DataFrame on top of it, so the data is not pickled per worker or per task.
+    Parameters:
+    - data (DataFrame): Data to analyse.
+    - output_dir (str): Directory receiving the images, index.json and index.html.
+    - cat_col_list, num_col_list (list): Categorical and numerical columns.
+    - top_n (int): top_n passed to the categorical plots.
+    - trivariate (bool): Include trivariate plots.
+    - n_jobs (int): Number of worker processes (default: number of CPUs).
+    - image_format (str), dpi (int): Output image settings.
+    - plotter_kwargs (dict): Extra Plotter arguments (e.g. aggregate_threshold).
+    - plot_cache (PlotCache or str): On-disk plot cache (or its directory); plots whose input columns and
+      arguments are unchanged are copied from it instead of being rendered.
+    Returns:
+    - List of records (method, arguments, files, seconds, error, cached) as written to index.json.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    plan = plan_plots(cat_col_list, num_col_list, top_n=top_n, trivariate=trivariate)
+    columns = list(dict.fromkeys(list(cat_col_list) + list(num_col_list)))
+    if isinstance(plot_cache, str):
+        plot_cache = PlotCache(plot_cache)
+    cache_args = (plot_cache.directory, plot_cache.max_bytes) if plot_cache is not None else None
+    # fingerprints of the caller's columns; the shared copies may differ in dtype
+    fingerprints = {col: column_fingerprint(data[col]) for col in columns} if plot_cache is not None else {}
+    tasks = []
+    for i, (section, method, kwargs) in enumerate(plan):
+        used = [fingerprints[col] for col in plot_columns(data, kwargs)] if plot_cache is not None else []
+        tasks.append((section, method, kwargs, os.path.join(output_dir, _file_name(i, method, kwargs, image_format)), dpi, used))
+    blocks, layout = share_frame(data, columns)
+    try:
+        n_jobs = min(n_jobs or os.cpu_count() or 1, max(len(tasks), 1))
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_report_worker,
+                                 initargs=(layout, plotter_kwargs or {}, cache_args)) as executor:
+            records = list(executor.map(_render, tasks))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    _write_index(output_dir, records)
+    return records
@@ -0,0 +1,415 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import plt, sns
+from .backends import Backend, as_backend
+from .group_summary import _normal_quantile
+from .profiling import ProfileReport, profile_dataframe
+
+
+class Sample:
+    def __init__(self, frame, strata, population_sizes, method, confidence=0.95):
+        """
+        Rows drawn from a larger table, with the design needed to estimate population statistics and
+        their sampling error. Every row belongs to a stratum h, drawn without replacement as n_h of the N_h
+        population rows (a uniform sample is a single stratum), so each row stands for N_h / n_h rows.
+        Estimates are stratified means with variance sum_h W_h^2 (1 - n_h / N_h) s_h^2 / n_h, W_h = N_h / N;
+        quantile intervals invert the interval of the CDF at the estimate (Woodruff).
+        Parameters:
+        - frame (DataFrame): The sampled rows.
+        - strata (array): Stratum code of every sampled row (0 .. len(population_sizes) - 1).
+        - population_sizes (array): N_h, rows of every stratum in the population.
+        - method (str): 'reservoir', 'uniform' or 'stratified' (for display).
+        - confidence (float): Confidence level of the intervals.
+        """
+        self.frame = frame
+        self.strata = np.asarray(strata, dtype=np.int64)
+        self.population_sizes = np.asarray(population_sizes, dtype=np.float64)
+        self.sample_sizes = np.bincount(self.strata, minlength=len(self.population_sizes)).astype(np.float64)
+        self.method = method
+        self.confidence = confidence
+        self.z = _normal_quantile(confidence)
+        self.weights = (self.population_sizes / np.maximum(self.sample_sizes, 1))[self.strata]
+
+    @property
+    def n_rows(self):
+        return len(self.frame)
+
+    @property
+    def population_rows(self):
+        return int(self.population_sizes.sum())
+
+    @property
+    def exact(self):
+        return self.n_rows == self.population_rows
+
+    def describe(self):
+        """One-line description used in titles and reports."""
+        if self.exact:
+            return 'exact (all rows)'
+        return f'preview: {self.n_rows:,}-row {self.method} sample of {self.population_rows:,}, {self.confidence:.0%} CI'
+
+    def _mean(self, values, valid=None):
+        """Stratified mean of values over the rows where valid, and the half-width of its interval."""
+        valid = np.ones(len(values), dtype=bool) if valid is None else valid
+        strata, values = self.strata[valid], values[valid]
+        n_h = np.bincount(strata, minlength=len(self.population_sizes)).astype(np.float64)
+        # population rows of each stratum inside the domain (e.g. non-null rows), estimated from the sample
+        N_h = self.population_sizes * n_h / np.maximum(self.sample_sizes, 1)
+        if N_h.sum() == 0:
+            return np.nan, np.nan
+        sums = np.bincount(strata, weights=values, minlength=len(n_h))
+        means = np.divide(sums, n_h, out=np.zeros_like(sums), where=n_h > 0)
+        squares = np.bincount(strata, weights=(values - means[strata]) ** 2, minlength=len(n_h))
+        variances = np.divide(squares, n_h - 1, out=np.zeros_like(squares), where=n_h > 1)
+        W_h = N_h / N_h.sum()
+        finite = 1 - np.divide(n_h, N_h, out=np.ones_like(n_h), where=N_h > 0)
+        variance = np.sum(np.divide(W_h ** 2 * finite * variances, n_h, out=np.zeros_like(n_h), where=n_h > 0))
+        return float(np.sum(W_h * means)), float(self.z * np.sqrt(variance))
+
+    def _shares(self, codes, n_codes):
+        """
+        Estimated population share of every code (0 .. n_codes - 1, -1 for none) and the half-widths of
+        their intervals, from one bincount over (stratum, code) instead of one pass per code.
+        """
+        n_strata = len(self.population_sizes)
+        valid = codes >= 0
+        counts = np.bincount(self.strata[valid] * n_codes + codes[valid], minlength=n_strata * n_codes).reshape(n_strata, n_codes)
+        n_h = np.maximum(self.sample_sizes, 1)[:, None]
+        p = counts / n_h
+        W_h = (self.population_sizes / self.population_sizes.sum())[:, None]
+        finite = 1 - n_h / np.maximum(self.population_sizes, 1)[:, None]
+        variances = np.where(n_h > 1, p * (1 - p) * n_h / np.maximum(n_h - 1, 1), 0)
+        shares = (W_h * p).sum(axis=0)
+        return shares, self.z * np.sqrt((W_h ** 2 * finite * variances / n_h).sum(axis=0))
+
+    def proportion(self, mask):
+        """Estimated share of population rows where mask is True, with the half-width of its interval."""
+        return self._mean(np.asarray(mask, dtype=np.float64))
+
+    def mean(self, column):
+        values = self.frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._mean(np.nan_to_num(values), ~np.isnan(values))
+
+    def value_counts(self, column, top_n=None):
+        """
+        Estimated population count of every category seen in the sample (by descending estimate, optionally
+        the top_n plus an 'Other' bucket), with the interval bounds in 'low' and 'high'.
+        """
+        codes, labels = pd.factorize(self.frame[column])
+        shares, errors = self._shares(codes, len(labels))
+        order = np.argsort(-shares, kind='stable')
+        kept = order[:top_n] if top_n else order
+        table = pd.DataFrame({'share': shares[kept], 'error': errors[kept]}, index=pd.Index(labels[kept], name=column))
+        if top_n and len(order) > top_n:
+            other, other_error = self.proportion(~np.isin(codes, kept))
+            table = pd.concat([table, pd.DataFrame({'share': [other], 'error': [other_error]}, index=['Other'])])
+        total = self.population_rows
+        return pd.DataFrame({'count': table['share'] * total, 'low': (table['share'] - table['error']).clip(lower=0) * total,
+                             'high': (table['share'] + table['error']) * total, 'share': table['share'], 'error': table['error']})
+
+    def quantiles(self, column, quantiles=(0.25, 0.5, 0.75)):
+        """Weighted quantiles of a numeric column with (low, high) interval bounds, as a DataFrame indexed by q."""
+        values = self.frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        order = np.argsort(values[valid], kind='stable')
+        sorted_values = values[valid][order]
+        if sorted_values.size == 0:
+            return pd.DataFrame(np.nan, index=list(quantiles), columns=['value', 'low', 'high'])
+        cdf = np.cumsum(self.weights[valid][order])
+        cdf /= cdf[-1]
+
+        def inverse(p):
+            return sorted_values[np.minimum(np.searchsorted(cdf, np.clip(p, 0, 1)), sorted_values.size - 1)]
+
+        rows = []
+        for q in quantiles:
+            value = inverse(q)
+            _, error = self._mean((values <= value).astype(np.float64), valid)
+            rows.append((value, inverse(q - error), inverse(q + error)))
+        return pd.DataFrame(rows, index=list(quantiles), columns=['value', 'low', 'high'])
+
+    def histogram(self, column, bins=30):
+        """Estimated population counts per bin with interval half-widths: (edges, counts, errors)."""
+        values = self.frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        edges = np.histogram_bin_edges(values[valid], bins=bins)
+        index = np.where(valid, np.clip(np.searchsorted(edges, values, side='right') - 1, 0, len(edges) - 2), -1)
+        shares, errors = self._shares(index, len(edges) - 1)
+        return edges, shares * self.population_rows, errors * self.population_rows
+
+    def profile(self, head=None):
+        """
+        ProfileReport of the population estimated from the sample: counts and null counts are scaled
+        estimates with their error ('count ±'), numeric statistics are weighted with
+        intervals for the mean and quartiles (profiling.PREVIEW_STATS), distinct counts are those seen in the sample
+        (lower bounds) and duplicate rows are not counted.
+        """
+        if self.exact:
+            report = profile_dataframe(self.frame, head_rows=0)
+            report.head = head
+            return report
+        total = self.population_rows
+        columns = {}
+        for col in self.frame.columns:
+            series = self.frame[col]
+            null_share, null_error = self.proportion(series.isna().to_numpy())
+            stats = {'dtype': str(series.dtype), 'count': round((1 - null_share) * total),
+                     'null_count': round(null_share * total), 'count ±': round(null_error * total),
+                     'memory_bytes': int(series.memory_usage(index=False) * total / self.n_rows),
+                     'nunique': int(series.nunique())}
+            if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                mean, mean_error = self.mean(col)
+                square, _ = self._mean(np.nan_to_num(values - mean) ** 2, ~np.isnan(values))
+                quartiles = self.quantiles(col)
+                stats.update({'mean': mean, 'std': np.sqrt(square), 'min': np.nanmin(values) if stats['count'] else np.nan,
+                              '25%': quartiles.loc[0.25, 'value'], '50%': quartiles.loc[0.5, 'value'],
+                              '75%': quartiles.loc[0.75, 'value'], 'max': np.nanmax(values) if stats['count'] else np.nan,
+                              'mean ±': mean_error})
+                for q, name in ((0.25, '25%'), (0.5, '50%'), (0.75, '75%')):
+                    stats[f'{name} low'], stats[f'{name} high'] = quartiles.loc[q, 'low'], quartiles.loc[q, 'high']
+            columns[col] = stats
+        return ProfileReport(total, columns, head=head, sample=self.describe())
+
+
+def reservoir_sample(data, n, seed=0, confidence=0.95):
+    """
+    Uniform sample of n rows without replacement, from a DataFrame or an iterable of DataFrame chunks
+    (e.g. streaming.iter_chunks) read once: every row gets a random key and the n smallest keys are kept
+    across chunks, so memory stays at n rows whatever the table size.
+    """
+    rng = np.random.default_rng(seed)
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    reservoir, keys, seen = None, np.empty(0), 0
+    for chunk in chunks:
+        chunk_keys = rng.random(len(chunk))
+        seen += len(chunk)
+        # only rows whose key beats the current n-th smallest can enter the reservoir
+        if reservoir is not None and len(keys) == n:
+            candidates = np.flatnonzero(chunk_keys < keys.max())
+            chunk, chunk_keys = chunk.iloc[candidates], chunk_keys[candidates]
+        combined = chunk if reservoir is None else pd.concat([reservoir, chunk])
+        keys = np.concatenate([keys, chunk_keys])
+        if len(keys) > n:
+            kept = np.sort(np.argpartition(keys, n)[:n])
+            combined, keys = combined.iloc[kept], keys[kept]
+        reservoir = combined
+    return Sample(reservoir, np.zeros(len(reservoir), dtype=np.int64), [seen], 'reservoir', confidence)
+
+
+def _allocate(sizes, n, min_per_stratum):
+    """
+    Rows drawn from every stratum, n in total: min_per_stratum (or all its rows) first, an even share of n
+    when the strata are too many for that, then the rest of n proportionally to the rows left in each stratum.
+    """
+    floor = np.minimum(sizes, min_per_stratum)
+    if floor.sum() > n:
+        floor = np.minimum(sizes, n // len(sizes))
+    rest = sizes - floor
+    target = min(n - floor.sum(), rest.sum()) * rest / max(rest.sum(), 1)
+    extra = np.floor(target).astype(np.int64)
+    # the rows lost to rounding go to the largest remainders
+    extra[np.argsort(extra - target, kind='stable')[:int(round(target.sum() - extra.sum()))]] += 1
+    return floor + extra
+
+
+def stratified_sample(data, n, strata, min_per_stratum=10, seed=0, confidence=0.95, columns=None):
+    """
+    Sample of at most n rows over the strata (every combination of the values of the strata columns,
+    missing values included): each stratum gets min_per_stratum rows (or all of its rows) so rare categories
+    survive, and the rest of the budget is allocated proportionally. Rows of each stratum are drawn without
+    replacement. data can be a lazy source (see backends.as_backend): only the strata columns are read in
+    full, and the sampled rows of `columns` (default: all) are then fetched by position in the engine.
+    """
+    rng = np.random.default_rng(seed)
+    backend = as_backend(data)
+    strata = list(strata)
+    codes = backend.scan(strata).groupby(strata, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    sizes = np.bincount(codes)
+    allocation = _allocate(sizes, n, min_per_stratum)
+    # a random key per row; the allocation's smallest keys of each stratum are kept
+    order = np.lexsort((rng.random(len(codes)), codes))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(len(codes)) - starts[codes[order]]
+    kept = np.sort(order[rank < allocation[codes[order]]])
+    return Sample(backend.take(kept, columns), codes[kept], sizes, 'stratified', confidence)
+
+
+def uniform_sample(data, n, seed=0, confidence=0.95, columns=None):
+    """Uniform sample of n rows without replacement, drawn by position and read in the engine of a lazy source."""
+    backend = as_backend(data)
+    total = backend.num_rows()
+    kept = np.sort(np.random.default_rng(seed).choice(total, size=min(n, total), replace=False))
+    return Sample(backend.take(kept, columns), np.zeros(len(kept), dtype=np.int64), [total], 'uniform', confidence)
+
+
+def draw_sample(data, n, strata=None, seed=0, confidence=0.95, columns=None):
+    """
+    Stratified sample on the strata columns when given, else a reservoir sample (a uniform sample drawn in
+    the engine for lazy sources); the whole data when it has at most n rows.
+    Parameters:
+    - data: DataFrame, iterable of DataFrame chunks (uniform only) or lazy source (Polars, pyarrow).
+    - columns (list): Columns kept in the sample (default: all).
+    """
+    if columns is not None:
+        columns = list(dict.fromkeys(list(strata or []) + list(columns)))
+    if isinstance(data, pd.DataFrame):
+        data = data if columns is None else data[columns]
+        if len(data) <= n:
+            return Sample(data, np.zeros(len(data), dtype=np.int64), [len(data)], 'reservoir', confidence)
+    elif not (isinstance(data, Backend) or type(data).__module__.split('.')[0] in ('polars', 'pyarrow')):
+        return reservoir_sample(data, n, seed=seed, confidence=confidence)
+    if strata:
+        return stratified_sample(data, n, strata, seed=seed, confidence=confidence, columns=columns)
+    if isinstance(data, pd.DataFrame):
+        return reservoir_sample(data, n, seed=seed, confidence=confidence)
+    return uniform_sample(data, n, seed=seed, confidence=confidence, columns=columns)
+
+
+def preview_countplot(sample, column, top_n=None, title=None):
+    """Bar chart of the estimated category counts with their confidence intervals as error bars."""
+    counts = sample.value_counts(column, top_n)
+    plt.figure(figsize=(10, 6))
+    positions = np.arange(len(counts))
+    plt.bar(positions, counts['count'], yerr=[counts['count'] - counts['low'], counts['high'] - counts['count']],
+            color='cornflowerblue', ecolor='black', capsize=2)
+    plt.xticks(positions, [str(label) for label in counts.index], rotation=90)
+    plt.title(f"{title if title else f'Count Plot of {column}'}\n({sample.describe()})")
+    plt.xlabel(column)
+    plt.ylabel('Estimated count')
+    plt.show()
+
+
+def preview_pieplot(sample, column, top_n=None, title=None, startangle=90):
+    """Pie of the estimated category shares, each labelled with its ± sampling error."""
+    counts = sample.value_counts(column, top_n)
+    plt.figure(figsize=(10, 6))
+    plt.pie(counts['share'], labels=[f'{label} (±{error:.1%})' for label, error in zip(counts.index, counts['error'])],
+            autopct='%1.1f%%', startangle=startangle, wedgeprops={'edgecolor': 'black', 'linewidth': 0.5})
+    plt.title(f"{title if title else f'Pie Plot of {column}'}\n({sample.describe()})")
+    plt.show()
+
+
+def preview_histogram(sample, column, bins=30, title=None):
+    """Histogram of estimated population counts per bin with their confidence intervals."""
+    edges, counts, errors = sample.histogram(column, bins)
+    plt.figure(figsize=(10, 6))
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', yerr=errors, color='cornflowerblue',
+            edgecolor='black', ecolor='dimgray', capsize=0)
+    plt.title(f"{title if title else f'Histogram of {column}'}\n({sample.describe()})")
+    plt.xlabel(column)
+    plt.ylabel('Estimated count')
+    plt.show()
+
+
+def preview_kdeplot(sample, column, title=None):
+    """KDE of the sample weighted by the rows each sampled row stands for."""
+    plt.figure(figsize=(10, 6))
+    sns.kdeplot(x=sample.frame[column].to_numpy(dtype=np.float64, na_value=np.nan), weights=sample.weights, fill=True)
+    plt.title(f"{title if title else f'KDE Plot of {column}'}\n({sample.describe()}, sampling error not shown)")
+    plt.xlabel(column)
+    plt.show()
+
+
+def preview_boxplot(sample, column, title=None):
+    """Box plot from the weighted quartiles; the notch spans the confidence interval of the median."""
+    quartiles = sample.quantiles(column)
+    q1, median, q3 = quartiles['value']
+    values = sample.frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    inside = values[(values >= low) & (values <= high)]
+    stats = [{'label': column, 'med': median, 'q1': q1, 'q3': q3, 'cilo': quartiles.loc[0.5, 'low'], 'cihi': quartiles.loc[0.5, 'high'],
+              'whislo': inside.min() if inside.size else q1, 'whishi': inside.max() if inside.size else q3,
+              'fliers': values[(values < low) | (values > high)][:200]}]
+    plt.figure(figsize=(10, 6))
+    plt.gca().bxp(stats, shownotches=True, patch_artist=True, boxprops={'facecolor': 'cornflowerblue'})
+    plt.title(f"{title if title else f'Box Plot of {column}'}\n({sample.describe()})")
+    plt.show()
+
+
+def progressive_profiles(data, start_rows=100_000, growth=4, strata=None, seed=0, confidence=0.95):
+    """
+    Yields (Sample, ProfileReport) for growing samples (start_rows, times growth at each step), ending
+    with the exact profile of the whole data, so a first estimate is available in seconds and is refined
+    toward the exact result. data is a DataFrame or a lazy source (see draw_sample).
+    """
+    backend = as_backend(data)
+    head = backend.take(np.arange(min(5, backend.num_rows())))
+    n = start_rows
+    while True:
+        sample = draw_sample(data, n, strata=strata, seed=seed, confidence=confidence)
+        yield sample, sample.profile(head=head)
+        if sample.exact:
+            return
+        n *= growth
+
+
+class BackgroundRefinement:
+    def __init__(self, data, start_rows=100_000, growth=4, strata=None, seed=0, confidence=0.95):
+        """
+        Runs progressive_profiles on a background thread. `latest` holds the most refined
+        (Sample, ProfileReport) so far; `done` tells whether it is the exact profile.
+        """
+        self.latest = None
+        self.error = None
+        self._profiles = progressive_profiles(data, start_rows=start_rows, growth=growth, strata=strata,
+                                              seed=seed, confidence=confidence)
+        self._stop = threading.Event()
+        self._updated = threading.Condition()
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            for result in self._profiles:
+                with self._updated:
+                    self.latest = result
+                    self._updated.notify_all()
+                if self._stop.is_set():
+                    break
+        except Exception as e:
+            self.error = e
+        finally:
+            with self._updated:
+                self._finished = True
+                self._updated.notify_all()
+
+    @property
+    def done(self):
+        return self.latest is not None and self.latest[0].exact
+
+    def first(self, timeout=None):
+        """
+        Blocks until the first (Sample, ProfileReport) is ready (or the timeout) and returns it,
+        re-raising the error of the refinement if it failed before.
+        """
+        with self._updated:
+            self._updated.wait_for(lambda: self.latest is not None or self._finished, timeout)
+        if self.latest is None and self.error is not None:
+            raise self.error
+        return self.latest
+
+    def wait(self, timeout=None):
+        """Waits for the exact profile (or the timeout) and returns the latest (Sample, ProfileReport)."""
+        self._thread.join(timeout)
+        return self.latest
+
+    def stop(self):
+        """Stops after the refinement step in progress."""
+        self._stop.set()
+
+
+# Usage
+# sample = draw_sample(data, 200_000, strata=['city', 'device'])
+# sample.profile().render()
+# display(sample.value_counts('city', top_n=10))          # estimated counts with low/high bounds
+# preview_countplot(sample, 'city', top_n=10)
+#
+# refinement = BackgroundRefinement(data, strata=['city'])
+# refinement.latest[1].render()                            # best estimate so far
+# refinement.wait()[1].render()                            # exact profile
@@ -0,0 +1,250 @@
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 1_000_000
+
+
+def _hash_values(values):
+    """Returns 64-bit hashes of a Series or array, vectorized."""
+    if isinstance(values, pd.Series):
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    return pd.util.hash_array(np.asarray(values))
+
+
+def _chunks(values, chunk_rows=CHUNK_ROWS):
+    for start in range(0, len(values), chunk_rows):
+        yield values[start:start + chunk_rows]
+
+
+class HyperLogLog:
+    def __init__(self, precision=14):
+        """
+        HyperLogLog distinct-count sketch.
+        Memory is 2**precision one-byte registers whatever the number of values added.
+        Parameters:
+        - precision (int): Number of index bits, between 4 and 18. The relative standard error is
+          1.04 / sqrt(2**precision), about 0.8% for the default.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError('precision must be between 4 and 18')
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        """Relative standard error of estimate()."""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values):
+        """Adds the non-null values of a Series or array to the sketch."""
+        if isinstance(values, pd.Series):
+            values = values.dropna()
+        p = self.precision
+        for chunk in _chunks(values):
+            hashes = _hash_values(chunk)
+            if hashes.size == 0:
+                continue
+            idx = (hashes >> np.uint64(64 - p)).astype(np.int64)
+            remainder = hashes & np.uint64((1 << (64 - p)) - 1)
+            # rank = position of the leftmost 1-bit in the remaining 64 - p bits
+            _, bit_length = np.frexp(remainder.astype(np.float64))
+            rank = (64 - p + 1 - bit_length).astype(np.uint8)
+            np.maximum.at(self.registers, idx, rank)
+        return self
+
+    def merge(self, other):
+        """Folds another sketch with the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError('Cannot merge HyperLogLog sketches with different precision')
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """Returns the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and zeros:
+            # small-range correction (linear counting)
+            return float(m * np.log(m / zeros))
+        return float(raw)
+
+
+class KLLSketch:
+    def __init__(self, k=1024, seed=None):
+        """
+        Mergeable quantile sketch built from a stack of compactors.
+        Each level keeps at most k values of weight 2**level; a full level is sorted and every other value
+        (random offset) is promoted to the next level. Memory is k * log2(n / k) values.
+        Parameters:
+        - k (int): Capacity of each level. Larger k means smaller rank error.
+        - seed (int): Seed for the compaction offsets (optional).
+        """
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._max_rank_error = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self):
+        """
+        Upper bound of the normalized rank error of quantile(): the returned value's true rank is within
+        rank_error * n of the requested rank. Each compaction at level h moves any rank by at most 2**h.
+        """
+        return self._max_rank_error / self.n if self.n else 0.0
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self.k:
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                level = level[:len(level) - len(keep)]
+                promoted = level[self._rng.integers(2)::2]
+                self.levels[h] = keep
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                self._max_rank_error += 1 << h
+            h += 1
+
+    def update(self, values):
+        """Adds the finite values of a Series or array to the sketch."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+        self.n += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Folds another KLLSketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._max_rank_error += other._max_rank_error
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Returns approximate quantiles (linear interpolation between retained values)."""
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 1 << h, dtype=np.float64) for h, level in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values = values[order]
+        # rank of each retained value at the centre of its weight
+        weights = weights[order]
+        ranks = (np.cumsum(weights) - weights / 2) / weights.sum()
+        result = np.interp(q, ranks, values)
+        result[q <= 0] = self.min
+        result[q >= 1] = self.max
+        return result
+
+
+class SpaceSaving:
+    def __init__(self, capacity=1000):
+        """
+        Space-Saving heavy-hitters sketch keeping at most `capacity` counters.
+        For every tracked value the true count lies in [count - error, count]; any value not tracked
+        occurred at most `floor` times. Any value more frequent than n / capacity is guaranteed tracked.
+        Parameters:
+        - capacity (int): Number of counters kept.
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.floor = 0
+        self.n = 0
+
+    def _fold(self, counts, errors, other_floor):
+        tracked = counts.index.isin(self.counts.index)
+        # a value we are not tracking may already have occurred up to `floor` times
+        new_counts = counts.copy()
+        new_errors = errors.copy()
+        new_counts[~tracked] += self.floor
+        new_errors[~tracked] += self.floor
+        missing = ~self.counts.index.isin(counts.index)
+        old_counts = self.counts.copy()
+        old_errors = self.errors.copy()
+        old_counts[missing] += other_floor
+        old_errors[missing] += other_floor
+        self.counts = old_counts.add(new_counts, fill_value=0).astype(np.int64)
+        self.errors = old_errors.add(new_errors, fill_value=0).astype(np.int64)
+        self.floor += other_floor
+        if len(self.counts) > self.capacity:
+            self.counts = self.counts.sort_values(ascending=False, kind='stable')
+            self.floor = max(self.floor, int(self.counts.iloc[self.capacity]))
+            self.counts = self.counts.iloc[:self.capacity]
+            self.errors = self.errors.reindex(self.counts.index)
+
+    def update(self, values):
+        """Adds the non-null values of a Series or array to the sketch, one bounded chunk at a time."""
+        values = pd.Series(values) if not isinstance(values, pd.Series) else values
+        for chunk in _chunks(values):
+            counts = chunk.value_counts(dropna=True)
+            self.n += int(counts.sum())
+            self._fold(counts.astype(np.int64), pd.Series(0, index=counts.index, dtype=np.int64), 0)
+        return self
+
+    def merge(self, other):
+        """Folds another SpaceSaving sketch into this one."""
+        self.n += other.n
+        self._fold(other.counts, other.errors, other.floor)
+        return self
+
+    def top(self, top_n=None):
+        """
+        Returns the most frequent values as a DataFrame with 'count' (upper bound) and 'error' columns,
+        sorted by count in descending order.
+        """
+        result = pd.DataFrame({'count': self.counts, 'error': self.errors.reindex(self.counts.index)})
+        result = result.sort_values('count', ascending=False, kind='stable')
+        return result if top_n is None else result.iloc[:top_n]
+
+
+def approximate_column_stats(series, precision=14, k=1024):
+    """
+    Computes distinct count and describe()-style statistics of a column with sketches.
+    Error bounds are returned next to the values: 'nunique_relative_error' (standard error) and
+    'quantile_rank_error' (upper bound on the normalized rank error of the quartiles).
+    """
+    distinct = HyperLogLog(precision).update(series)
+    stats = {'nunique': int(round(distinct.estimate())), 'nunique_relative_error': distinct.relative_error}
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = values[~np.isnan(values)]
+        sketch = KLLSketch(k)
+        for chunk in _chunks(valid):
+            sketch.update(chunk)
+        count = valid.size
+        if count:
+            mean = valid.mean()
+            std = valid.std(ddof=1) if count > 1 else np.nan
+            q1, q2, q3 = sketch.quantile([0.25, 0.5, 0.75])
+            stats.update({'count': count, 'mean': mean, 'std': std, 'min': sketch.min, '25%': q1, '50%': q2,
+                          '75%': q3, 'max': sketch.max, 'quantile_rank_error': sketch.rank_error})
+        else:
+            stats.update(dict(zip(['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'], [0] + [np.nan] * 7)))
+    return stats
+
+
+# Usage
+# hll = HyperLogLog().update(data['user_id']); hll.estimate(), hll.relative_error
+# kll = KLLSketch().update(data['Purchase']); kll.quantile([0.25, 0.5, 0.75]), kll.rank_error
+# heavy = SpaceSaving(capacity=100).update(data['Product']); heavy.top(10)
@@ -0,0 +1,151 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+_MISSING = object()
+_PANDAS_3 = int(pd.__version__.split('.')[0]) >= 3
+
+
+def column_fingerprint(series):
+    """
+    Data-version fingerprint of a column: length, dtype and a hash over every value and index label in
+    row order. Any change (an in-place edit of a single value, dropped or reordered rows) gives a new
+    fingerprint, so cached statistics and row-position indexes are never served for changed data.
+    Costs one hashing pass over the raw buffer of numeric columns (the codes of category columns), and a
+    vectorized pandas hash of the values otherwise; a RangeIndex is hashed by its bounds.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        digest.update(np.ascontiguousarray(series.cat.codes.to_numpy()).data)
+        digest.update(pd.util.hash_pandas_object(series.cat.categories).to_numpy().data)
+    elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufmM':
+        digest.update(np.ascontiguousarray(series.to_numpy()).view(np.uint8).data)
+    else:
+        digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().data)
+    if isinstance(series.index, pd.RangeIndex):
+        digest.update(repr((series.index.start, series.index.stop, series.index.step)).encode())
+    else:
+        digest.update(pd.util.hash_pandas_object(series.index).to_numpy().data)
+    return (len(series), str(series.dtype), digest.hexdigest())
+
+
+def _address(values):
+    """Identity of the data behind a Series or Index: buffer address for NumPy dtypes, array object otherwise."""
+    if isinstance(values.dtype, np.dtype):
+        array = values.to_numpy()
+        return array.__array_interface__['data'][0], array.strides
+    return id(values.array)
+
+
+def column_token(series):
+    """
+    Cheap version token of a column: the identity of its values and index data (see _address), its
+    length and dtype. It stays valid as long as a reference to the series is kept: with copy-on-write,
+    writing to a column that is referenced elsewhere copies it first, so an edited column gets new values
+    and a new token. Without copy-on-write (pandas 2 defaults) this falls back to column_fingerprint.
+    """
+    # pandas 3 always copies on write; pandas 2 only with the option on
+    if not (_PANDAS_3 or pd.get_option('mode.copy_on_write') is True):
+        return column_fingerprint(series)
+    index = series.index
+    index_token = (index.start, index.stop, index.step) if isinstance(index, pd.RangeIndex) else _address(index)
+    return (len(series), str(series.dtype), _address(series), index_token)
+
+
+def frame_fingerprint(data, columns=None):
+    """Fingerprint of several columns of a DataFrame (all columns by default)."""
+    columns = list(data.columns) if columns is None else list(columns)
+    digest = hashlib.blake2b(digest_size=16)
+    for column in columns:
+        digest.update(repr((column, column_fingerprint(data[column]))).encode())
+    return digest.hexdigest()
+
+
+def estimate_size(value, _depth=0):
+    """Rough memory size in bytes of a cached value (NumPy/pandas buffers plus their containers)."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.Series, pd.DataFrame, pd.Index)):
+        usage = value.memory_usage(index=True) if not isinstance(value, pd.Index) else value.memory_usage()
+        return int(np.sum(usage))
+    if _depth > 2:
+        return 64
+    if isinstance(value, dict):
+        return sum(estimate_size(item, _depth + 1) for item in value.values()) + 64
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(item, _depth + 1) for item in value) + 64
+    if hasattr(value, '__dict__'):
+        return estimate_size(vars(value), _depth + 1)
+    return 64
+
+
+class StatsCache:
+    def __init__(self, max_bytes=512 * 1024 ** 2, store=None):
+        """
+        Memoizes per-column statistics (category indexes, univariate summaries, sketches, ...).
+        Entries are keyed by column, statistic name and parameters, and store the column they were
+        computed on with its column_token; a changed token (new or edited values, new index) is a miss.
+        A lookup costs no pass over the data; the full column_fingerprint is only computed for the key of
+        the on-disk store. Holding the column keeps an edited column's previous values alive until its entry is
+        replaced or evicted. Least recently used entries are evicted when the total estimated size exceeds
+        max_bytes.
+        Parameters:
+        - max_bytes (int): Memory cap of the cache.
+        - store (PlotCache): Optional on-disk tier; misses of persisted statistics (counts, bins, summaries,
+          sketches) are looked up there before computing and computed values are written back, so they
+          survive across sessions. Row-level structures stay in memory only.
+        """
+        self.max_bytes = max_bytes
+        self.store = store
+        self._entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, data, column, stat, compute, params=(), persist=True):
+        """
+        Returns the cached value of `stat` for data[column], computing it with compute() when missing or
+        when the column changed since it was cached. persist=False keeps the value out of the on-disk
+        store (e.g. indexes holding a code or position per row, as large as the column itself).
+        """
+        key = (column, stat, params)
+        series = data[column]
+        token = column_token(series)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == token:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        if self.store is None or not persist:
+            value = compute()
+        else:
+            store_key = self.store.make_key((column_fingerprint(series),), stat, (column, params))
+            value = self.store.load(store_key, _MISSING)
+            if value is _MISSING:
+                value = compute()
+                self.store.save(store_key, value)
+        self._store(key, token, series, value)
+        return value
+
+    def _store(self, key, token, series, value):
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key)[3]
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        # the series keeps the token valid (see column_token)
+        self._entries[key] = (token, series, value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, _, _, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def invalidate(self, column=None):
+        """Drops the cached statistics of one column, or of all columns."""
+        for key in [key for key in self._entries if column is None or key[0] == column]:
+            self.total_bytes -= self._entries.pop(key)[3]
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,459 @@
+import os
+import numpy as np
+import pandas as pd
+
+from ._lazy import plt
+from .profiling import ProfileReport, NUMERIC_STATS
+from .sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+def iter_chunks(path, chunksize=1_000_000, columns=None, file_format=None, **read_kwargs):
+    """
+    Yields a CSV or Parquet file as a sequence of pandas DataFrames.
+    Parameters:
+    - path (str): Path of the file.
+    - chunksize (int): Rows per chunk (rows per record batch for Parquet).
+    - columns (list): Columns to read (optional, all columns by default).
+    - file_format (str): 'csv' or 'parquet'. Inferred from the file extension if not given.
+    - read_kwargs: Extra keyword arguments passed to pandas.read_csv.
+    """
+    if file_format is None:
+        file_format = 'parquet' if os.path.splitext(path)[1].lower() in ('.parquet', '.pq') else 'csv'
+    if file_format == 'parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError('Reading Parquet files in chunks requires pyarrow') from e
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    elif file_format == 'csv':
+        with pd.read_csv(path, chunksize=chunksize, usecols=columns, **read_kwargs) as reader:
+            for chunk in reader:
+                yield chunk
+    else:
+        raise ValueError(f"Unsupported file_format '{file_format}', expected 'csv' or 'parquet'")
+
+
+class StreamingHistogram:
+    def __init__(self, n_bins=256):
+        """
+        Fixed-size histogram whose range grows as new values arrive.
+        When a value falls outside the current range, the bin width is doubled (adjacent bins merged)
+        until it fits, so memory stays at n_bins counters regardless of the number of values.
+        Parameters:
+        - n_bins (int): Number of bins (must be even).
+        """
+        self.n_bins = n_bins
+        self.lo = None
+        self.width = None
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+
+    @property
+    def hi(self):
+        return self.lo + self.width * self.n_bins
+
+    @property
+    def edges(self):
+        return self.lo + self.width * np.arange(self.n_bins + 1)
+
+    def _init_range(self, vmin, vmax):
+        span = vmax - vmin
+        if span <= 0:
+            span = max(abs(vmin), 1.0)
+        self.lo = vmin
+        self.width = span * (1 + 1e-9) / self.n_bins
+
+    def _grow(self, vmin, vmax):
+        n = self.n_bins
+        while vmin < self.lo:
+            self.counts = np.concatenate([np.zeros(n, dtype=np.int64), self.counts]).reshape(-1, 2).sum(axis=1)
+            self.lo -= self.width * n
+            self.width *= 2
+        while vmax >= self.hi:
+            self.counts = np.concatenate([self.counts, np.zeros(n, dtype=np.int64)]).reshape(-1, 2).sum(axis=1)
+            self.width *= 2
+
+    def update(self, values, weights=None):
+        """Adds finite float values (optionally weighted) to the histogram."""
+        if values.size == 0:
+            return
+        vmin, vmax = values.min(), values.max()
+        if self.lo is None:
+            self._init_range(vmin, vmax)
+        self._grow(vmin, vmax)
+        idx = ((values - self.lo) / self.width).astype(np.int64)
+        np.clip(idx, 0, self.n_bins - 1, out=idx)
+        self.counts += np.bincount(idx, weights=weights, minlength=self.n_bins).astype(np.int64)
+
+    def merge(self, other):
+        """Folds another histogram into this one (counts are re-binned at the other's bin centers)."""
+        if other.lo is None:
+            return self
+        nonzero = other.counts > 0
+        centers = (other.edges[:-1] + other.width / 2)[nonzero]
+        self.update(centers, weights=other.counts[nonzero])
+        return self
+
+    def quantile(self, q, vmin=None, vmax=None):
+        """Approximates quantiles by linear interpolation inside bins, clamped to [vmin, vmax]."""
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        total = self.counts.sum()
+        if total == 0:
+            return np.full(q.shape, np.nan)
+        cumulative = np.concatenate([[0], np.cumsum(self.counts)])
+        result = np.interp(q * total, cumulative, self.edges)
+        return np.clip(result, vmin if vmin is not None else -np.inf, vmax if vmax is not None else np.inf)
+
+
+class NumericAccumulator:
+    def __init__(self, n_bins=256, approximate=False):
+        """
+        Mergeable summary of a numeric column: count, nulls, mean/variance (parallel algorithm), min, max
+        and a StreamingHistogram for quantiles and plots. The statistics cover the finite values; infinite
+        values are counted apart in inf_count, like the nulls.
+        Parameters:
+        - n_bins (int): Number of histogram bins.
+        - approximate (bool): Also keep a HyperLogLog distinct count and a KLL sketch, which then
+          provides the quartiles with a rank-error bound.
+        """
+        self.count = 0
+        self.null_count = 0
+        self.inf_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.histogram = StreamingHistogram(n_bins)
+        self.distinct = HyperLogLog() if approximate else None
+        self.sketch = KLLSketch() if approximate else None
+        self.dtype = None
+
+    def _combine(self, count, mean, m2, vmin, vmax):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = min(self.min, vmin)
+        self.max = max(self.max, vmax)
+
+    def update(self, series):
+        """Folds a chunk of the column into the summary."""
+        self.dtype = self.dtype or str(series.dtype)
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        finite = np.isfinite(values)
+        valid = values[finite]
+        nulls = int(np.count_nonzero(np.isnan(values)))
+        self.null_count += nulls
+        # +-inf would make the histogram range grow without end
+        self.inf_count += values.size - valid.size - nulls
+        if valid.size:
+            mean = valid.mean()
+            self._combine(valid.size, mean, ((valid - mean) ** 2).sum(), valid.min(), valid.max())
+            self.histogram.update(valid)
+            if self.sketch is not None:
+                self.sketch.update(valid)
+                self.distinct.update(valid)
+
+    def merge(self, other):
+        """Folds another NumericAccumulator (e.g. from another shard) into this one."""
+        self.dtype = self.dtype or other.dtype
+        self.null_count += other.null_count
+        self.inf_count += other.inf_count
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        self.histogram.merge(other.histogram)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+            self.distinct.merge(other.distinct)
+        return self
+
+    def quantile(self, q):
+        if self.sketch is not None:
+            return self.sketch.quantile(q)
+        return self.histogram.quantile(q, vmin=self.min, vmax=self.max)
+
+    def stats(self):
+        """
+        Returns describe()-style statistics; quartiles are approximated from the histogram, or from the KLL
+        sketch (with 'quantile_rank_error') in approximate mode.
+        """
+        if self.count == 0:
+            return dict(zip(NUMERIC_STATS, [0] + [np.nan] * 7))
+        std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        q1, q2, q3 = self.quantile([0.25, 0.5, 0.75])
+        stats = dict(zip(NUMERIC_STATS, [self.count, self.mean, std, self.min, q1, q2, q3, self.max]))
+        if self.sketch is not None:
+            stats['quantile_rank_error'] = self.sketch.rank_error
+        return stats
+
+
+class CategoricalAccumulator:
+    def __init__(self, max_categories=100_000, approximate=False):
+        """
+        Mergeable value counts of a categorical column.
+        Parameters:
+        - max_categories (int): Maximum number of distinct values kept. Beyond it the rarest values are
+          dropped and counted in `dropped_count`, and distinct counts become lower bounds.
+        - approximate (bool): Keep a Space-Saving sketch of max_categories counters and a HyperLogLog
+          distinct count instead of exact value counts.
+        """
+        self.max_categories = max_categories
+        self.heavy_hitters = SpaceSaving(max_categories) if approximate else None
+        self.distinct = HyperLogLog() if approximate else None
+        self.value_counts = pd.Series(dtype=np.int64)
+        self.null_count = 0
+        self.dropped_count = 0
+        self.truncated = False
+        self.dtype = None
+
+    @property
+    def count(self):
+        return int(self.value_counts.sum()) + self.dropped_count
+
+    def _add_counts(self, counts):
+        self.value_counts = self.value_counts.add(counts, fill_value=0).astype(np.int64)
+        if len(self.value_counts) > self.max_categories:
+            self.value_counts = self.value_counts.sort_values(ascending=False, kind='stable')
+            self.dropped_count += int(self.value_counts.iloc[self.max_categories:].sum())
+            self.value_counts = self.value_counts.iloc[:self.max_categories]
+            self.truncated = True
+
+    def update(self, series):
+        """Folds a chunk of the column into the summary."""
+        self.dtype = self.dtype or str(series.dtype)
+        if self.heavy_hitters is not None:
+            n_before = self.heavy_hitters.n
+            self.heavy_hitters.update(series)
+            self.distinct.update(series)
+            self.null_count += int(series.size - (self.heavy_hitters.n - n_before))
+            self.value_counts = self.heavy_hitters.counts
+            self.dropped_count = self.heavy_hitters.n - int(self.value_counts.sum())
+            return
+        counts = series.value_counts(dropna=True)
+        self.null_count += int(series.size - counts.sum())
+        self._add_counts(counts)
+
+    def merge(self, other):
+        """Folds another CategoricalAccumulator (e.g. from another shard) into this one."""
+        self.dtype = self.dtype or other.dtype
+        self.null_count += other.null_count
+        self.dropped_count += other.dropped_count
+        self.truncated = self.truncated or other.truncated
+        if self.heavy_hitters is not None and other.heavy_hitters is not None:
+            self.heavy_hitters.merge(other.heavy_hitters)
+            self.distinct.merge(other.distinct)
+            self.value_counts = self.heavy_hitters.counts
+            self.dropped_count = self.heavy_hitters.n - int(self.value_counts.sum())
+            return self
+        self._add_counts(other.value_counts)
+        return self
+
+    @property
+    def nunique(self):
+        """Returns (distinct count, is_exact)."""
+        if self.distinct is not None:
+            return int(round(self.distinct.estimate())), False
+        return len(self.value_counts), not self.truncated
+
+    def top(self, top_n=None):
+        """Returns value counts sorted in descending order, limited to top_n values if given."""
+        counts = self.value_counts.sort_values(ascending=False, kind='stable')
+        return counts if top_n is None else counts.iloc[:top_n]
+
+
+class StreamingProfiler:
+    def __init__(self, n_bins=256, max_categories=100_000, approximate=False):
+        """
+        Profiles data that arrives in chunks, keeping one mergeable accumulator per column.
+        Memory is bounded by the chunk size plus the accumulator sizes, not by the number of rows.
+        Parameters:
+        - n_bins (int): Histogram bins per numeric column.
+        - max_categories (int): Distinct values kept per categorical column.
+        - approximate (bool): Use constant-memory sketches (HyperLogLog, KLL, Space-Saving), which also
+          give distinct counts of numeric columns.
+        """
+        self.n_bins = n_bins
+        self.max_categories = max_categories
+        self.approximate = approximate
+        self.accumulators = {}
+        self.n_rows = 0
+        self.memory_bytes = {}
+
+    @staticmethod
+    def _is_numeric(series):
+        return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+    def _new_accumulator(self, series):
+        if self._is_numeric(series):
+            return NumericAccumulator(self.n_bins, approximate=self.approximate)
+        return CategoricalAccumulator(self.max_categories, approximate=self.approximate)
+
+    def _to_categorical(self, accumulator):
+        """
+        CategoricalAccumulator continuing a NumericAccumulator whose column turned out not to be numeric
+        (e.g. all missing in the first chunks, strings later). The nulls carry over; the numbers seen so
+        far (infinities included) are counted in dropped_count, since their values were not kept.
+        """
+        seen = accumulator.count + accumulator.inf_count
+        categorical = CategoricalAccumulator(self.max_categories, approximate=self.approximate)
+        categorical.null_count = accumulator.null_count
+        categorical.dropped_count = seen
+        categorical.truncated = seen > 0
+        if categorical.heavy_hitters is not None:
+            categorical.heavy_hitters.n += seen
+        return categorical
+
+    def update(self, chunk):
+        """
+        Folds a DataFrame chunk into the per-column accumulators. The accumulator type comes from the first
+        chunk of a column; a numeric column receiving non-numeric values switches to a categorical one.
+        """
+        for col in chunk.columns:
+            if col not in self.accumulators:
+                self.accumulators[col] = self._new_accumulator(chunk[col])
+                self.memory_bytes[col] = 0
+            elif isinstance(self.accumulators[col], NumericAccumulator) and not self._is_numeric(chunk[col]):
+                self.accumulators[col] = self._to_categorical(self.accumulators[col])
+            self.accumulators[col].update(chunk[col])
+            self.memory_bytes[col] += int(chunk[col].memory_usage(index=False))
+        self.n_rows += len(chunk)
+        return self
+
+    def merge(self, other):
+        """Folds another StreamingProfiler (e.g. computed on another file or shard) into this one."""
+        for col, accumulator in other.accumulators.items():
+            if col in self.accumulators:
+                if type(self.accumulators[col]) is not type(accumulator):
+                    # the column is numeric in one shard only
+                    if isinstance(accumulator, NumericAccumulator):
+                        accumulator = self._to_categorical(accumulator)
+                    else:
+                        self.accumulators[col] = self._to_categorical(self.accumulators[col])
+                self.accumulators[col].merge(accumulator)
+                self.memory_bytes[col] += other.memory_bytes[col]
+            else:
+                self.accumulators[col] = accumulator
+                self.memory_bytes[col] = other.memory_bytes[col]
+        self.n_rows += other.n_rows
+        return self
+
+    def report(self):
+        """
+        Returns a ProfileReport with the same sections as basic_eda. Quartiles are histogram approximations,
+        distinct counts are only given for categorical columns unless approximate=True, and duplicate rows
+        are not computed. Numeric statistics cover the finite values; infinities are in 'inf_count'.
+        """
+        columns = {}
+        for col, accumulator in self.accumulators.items():
+            stats = {
+                'dtype': accumulator.dtype,
+                'count': accumulator.count,
+                'null_count': accumulator.null_count,
+                'memory_bytes': self.memory_bytes[col],
+                'nunique': None,
+            }
+            if isinstance(accumulator, NumericAccumulator):
+                stats['inf_count'] = accumulator.inf_count
+                stats.update(accumulator.stats())
+                if accumulator.distinct is not None:
+                    stats['nunique'] = int(round(accumulator.distinct.estimate()))
+            else:
+                stats['nunique'], stats['nunique_is_exact'] = accumulator.nunique
+            if getattr(accumulator, 'distinct', None) is not None:
+                stats['nunique_relative_error'] = accumulator.distinct.relative_error
+            columns[col] = stats
+        return ProfileReport(self.n_rows, columns)
+
+    def univariate_analysis(self, cat_col_list=[], num_col_list=[], top_n=None):
+        """
+        Draws the univariate_analysis plots (count, pie, histogram, KDE, box) from the accumulated summaries;
+        the KDE smooths the streaming histogram with a Gaussian kernel (Scott's bandwidth).
+        """
+        for col in cat_col_list:
+            counts = self.accumulators[col].top()
+            shown = counts if top_n is None else counts.iloc[:top_n]
+            if top_n:
+                print('Total unique values: ', self.accumulators[col].nunique[0])
+            plt.figure(figsize=(10, 6))
+            ax = plt.gca()
+            ax.bar(shown.index.astype(str), shown.values, color='cornflowerblue')
+            ax.bar_label(ax.containers[0])
+            plt.title(f'Count Plot of {col}')
+            plt.xlabel(col)
+            plt.ylabel('Count')
+            plt.xticks(rotation=90)
+            plt.show()
+
+            pie = shown.copy()
+            if top_n and len(counts) > top_n:
+                pie['Other'] = counts.iloc[top_n:].sum()
+            plt.figure(figsize=(10, 6))
+            pie.plot(kind='pie', autopct='%1.1f%%', startangle=90, shadow=False, wedgeprops={'edgecolor': 'black', 'linewidth': 0.5})
+            plt.title(f'Pie Plot of {col}')
+            plt.ylabel('')
+            plt.show()
+
+        for col in num_col_list:
+            accumulator = self.accumulators[col]
+            histogram = accumulator.histogram
+            plt.figure(figsize=(10, 6))
+            plt.stairs(histogram.counts, histogram.edges, fill=True)
+            plt.xlim(accumulator.min, accumulator.max)
+            plt.title(f'Histogram of {col}')
+            plt.xlabel(col)
+            plt.ylabel('Frequency')
+            plt.show()
+
+            centers = histogram.edges[:-1] + histogram.width / 2
+            bandwidth = max(1.06 * accumulator.stats()['std'] * accumulator.count ** -0.2, histogram.width) \
+                if accumulator.count > 1 else histogram.width
+            grid = np.linspace(accumulator.min - 3 * bandwidth, accumulator.max + 3 * bandwidth, 512)
+            density = (histogram.counts * np.exp(-0.5 * ((grid[:, None] - centers) / bandwidth) ** 2)).sum(axis=1)
+            plt.figure(figsize=(10, 6))
+            plt.plot(grid, density / (max(accumulator.count, 1) * bandwidth * np.sqrt(2 * np.pi)))
+            plt.title(f'KDE Plot of {col}')
+            plt.xlabel(col)
+            plt.ylabel('Density')
+            plt.show()
+
+            q1, q2, q3 = accumulator.quantile([0.25, 0.5, 0.75])
+            iqr = q3 - q1
+            plt.figure(figsize=(8, 6))
+            plt.gca().bxp([{
+                'med': q2, 'q1': q1, 'q3': q3,
+                'whislo': max(accumulator.min, q1 - 1.5 * iqr),
+                'whishi': min(accumulator.max, q3 + 1.5 * iqr),
+                'fliers': [],
+            }], showfliers=False)
+            plt.title(f'Boxplot of {col}')
+            plt.ylabel(col)
+            plt.show()
+
+
+def profile_file(path, chunksize=1_000_000, columns=None, file_format=None, n_bins=256, max_categories=100_000, approximate=False, **read_kwargs):
+    """
+    Profiles a CSV or Parquet file chunk by chunk.
+    Parameters:
+    - path (str): Path of the file.
+    - chunksize (int): Rows per chunk.
+    - columns (list): Columns to profile (optional).
+    - file_format (str): 'csv' or 'parquet' (optional, inferred from the extension).
+    - n_bins (int): Histogram bins per numeric column.
+    - max_categories (int): Distinct values kept per categorical column.
+    - approximate (bool): Use constant-memory sketches (see StreamingProfiler).
+    Returns:
+    - StreamingProfiler; call .report().render() for the basic_eda view.
+    """
+    profiler = StreamingProfiler(n_bins=n_bins, max_categories=max_categories, approximate=approximate)
+    for chunk in iter_chunks(path, chunksize=chunksize, columns=columns, file_format=file_format, **read_kwargs):
+        profiler.update(chunk)
+    return profiler
+
+
+# Usage
+# profiler = profile_file('daily_extract.csv', chunksize=500_000)
+# profiler.report().render()
+# profiler.univariate_analysis(cat_col_list=['Gender'], num_col_list=['Purchase'], top_n=10)
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+
+class UnivariateSummary:
+    def __init__(self, series, fine_bins=4096, max_fliers=1000, seed=0):
+        """
+        Summarizes one numeric column once for the histogram, KDE and box plots.
+        Keeps a fine-grained histogram (re-binned for the histogram bars and convolved for the KDE), the
+        moments, and the box plot statistics obtained with a selection (partition) pass.
+        Parameters:
+        - series (Series): Numeric column; missing and infinite values are ignored.
+        - fine_bins (int): Number of bins of the fine histogram.
+        - max_fliers (int): Maximum number of outliers kept for drawing (a random sample beyond it).
+        - seed (int): Seed for the outlier sample.
+        """
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[np.isfinite(values)]
+        self.name = series.name
+        self.n = values.size
+        self.fine_bins = fine_bins
+        if self.n == 0:
+            raise ValueError(f'Column {series.name} has no finite values')
+        self.min, self.max = values.min(), values.max()
+        self.mean = values.mean()
+        self.std = values.std(ddof=1) if self.n > 1 else 0.0
+        lo, hi = (self.min, self.max) if self.max > self.min else (self.min - 0.5, self.max + 0.5)
+        self.fine_edges = np.linspace(lo, hi, fine_bins + 1)
+        index = ((values - lo) * (fine_bins / (hi - lo))).astype(np.int64)
+        np.clip(index, 0, fine_bins - 1, out=index)
+        self.fine_counts = np.bincount(index, minlength=fine_bins)
+        self.q1, self.median, self.q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        iqr = self.q3 - self.q1
+        low_fence, high_fence = self.q1 - 1.5 * iqr, self.q3 + 1.5 * iqr
+        inside = (values >= low_fence) & (values <= high_fence)
+        self.whisker_low = values[inside].min()
+        self.whisker_high = values[inside].max()
+        fliers = values[~inside]
+        if fliers.size > max_fliers:
+            fliers = np.random.default_rng(seed).choice(fliers, max_fliers, replace=False)
+        self.fliers = fliers
+
+    @property
+    def fine_width(self):
+        return self.fine_edges[1] - self.fine_edges[0]
+
+    def auto_bins(self):
+        """Number of bins chosen like numpy's 'auto' rule (min of Freedman-Diaconis and Sturges widths)."""
+        data_range = self.max - self.min
+        if data_range == 0:
+            return 1
+        sturges = data_range / (np.log2(self.n) + 1)
+        fd = 2 * (self.q3 - self.q1) * self.n ** (-1 / 3)
+        width = min(fd, sturges) if fd > 0 else sturges
+        return int(min(np.ceil(data_range / width), self.fine_bins))
+
+    def histogram(self, bins=None):
+        """Returns (counts, edges) re-binned from the fine histogram; bins defaults to auto_bins()."""
+        bins = min(bins or self.auto_bins(), self.fine_bins)
+        boundaries = np.unique(np.round(np.linspace(0, self.fine_bins, bins + 1)).astype(np.int64))
+        counts = np.add.reduceat(self.fine_counts, boundaries[:-1])
+        return counts, self.fine_edges[boundaries]
+
+    def kde(self, bandwidth=None, cut=3):
+        """
+        Gaussian KDE computed as an FFT convolution of the fine histogram with the sampled kernel.
+        Returns (grid, density). The bandwidth defaults to Scott's rule; the grid extends `cut` bandwidths
+        beyond the data range.
+        """
+        if bandwidth is None:
+            bandwidth = self.std * self.n ** (-1 / 5) if self.std > 0 else self.fine_width
+        width = self.fine_width
+        pad = int(np.ceil(cut * bandwidth / width))
+        counts = np.concatenate([np.zeros(pad), self.fine_counts, np.zeros(pad)])
+        offsets = np.arange(-pad, pad + 1) * width
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+        size = counts.size + kernel.size - 1
+        fft_size = 1 << int(np.ceil(np.log2(size)))
+        convolved = np.fft.irfft(np.fft.rfft(counts, fft_size) * np.fft.rfft(kernel, fft_size), fft_size)
+        density = np.clip(convolved[pad:pad + counts.size], 0, None) / self.n
+        centers = self.fine_edges[0] + (np.arange(counts.size) - pad + 0.5) * width
+        return centers, density
+
+    def box_stats(self, label=None):
+        """Returns the statistics dictionary expected by matplotlib's Axes.bxp."""
+        return {
+            'label': label if label is not None else self.name,
+            'med': self.median, 'q1': self.q1, 'q3': self.q3,
+            'whislo': self.whisker_low, 'whishi': self.whisker_high,
+            'fliers': self.fliers, 'mean': self.mean,
+        }
+
+
+def is_numeric_column(series):
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
@@ -0,0 +1,4 @@
+import matplotlib
+
+# plots are drawn headless; plt.show() is a no-op on Agg
+matplotlib.use('Agg')
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_toolkit.backends import Backend, PandasBackend, as_backend
+
+
+def test_backend_missing_methods_fails_on_creation():
+    class Partial(Backend):
+        @property
+        def columns(self):
+            return []
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+@pytest.mark.parametrize('engine', ['polars', 'pyarrow'])
+def test_engines_match_pandas(engine):
+    pytest.importorskip('pyarrow')
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'x': rng.normal(size=500), 'c': rng.choice(list('abcd'), 500), 'd': rng.choice(list('uv'), 500)})
+    if engine == 'polars':
+        source = pytest.importorskip('polars').from_pandas(data).lazy()
+    else:
+        import pyarrow as pa
+        source = pa.Table.from_pandas(data, preserve_index=False)
+    reference, backend = PandasBackend(data), as_backend(source)
+    assert backend.num_rows() == 500
+    pd.testing.assert_frame_equal(backend.quantile(['x'], [0.25, 0.5]), reference.quantile(['x'], [0.25, 0.5]), check_names=False)
+    assert backend.mean(['x'])['x'] == pytest.approx(reference.mean(['x'])['x'])
+    assert backend.value_counts('c').to_dict() == reference.value_counts('c').to_dict()
+    positions = np.array([3, 10, 499])
+    pd.testing.assert_frame_equal(backend.take(positions, ['x', 'c']).reset_index(drop=True),
+                                  reference.take(positions, ['x', 'c']).reset_index(drop=True), check_dtype=False)
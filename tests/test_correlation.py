@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_toolkit.correlation import CorrelationEngine, correlation_matrix
+
+
+def _frame(n=500, columns=7):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(n, columns))
+    values[:, 1] += values[:, 0]
+    data = pd.DataFrame(values, columns=[f'v{i}' for i in range(columns)])
+    data.loc[::9, 'v2'] = np.nan
+    data.loc[::13, 'v3'] = np.nan
+    data['label'] = 'a'
+    return data
+
+
+# with missing values Spearman ranks each column over all its values, DataFrame.corr ranks per pair
+@pytest.mark.parametrize('method, missing', [('pearson', False), ('pearson', True), ('spearman', False),
+                                             ('kendall', False), ('kendall', True)])
+def test_matches_dataframe_corr(method, missing):
+    if method == 'kendall':
+        pytest.importorskip('scipy')
+    data = _frame() if missing else _frame().dropna()
+    expected = data.corr(method=method, numeric_only=True)
+    result = correlation_matrix(data, method=method)
+    pd.testing.assert_frame_equal(result.loc[expected.index, expected.columns], expected, check_exact=False, atol=1e-10)
+
+
+def test_blocks_match_single_pass():
+    data = _frame(columns=11)
+    expected = data.corr(numeric_only=True)
+    result = CorrelationEngine(data, block_size=3).matrix()
+    pd.testing.assert_frame_equal(result.loc[expected.index, expected.columns], expected, check_exact=False, atol=1e-10)
+
+
+def test_top_pairs_finds_strongest():
+    top = CorrelationEngine(_frame()).top_pairs(1)
+    assert set(np.ravel(top.iloc[0][:2])) == {'v0', 'v1'}
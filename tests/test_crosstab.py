@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from eda_toolkit.get_marginal_conditional_joint_probabilities import CrossTabAnalysis
+
+
+def _frame(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'g': rng.choice(list('mfx'), n), 'p': rng.choice(list('ABCDE'), n)})
+
+
+def test_matches_pd_crosstab():
+    data = _frame()
+    expected = pd.crosstab(data['g'], data['p'], margins=True)
+    result = CrossTabAnalysis(data, 'g', 'p').crosstab_df
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False, check_names=False)
+
+
+def test_update_and_merge_match_direct():
+    first, second = _frame(seed=1), _frame(seed=2)
+    second.loc[:5, 'p'] = 'Z'
+    direct = CrossTabAnalysis(pd.concat([first, second], ignore_index=True), 'g', 'p')
+    updated = CrossTabAnalysis(first, 'g', 'p')
+    updated.update(second)
+    merged = CrossTabAnalysis(first, 'g', 'p')
+    merged.merge(CrossTabAnalysis(second, 'g', 'p'))
+    pd.testing.assert_frame_equal(updated.crosstab_df, direct.crosstab_df)
+    pd.testing.assert_frame_equal(merged.crosstab_df, direct.crosstab_df)
+    pd.testing.assert_frame_equal(updated.get_full_dataframe(), direct.get_full_dataframe())
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from eda_toolkit.downsampling import bucket_envelope, lttb, sorted_visible_range
+
+
+def test_sorted_visible_range_matches_sort_and_filter():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 100, 1000), rng.normal(size=1000)
+    y[::10] = np.nan
+    result_x, result_y, _ = sorted_visible_range(x, y, {'left': 20, 'right': 30})
+    expected = pd.DataFrame({'x': x, 'y': y}).dropna().sort_values('x', kind='stable')
+    expected = expected[expected['x'].between(20, 30)]
+    np.testing.assert_array_equal(result_x, expected['x'])
+    np.testing.assert_array_equal(result_y, expected['y'])
+
+
+def test_bucket_envelope_matches_groupby():
+    rng = np.random.default_rng(0)
+    x, y = np.sort(rng.uniform(0, 10, 5000)), rng.normal(size=5000)
+    result = bucket_envelope(x, y, n_buckets=37)
+    edges = np.linspace(x[0], x[-1], 38)
+    buckets = np.clip(np.searchsorted(edges, x, side='right') - 1, 0, 36)
+    expected = pd.DataFrame({'x': x, 'y': y}).groupby(buckets).agg(
+        x=('x', 'mean'), mean=('y', 'mean'), min=('y', 'min'), max=('y', 'max'), count=('y', 'size'))
+    pd.testing.assert_frame_equal(result, expected.reset_index(drop=True), check_dtype=False)
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.sin(x / 500)
+    y[4321] = 50
+    out_x, out_y = lttb(x, y, 200)
+    assert out_x.size == 200 and out_x[0] == 0 and out_x[-1] == x[-1]
+    assert np.all(np.diff(out_x) > 0)
+    assert 4321 in out_x
+    np.testing.assert_array_equal(out_y, y[out_x.astype(np.int64)])
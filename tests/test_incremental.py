@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_toolkit.incremental import IncrementalProfiler, drift_summary
+from eda_toolkit.streaming import StreamingProfiler
+
+
+def _table(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'x': rng.normal(size=n), 'c': rng.choice(list('abc'), n)})
+
+
+@pytest.mark.parametrize('check_rows', [3, 1000])
+def test_refresh_after_update_matches_full_profile(check_rows):
+    data = _table(50)
+    profiler = IncrementalProfiler(check_rows=check_rows)
+    profiler.update(data.iloc[:5])
+    profiler.refresh(data.iloc[:20])
+    profiler.refresh(data)
+    stats = profiler.report().columns
+    assert profiler.n_seen == 50
+    assert stats['x']['count'] == 50 and stats['x']['mean'] == pytest.approx(data['x'].mean())
+    assert stats['c']['nunique'] == data['c'].nunique()
+
+
+def test_refresh_rejects_rewritten_rows_and_keeps_state():
+    data = _table(30)
+    profiler = IncrementalProfiler()
+    profiler.refresh(data)
+    digest = profiler.tail_digest
+    rewritten = data.copy()
+    rewritten.loc[3, 'x'] = 100.0
+    with pytest.raises(ValueError):
+        profiler.refresh(rewritten)
+    assert profiler.tail_digest == digest and profiler.n_seen == 30
+
+
+def test_drift_summary_matches_direct_psi_and_tvd():
+    rng = np.random.default_rng(0)
+    reference = pd.DataFrame({'c': rng.choice(list('abc'), 5000, p=[0.5, 0.3, 0.2]), 'x': rng.normal(size=5000)})
+    current = pd.DataFrame({'c': rng.choice(list('abcd'), 5000, p=[0.3, 0.3, 0.2, 0.2]), 'x': rng.normal(size=5000)})
+    summary = drift_summary(StreamingProfiler().update(reference), StreamingProfiler().update(current))
+    p, q = (frame['c'].value_counts(normalize=True).reindex(list('abcd'), fill_value=0).to_numpy() for frame in (reference, current))
+    clipped_p, clipped_q = np.clip(p, 1e-4, None), np.clip(q, 1e-4, None)
+    assert np.isclose(summary.loc['c', 'psi'], np.sum((clipped_q - clipped_p) * np.log(clipped_q / clipped_p)))
+    assert np.isclose(summary.loc['c', 'tvd'], 0.5 * np.abs(p - q).sum())
+    assert summary.loc['c', 'new_categories'] == 1 and summary.loc['c', 'drift'] == 'major'
+    assert summary.loc['x', 'psi'] < 0.1
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_toolkit.Outlier_treatment import OutlierHandler
+
+
+def _frame(n=1000):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'a': rng.standard_t(2, n), 'b': rng.normal(size=n)})
+    data.loc[::17, 'b'] = np.nan
+    return data
+
+
+def _baseline_inside(series, method):
+    if method == 'iqr':
+        q1, q3 = series.quantile(0.25), series.quantile(0.75)
+        return series.between(q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+    if method == 'percentile':
+        return series.between(series.quantile(0.05), series.quantile(0.95))
+    zscore = (series - series.mean()) / series.std(ddof=0)
+    return zscore.abs() < 3
+
+
+@pytest.mark.parametrize('method', ['iqr', 'percentile', 'zscore'])
+def test_remove_matches_baseline_masks(method):
+    data = _frame()
+    keep = _baseline_inside(data['a'], method) & _baseline_inside(data['b'], method)
+    result = OutlierHandler(data).fit_transform(['a', 'b'], method=method, action='remove')
+    pd.testing.assert_frame_equal(result, data[keep])
+
+
+@pytest.mark.parametrize('method', ['iqr', 'percentile'])
+def test_clip_and_flag_match_baseline(method):
+    data = _frame()
+    handler = OutlierHandler(data)
+    bounds = handler.fit(['a', 'b'], method=method)
+    clipped = handler.transform(data, action='clip')
+    flagged = handler.transform(data, action='flag')
+    for col in ['a', 'b']:
+        expected = data[col].clip(bounds.lower[col], bounds.upper[col])
+        pd.testing.assert_series_equal(clipped[col], expected)
+        # like flag_outliers, missing values are flagged
+        expected_flag = ~_baseline_inside(data[col], method)
+        assert (flagged[f'{col}_outlier_flag'] == expected_flag).all()
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from eda_toolkit.plot_cache import PlotCache
+
+
+def test_least_recently_used_entries_are_evicted_over_the_cap(tmp_path):
+    cache = PlotCache(str(tmp_path), max_bytes=10_000)
+    keys = [PlotCache.make_key((i,), 'image') for i in range(30)]
+    for key in keys:
+        cache.put_image(key, b'x' * 1_000)
+    assert cache.size <= 10_000
+    assert cache.get_image(keys[-1]) is not None and cache.get_image(keys[0]) is None
+
+
+def test_aggregates_are_computed_once(tmp_path):
+    cache = PlotCache(str(tmp_path))
+    data = pd.DataFrame({'c': ['a', 'a', 'b']})
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return data['c'].value_counts()
+
+    first = cache.get_or_compute(data, ['c'], 'counts', compute)
+    second = PlotCache(str(tmp_path)).get_or_compute(data, ['c'], 'counts', compute)
+    pd.testing.assert_series_equal(first, second)
+    assert len(calls) == 1
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from eda_toolkit.profiling import profile_dataframe
+
+
+def _frame(n=2000):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'x': rng.normal(size=n),
+        'i': rng.integers(0, 50, n),
+        'c': rng.choice(list('abcde'), n),
+    })
+    data.loc[::7, 'x'] = np.nan
+    data.loc[::11, 'c'] = None
+    return pd.concat([data, data.iloc[:100]], ignore_index=True)
+
+
+def test_profile_matches_pandas():
+    data = _frame()
+    profile = profile_dataframe(data)
+    expected = data.describe()
+    pd.testing.assert_frame_equal(profile.describe().loc[expected.index, expected.columns], expected, check_dtype=False)
+    pd.testing.assert_series_equal(profile.nunique(), data.nunique(), check_names=False, check_dtype=False)
+    assert profile.duplicate_rows == data.duplicated().sum()
+    for col in data.columns:
+        assert profile.columns[col]['null_count'] == data[col].isna().sum()
+
+
+def test_approximate_profile_is_close():
+    data = _frame(20000)
+    profile = profile_dataframe(data, approximate=True)
+    for col, expected in data.nunique().items():
+        assert abs(profile.columns[col]['nunique'] - expected) <= max(1, 0.05 * expected)
+    assert abs(profile.columns['x']['50%'] - data['x'].median()) < 0.05
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from eda_toolkit.report import attach_frame, share_frame
+
+
+def test_shared_frame_keeps_nullable_numeric_dtypes():
+    data = pd.DataFrame({'a': pd.array([1, None, 3], dtype='Int64'), 'b': pd.array([0.5, 1.5, None], dtype='Float64'),
+                         'f': pd.array([True, None, False], dtype='boolean'), 'x': [1.0, np.nan, 2.0], 'c': ['u', 'v', 'u']})
+    blocks, layout = share_frame(data, list(data.columns))
+    try:
+        attached_blocks, shared = attach_frame(layout)
+        for col in ('a', 'b', 'f', 'x'):
+            pd.testing.assert_series_equal(shared[col], data[col])
+        assert list(shared['c'].astype(str)) == ['u', 'v', 'u']
+        for block in attached_blocks:
+            block.close()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_toolkit.sampling import draw_sample, progressive_profiles
+
+
+def _table(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'a': rng.choice(list('abcdefghij'), n), 'b': rng.integers(0, 200, n).astype(str),
+                         'x': rng.normal(size=n)})
+
+
+def test_stratified_sample_stays_within_budget():
+    data = _table()
+    sample = draw_sample(data, 1_000, strata=['a', 'b'])
+    assert sample.n_rows <= 1_000
+    share, error = sample.proportion(sample.frame['a'].eq('a').to_numpy())
+    assert abs(share - data['a'].eq('a').mean()) < 3 * error + 0.02
+
+
+def test_mean_interval_covers_the_population_mean():
+    data = _table()
+    mean, error = draw_sample(data, 2_000, strata=['a']).mean('x')
+    assert abs(mean - data['x'].mean()) <= 2 * error
+
+
+@pytest.mark.parametrize('source', ['pandas', 'polars'])
+def test_progressive_profiles_end_with_the_exact_profile(source):
+    data = _table(5_000)
+    if source == 'polars':
+        pl = pytest.importorskip('polars')
+        pytest.importorskip('pyarrow')
+        data = pl.from_pandas(data).lazy()
+    steps = list(progressive_profiles(data, start_rows=1_000, growth=4, strata=['a']))
+    sample, report = steps[-1]
+    assert sample.exact and len(report.head) == 5
+    assert [step[0].n_rows for step in steps] == [1_000, 4_000, 5_000]
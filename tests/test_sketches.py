@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from eda_toolkit.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+def test_hyperloglog_within_error():
+    values = pd.Series(np.random.default_rng(0).integers(0, 200_000, 500_000))
+    sketch = HyperLogLog().update(values)
+    expected = values.nunique()
+    assert abs(sketch.estimate() - expected) <= 4 * sketch.relative_error * expected
+
+
+def test_hyperloglog_merge_matches_single_sketch():
+    values = pd.Series(np.arange(100_000)).astype(str)
+    merged = HyperLogLog().update(values[:60_000]).merge(HyperLogLog().update(values[40_000:]))
+    assert merged.estimate() == HyperLogLog().update(values).estimate()
+
+
+def test_kll_quantiles_within_rank_error():
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    sketch = KLLSketch(seed=0)
+    for chunk in np.array_split(values, 7):
+        sketch.update(chunk)
+    q = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(q)) / values.size
+    assert np.all(np.abs(ranks - q) <= sketch.rank_error + 1e-3)
+    assert sketch.quantile([0, 1]).tolist() == [values.min(), values.max()]
+
+
+def test_space_saving_bounds_contain_true_counts():
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.zipf(1.5, 100_000))
+    sketch = SpaceSaving(capacity=50)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    top = sketch.top(10)
+    expected = values.value_counts()
+    assert list(top.index[:5]) == list(expected.index[:5])
+    true = expected.reindex(top.index).to_numpy()
+    assert np.all(true <= top['count']) and np.all(true >= top['count'] - top['error'])
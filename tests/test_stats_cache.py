@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from eda_toolkit.stats_cache import StatsCache, column_fingerprint
+
+
+def test_hits_until_the_column_is_edited_in_place():
+    data = pd.DataFrame({'c': list('ab') * 500, 'x': np.arange(1000.0)})
+    cache = StatsCache()
+    for column in ('c', 'x'):
+        first = cache.get_or_compute(data, column, 'counts', lambda: data[column].value_counts())
+        assert cache.get_or_compute(data, column, 'counts', lambda: None) is first
+    data.loc[10:20, 'c'] = 'z'
+    data.loc[3, 'x'] = -1.0
+    assert cache.get_or_compute(data, 'c', 'counts', lambda: data['c'].value_counts())['z'] == 11
+    assert cache.get_or_compute(data, 'x', 'counts', lambda: data['x'].value_counts()).get(-1.0) == 1
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_fingerprint_covers_every_value():
+    series = pd.Series(np.arange(100_000.0))
+    edited = series.copy()
+    edited.iloc[54_321] = -1.0
+    assert column_fingerprint(series) != column_fingerprint(edited)
+    assert column_fingerprint(series) == column_fingerprint(series.copy())
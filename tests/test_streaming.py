@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_toolkit.streaming import StreamingProfiler
+
+
+def test_numeric_stats_match_pandas_across_chunks():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'x': rng.normal(size=10_000), 'c': rng.choice(list('abc'), 10_000)})
+    data.loc[::97, 'x'] = np.nan
+    profiler = StreamingProfiler()
+    for start in range(0, len(data), 3_000):
+        profiler.update(data.iloc[start:start + 3_000])
+    stats = profiler.report().columns
+    assert stats['x']['count'] == data['x'].count()
+    assert stats['x']['null_count'] == data['x'].isna().sum()
+    assert stats['x']['mean'] == pytest.approx(data['x'].mean())
+    assert stats['x']['std'] == pytest.approx(data['x'].std())
+    assert stats['x']['min'] == data['x'].min() and stats['x']['max'] == data['x'].max()
+    assert stats['c']['nunique'] == data['c'].nunique()
+
+
+def test_infinite_values_are_counted_apart():
+    profiler = StreamingProfiler()
+    profiler.update(pd.DataFrame({'x': [1.0, 2.0, 3.0]}))
+    profiler.update(pd.DataFrame({'x': [1.0, np.inf, -np.inf, np.nan, 5.0]}))
+    stats = profiler.report().columns['x']
+    assert (stats['count'], stats['inf_count'], stats['null_count']) == (5, 2, 1)
+    assert stats['max'] == 5.0
+
+
+def test_numeric_column_switches_to_categorical_on_strings():
+    profiler = StreamingProfiler()
+    profiler.update(pd.DataFrame({'x': [np.nan, np.nan]}))
+    profiler.update(pd.DataFrame({'x': ['a', 'b', 'a']}))
+    stats = profiler.report().columns['x']
+    assert (stats['count'], stats['null_count'], stats['nunique']) == (3, 2, 2)
+
+
+def test_drift_row_totals_include_infinite_values():
+    from eda_toolkit.incremental import drift_summary
+    reference = StreamingProfiler().update(pd.DataFrame({'x': np.arange(100.0)}))
+    current = StreamingProfiler().update(pd.DataFrame({'x': [1.0, np.inf, np.nan, 2.0]}))
+    row = drift_summary(reference, current).loc['x']
+    assert row['rows_new'] == 4 and row['null_rate_new'] == 0.25